@@ -1,15 +1,21 @@
 import abc
+import asyncio
 import os
+import time
+from collections import OrderedDict
 from multiprocessing import RLock
+from multiprocessing.dummy import Pool as ThreadPool
 from threading import get_ident
 from typing import (
-    Dict, Tuple, Hashable, Optional, ContextManager, List
+    Any, Callable, Dict, Tuple, Hashable, Optional, ContextManager, List
 )
 
 import agate
 
+import dbt.clients.columnar
 import dbt.exceptions
 import dbt.flags
+from dbt.clients.columnar import ColumnarTable
 from dbt.contracts.connection import (
     Connection, Identifier, ConnectionState, AdapterRequiredConfig, LazyHandle
 )
@@ -19,6 +25,46 @@ from dbt.adapters.base.query_headers import (
 from dbt.logger import GLOBAL_LOGGER as logger
 
 
+# how long a thread waits for a connection to be released when the pool is
+# full, before it opens one past the pool's size.
+POOL_WAIT_TIMEOUT = 60.0
+# idle connections older than this (in seconds) are checked before reuse
+POOL_HEALTH_CHECK_AGE = 30.0
+
+# how long to wait between checks on an async job. The wait grows by half
+# each time, up to the max.
+ASYNC_POLL_INTERVAL = 0.05
+ASYNC_POLL_INTERVAL_MAX = 1.0
+
+# the thread a released connection belongs to (if any), the connection, and
+# when it was released
+IdleConnection = Tuple[Optional[Hashable], Connection, float]
+
+
+def _current_task() -> Optional['asyncio.Task']:
+    """Return the asyncio task running on this thread, if there is one."""
+    # asyncio.current_task is new in python 3.7, and async queries require it
+    current_task = getattr(asyncio, 'current_task', None)
+    if current_task is None:
+        return None
+    try:
+        return current_task()
+    except RuntimeError:
+        # no event loop is running on this thread
+        return None
+
+
+class ConnectionPoolStats:
+    """Counters for how the connection pool handed out connections."""
+    def __init__(self) -> None:
+        self.opened = 0
+        self.open_time = 0.0
+        self.reused = 0
+        self.waits = 0
+        self.wait_time = 0.0
+        self.discarded = 0
+
+
 class BaseConnectionManager(metaclass=abc.ABCMeta):
     """Methods to implement:
         - exception_handler
@@ -31,6 +77,16 @@ class BaseConnectionManager(metaclass=abc.ABCMeta):
 
     You must also set the 'TYPE' class attribute with a class-unique constant
     string.
+
+    Connections are pooled: each thread gets a connection when it acquires
+    one, and releasing it makes it idle. A thread keeps its own connection
+    until another thread with no connection of its own takes the idle one.
+    There are at most `threads` connections unless a thread has to wait more
+    than POOL_WAIT_TIMEOUT seconds for one.
+
+    Adapters can tag connections with an affinity (see set_affinity), for
+    session state like the current warehouse. A thread that asks for an
+    affinity gets an idle connection with it if there is one.
     """
     TYPE: str = NotImplemented
 
@@ -39,6 +95,19 @@ class BaseConnectionManager(metaclass=abc.ABCMeta):
         self.thread_connections: Dict[Hashable, Connection] = {}
         self.lock: RLock = dbt.flags.MP_CONTEXT.RLock()
         self.query_header = QueryStringSetter(self.profile)
+        # one for each thread, and one for the main thread
+        self.pool_size: int = max(profile.threads, 1) + 1
+        self.pool_stats = ConnectionPoolStats()
+        # released connections by id(), most recently released last
+        self._idle: 'OrderedDict[int, IdleConnection]' = OrderedDict()
+        self._pool_available = dbt.flags.MP_CONTEXT.Condition(self.lock)
+        # the affinity of each connection that has one, by id()
+        self._affinities: Dict[int, Hashable] = {}
+        # called with each query's run time and, if the adapter can tell, how
+        # long it was queued in the warehouse
+        self.query_listener: Optional[
+            Callable[[float, Optional[float]], None]
+        ] = None
 
     def set_query_header(self, manifest=None) -> None:
         if manifest is not None:
@@ -50,7 +119,13 @@ class BaseConnectionManager(metaclass=abc.ABCMeta):
     def get_thread_identifier() -> Hashable:
         # note that get_ident() may be re-used, but we should never experience
         # that within a single process
-        return (os.getpid(), get_ident())
+        key: Tuple[Any, ...] = (os.getpid(), get_ident())
+        # tasks on an event loop share a thread, but each needs its own
+        # connection
+        task = _current_task()
+        if task is not None:
+            key += (id(task),)
+        return key
 
     def get_thread_connection(self) -> Connection:
         key = self.get_thread_identifier()
@@ -59,7 +134,10 @@ class BaseConnectionManager(metaclass=abc.ABCMeta):
                 raise dbt.exceptions.InvalidConnectionException(
                     key, list(self.thread_connections)
                 )
-            return self.thread_connections[key]
+            conn = self.thread_connections[key]
+            # using a released connection takes it back out of the pool
+            self._idle.pop(id(conn), None)
+            return conn
 
     def set_thread_connection(self, conn):
         key = self.get_thread_identifier()
@@ -78,8 +156,204 @@ class BaseConnectionManager(metaclass=abc.ABCMeta):
         key = self.get_thread_identifier()
         with self.lock:
             if key in self.thread_connections:
+                conn = self.thread_connections.pop(key)
+                self._idle.pop(id(conn), None)
+                self._pool_available.notify()
+
+    def _new_connection(self) -> Connection:
+        return Connection(
+            type=Identifier(self.TYPE),
+            name=None,
+            state=ConnectionState.INIT,
+            transaction_open=False,
+            handle=None,
+            credentials=self.profile.credentials
+        )
+
+    def _lazy_handle(self) -> LazyHandle:
+        return LazyHandle(type(self), on_open=self._record_open)
+
+    def _record_open(self, elapsed: float) -> None:
+        with self.lock:
+            self.pool_stats.opened += 1
+            self.pool_stats.open_time += elapsed
+
+    def _connection_count(self) -> int:
+        """The number of connections the pool has, in use or idle.
+
+        Callers must hold the lock.
+        """
+        unbound = sum(1 for key, _, _ in self._idle.values() if key is None)
+        return len(self.thread_connections) + unbound
+
+    def set_affinity(
+        self, connection: Connection, affinity: Optional[Hashable]
+    ) -> None:
+        """Tag the connection as best suited to nodes that ask for the given
+        affinity, or clear its tag if it's None.
+        """
+        with self.lock:
+            if affinity is None:
+                self._affinities.pop(id(connection), None)
+            else:
+                self._affinities[id(connection)] = affinity
+
+    def _find_idle(self, affinity: Optional[Hashable]) -> Optional[int]:
+        """Find the most recently released idle connection with the given
+        affinity, and return its id().
+
+        Callers must hold the lock.
+        """
+        if affinity is None:
+            return None
+        for conn_id in reversed(self._idle):
+            if self._affinities.get(conn_id) == affinity:
+                return conn_id
+        return None
+
+    def _take_idle(
+        self, affinity: Optional[Hashable] = None
+    ) -> Optional[Tuple[Connection, float]]:
+        """Take the most recently released connection out of the pool,
+        preferring one with the given affinity, and return it with the time
+        it was released. If there are none and the pool is full, wait for
+        one. Return None if a new connection should be made instead.
+
+        Callers must hold the lock.
+        """
+        started = time.time()
+        waited = False
+        while not self._idle:
+            if self._connection_count() < self.pool_size:
+                return None
+            remaining = started + POOL_WAIT_TIMEOUT - time.time()
+            if remaining <= 0:
+                logger.debug(
+                    'Timed out waiting for a {} connection, opening another'
+                    .format(self.TYPE)
+                )
+                return None
+            waited = True
+            self._pool_available.wait(remaining)
+
+        if waited:
+            self.pool_stats.waits += 1
+            self.pool_stats.wait_time += time.time() - started
+        conn_id = self._find_idle(affinity)
+        if conn_id is None:
+            _, (owner, conn, released_at) = self._idle.popitem(last=True)
+        else:
+            owner, conn, released_at = self._idle.pop(conn_id)
+        if owner is not None:
+            del self.thread_connections[owner]
+        return conn, released_at
+
+    def _checkout(self, affinity: Optional[Hashable] = None) -> Connection:
+        """Get this thread's connection. If it doesn't have one, take an idle
+        one from the pool or make a new one. If this thread's connection is
+        idle but lacks the affinity and another idle one has it, leave this
+        thread's in the pool and take that one instead.
+        """
+        key = self.get_thread_identifier()
+        with self.lock:
+            conn = self.thread_connections.get(key)
+            if conn is not None:
+                idle = self._idle.get(id(conn))
+                if (idle is None or affinity is None or
+                        self._affinities.get(id(conn)) == affinity or
+                        self._find_idle(affinity) is None):
+                    self._idle.pop(id(conn), None)
+                    return conn
+                # unbind it, so any thread can take it
+                self._idle[id(conn)] = (None,) + idle[1:]
                 del self.thread_connections[key]
 
+            taken = self._take_idle(affinity)
+            if taken is None:
+                conn = self._new_connection()
+                released_at = None
+            else:
+                conn, released_at = taken
+            self.set_thread_connection(conn)
+
+        if conn.state == ConnectionState.OPEN:
+            too_old = (
+                released_at is not None and
+                time.time() - released_at > POOL_HEALTH_CHECK_AGE
+            )
+            if too_old and not self.is_healthy(conn):
+                logger.debug(
+                    'Discarding a broken pooled connection (formerly {})'
+                    .format(conn.name)
+                )
+                self.close(conn)
+                with self.lock:
+                    self.pool_stats.discarded += 1
+            else:
+                with self.lock:
+                    self.pool_stats.reused += 1
+        return conn
+
+    def _checkin(self, conn: Connection) -> None:
+        key = self.get_thread_identifier()
+        with self.lock:
+            if self.thread_connections.get(key) is not conn:
+                return
+            self._idle[id(conn)] = (key, conn, time.time())
+            self._pool_available.notify()
+
+    def is_idle(self, connection: Connection) -> bool:
+        """Return whether the connection has been released to the pool."""
+        with self.lock:
+            return id(connection) in self._idle
+
+    @classmethod
+    def is_healthy(cls, connection: Connection) -> bool:
+        """Check that a connection that's been idle for a while still works.
+        (passable)
+        """
+        return True
+
+    def prewarm(self, count: int) -> None:
+        """Open up to `count` connections in parallel and add them to the pool,
+        so worker threads don't each have to wait to open their own. Failures
+        are only logged: the first node to need a connection will try again
+        and report the error.
+        """
+        with self.lock:
+            count = min(count, self.pool_size) - self._connection_count()
+        if count <= 0:
+            return
+
+        def open_connection(_) -> Optional[Connection]:
+            conn = self._new_connection()
+            conn.handle = self._lazy_handle()
+            try:
+                # reading the handle opens it
+                conn.handle
+            except Exception as exc:
+                logger.debug(
+                    'Failed to pre-open a {} connection: {}'
+                    .format(self.TYPE, exc)
+                )
+                return None
+            return conn
+
+        logger.debug('Opening {} {} connections'.format(count, self.TYPE))
+        pool = ThreadPool(count)
+        try:
+            opened = pool.map(open_connection, range(count))
+        finally:
+            pool.close()
+            pool.join()
+
+        with self.lock:
+            now = time.time()
+            for conn in opened:
+                if conn is not None:
+                    self._idle[id(conn)] = (None, conn, now)
+            self._pool_available.notify_all()
+
     def clear_transaction(self) -> None:
         """Clear any existing transactions."""
         conn = self.get_thread_connection()
@@ -102,7 +376,11 @@ class BaseConnectionManager(metaclass=abc.ABCMeta):
         raise dbt.exceptions.NotImplementedException(
             '`exception_handler` is not implemented for this adapter!')
 
-    def set_connection_name(self, name: Optional[str] = None) -> Connection:
+    def set_connection_name(
+        self,
+        name: Optional[str] = None,
+        affinity: Optional[Hashable] = None,
+    ) -> Connection:
         conn_name: str
         if name is None:
             # if a name isn't specified, we'll re-use a single handle
@@ -116,17 +394,7 @@ class BaseConnectionManager(metaclass=abc.ABCMeta):
             assert isinstance(name, str)
             conn_name = name
 
-        conn = self.get_if_exists()
-        if conn is None:
-            conn = Connection(
-                type=Identifier(self.TYPE),
-                name=None,
-                state=ConnectionState.INIT,
-                transaction_open=False,
-                handle=None,
-                credentials=self.profile.credentials
-            )
-            self.set_thread_connection(conn)
+        conn = self._checkout(affinity)
 
         if conn.name == conn_name and conn.state == 'open':
             return conn
@@ -144,7 +412,7 @@ class BaseConnectionManager(metaclass=abc.ABCMeta):
                 'Opening a new connection, currently in state {}'
                 .format(conn.state)
             )
-            conn.handle = LazyHandle(type(self))
+            conn.handle = self._lazy_handle()
 
         conn.name = conn_name
         return conn
@@ -175,6 +443,8 @@ class BaseConnectionManager(metaclass=abc.ABCMeta):
             conn = self.get_if_exists()
             if conn is None:
                 return
+            # don't let another thread take it until it's cleaned up
+            self._idle.pop(id(conn), None)
 
         try:
             if conn.state == 'open':
@@ -186,10 +456,14 @@ class BaseConnectionManager(metaclass=abc.ABCMeta):
             # if rollback or close failed, remove our busted connection
             self.clear_thread_connection()
             raise
+        self._checkin(conn)
 
     def cleanup_all(self) -> None:
         with self.lock:
-            for connection in self.thread_connections.values():
+            unbound = [
+                conn for key, conn, _ in self._idle.values() if key is None
+            ]
+            for connection in list(self.thread_connections.values()) + unbound:
                 if connection.state not in {'closed', 'init'}:
                     logger.debug("Connection '{}' was left open."
                                  .format(connection.name))
@@ -200,6 +474,9 @@ class BaseConnectionManager(metaclass=abc.ABCMeta):
 
             # garbage collect these connections
             self.thread_connections.clear()
+            self._idle.clear()
+            self._affinities.clear()
+            self._pool_available.notify_all()
 
     @abc.abstractmethod
     def begin(self) -> None:
@@ -286,6 +563,78 @@ class BaseConnectionManager(metaclass=abc.ABCMeta):
     def _add_query_comment(self, sql: str) -> str:
         return self.query_header.add(sql)
 
+    def record_query(
+        self, elapsed: float, queued: Optional[float] = None
+    ) -> None:
+        """Report how long a query took, and how long it was queued if known.
+        """
+        listener = self.query_listener
+        if listener is not None:
+            listener(elapsed, queued)
+
+    @classmethod
+    def supports_async_jobs(cls) -> bool:
+        """Whether this adapter implements submit_job, job_done and
+        job_result, so queries can be awaited on an event loop instead of
+        blocking a thread. (passable)
+
+        Those methods are called on the event loop's executor, not the
+        thread that owns the connection, so they're given the connection
+        instead of looking it up with get_thread_connection().
+        """
+        return False
+
+    def submit_job(self, connection: Connection, sql: str) -> Any:
+        """Start running the SQL on the connection, without waiting for it to
+        finish, and return a handle that identifies the job.
+        """
+        raise dbt.exceptions.NotImplementedException(
+            '`submit_job` is not implemented for this adapter!'
+        )
+
+    def job_done(self, job: Any) -> bool:
+        """Return whether the job has finished."""
+        raise dbt.exceptions.NotImplementedException(
+            '`job_done` is not implemented for this adapter!'
+        )
+
+    def job_result(
+        self, connection: Connection, job: Any, fetch: bool = False
+    ) -> Tuple[str, agate.Table]:
+        """Get the status and results (empty if fetch=False) of a finished
+        job, raising if it failed.
+        """
+        raise dbt.exceptions.NotImplementedException(
+            '`job_result` is not implemented for this adapter!'
+        )
+
+    async def execute_async(
+        self, sql: str, fetch: bool = False
+    ) -> Tuple[str, agate.Table]:
+        """Execute the given SQL as an async job, and wait for it on the
+        running event loop. Jobs don't run inside a transaction.
+        """
+        # The query comment and the connection belong to this task, and
+        # other tasks on this thread set their own while we wait: look them
+        # up before the first await.
+        sql = self._add_query_comment(sql)
+        connection = self.get_thread_connection()
+        loop = asyncio.get_event_loop()
+
+        # submitting, polling and fetching are network calls that block, so
+        # they run on the loop's default executor and the loop keeps serving
+        # others. The task holds a thread only while one of them is running.
+        job = await loop.run_in_executor(
+            None, self.submit_job, connection, sql
+        )
+        interval = ASYNC_POLL_INTERVAL
+        while not await loop.run_in_executor(None, self.job_done, job):
+            await asyncio.sleep(interval)
+            interval = min(interval * 1.5, ASYNC_POLL_INTERVAL_MAX)
+        return await loop.run_in_executor(
+            None, self.job_result, connection, job, fetch
+        )
+
     @abc.abstractmethod
     def execute(
         self, sql: str, auto_begin: bool = False, fetch: bool = False
@@ -302,3 +651,14 @@ class BaseConnectionManager(metaclass=abc.ABCMeta):
         raise dbt.exceptions.NotImplementedException(
             '`execute` is not implemented for this adapter!'
         )
+
+    def execute_columnar(
+        self, sql: str, auto_begin: bool = False
+    ) -> Tuple[str, ColumnarTable]:
+        """Execute the given SQL and fetch its results into Arrow memory.
+        Requires pyarrow. By default this converts the agate table execute()
+        fetches, adapters should override it with a native Arrow fetch.
+        """
+        dbt.clients.columnar.import_pyarrow()
+        status, table = self.execute(sql, auto_begin=auto_begin, fetch=True)
+        return status, dbt.clients.columnar.table_from_agate(table)
@@ -3,7 +3,7 @@ from contextlib import contextmanager
 from datetime import datetime
 from typing import (
     Optional, Tuple, Callable, Container, FrozenSet, Type, Dict, Any, List,
-    Mapping, Iterator, Union
+    Mapping, Iterator, Union, Hashable, TypeVar
 )
 
 import agate
@@ -18,6 +18,7 @@ import dbt.flags
 
 from dbt import deprecations
 from dbt.clients.agate_helper import empty_table
+from dbt.clients.columnar import ColumnarTable
 from dbt.contracts.graph.compiled import CompileResultNode, CompiledSeedNode
 from dbt.contracts.graph.manifest import Manifest
 from dbt.contracts.graph.parsed import ParsedSeedNode
@@ -31,10 +32,11 @@ from dbt.adapters.base.relation import (
     ComponentName, BaseRelation, InformationSchema
 )
 from dbt.adapters.base import Column as BaseColumn
-from dbt.adapters.cache import RelationsCache
+from dbt.adapters.cache import IntrospectionCache, RelationsCache
 
 
 SeedModel = Union[ParsedSeedNode, CompiledSeedNode]
+T = TypeVar('T')
 
 
 GET_CATALOG_MACRO_NAME = 'get_catalog'
@@ -210,20 +212,26 @@ class BaseAdapter(metaclass=AdapterMeta):
     def __init__(self, config):
         self.config = config
         self.cache = RelationsCache()
+        self.introspection_cache = IntrospectionCache()
         self.connections = self.ConnectionManager(config)
         self._internal_manifest_lazy: Optional[Manifest] = None
 
     ###
     # Methods that pass through to the connection manager
     ###
-    def acquire_connection(self, name=None) -> Connection:
-        return self.connections.set_connection_name(name)
+    def acquire_connection(self, name=None, affinity=None) -> Connection:
+        return self.connections.set_connection_name(name, affinity)
 
     def release_connection(self) -> None:
         self.connections.release()
 
     def cleanup_connections(self) -> None:
         self.connections.cleanup_all()
+        # the database can change between invocations
+        self.introspection_cache.clear()
+
+    def prewarm_connections(self, count: int) -> None:
+        self.connections.prewarm(count)
 
     def clear_transaction(self) -> None:
         self.connections.clear_transaction()
@@ -243,7 +251,10 @@ class BaseAdapter(metaclass=AdapterMeta):
     ) -> Iterator[None]:
         try:
             self.connections.query_header.set(name, node)
-            self.acquire_connection(name)
+            affinity = None
+            if node is not None:
+                affinity = self.connection_affinity(node)
+            self.acquire_connection(name, affinity)
             yield
         finally:
             self.release_connection()
@@ -258,8 +269,12 @@ class BaseAdapter(metaclass=AdapterMeta):
 
     @available.parse(lambda *a, **k: ('', empty_table()))
     def execute(
-        self, sql: str, auto_begin: bool = False, fetch: bool = False
-    ) -> Tuple[str, agate.Table]:
+        self,
+        sql: str,
+        auto_begin: bool = False,
+        fetch: bool = False,
+        columnar: bool = False,
+    ) -> Tuple[str, Union[agate.Table, ColumnarTable]]:
         """Execute the given SQL. This is a thin wrapper around
         ConnectionManager.execute.
 
@@ -267,14 +282,38 @@ class BaseAdapter(metaclass=AdapterMeta):
         :param bool auto_begin: If set, and dbt is not currently inside a
             transaction, automatically begin one.
         :param bool fetch: If set, fetch results.
+        :param bool columnar: If set along with fetch, fetch the results into
+            a ColumnarTable backed by Arrow memory instead of an agate Table.
+            Requires pyarrow.
         :return: A tuple of the status and the results (empty if fetch=False).
         :rtype: Tuple[str, agate.Table]
         """
-        return self.connections.execute(
-            sql=sql,
-            auto_begin=auto_begin,
-            fetch=fetch
-        )
+        try:
+            if fetch and columnar:
+                return self.connections.execute_columnar(
+                    sql=sql, auto_begin=auto_begin
+                )
+            return self.connections.execute(
+                sql=sql,
+                auto_begin=auto_begin,
+                fetch=fetch
+            )
+        finally:
+            self.introspection_cache.invalidate_for_sql(sql)
+
+    def supports_async_queries(self) -> bool:
+        return self.connections.supports_async_jobs()
+
+    async def execute_async(
+        self, sql: str, fetch: bool = False
+    ) -> Tuple[str, agate.Table]:
+        """Execute the given SQL as an async job on the running event loop.
+        Only available if supports_async_queries() is True.
+        """
+        try:
+            return await self.connections.execute_async(sql=sql, fetch=fetch)
+        finally:
+            self.introspection_cache.invalidate_for_sql(sql)
 
     ###
     # Methods that should never be overridden
@@ -399,6 +438,7 @@ class BaseAdapter(metaclass=AdapterMeta):
             )
         if dbt.flags.USE_CACHE:
             self.cache.add(relation)
+        self.introspection_cache.invalidate(relation)
         # so jinja doesn't render things
         return ''
 
@@ -414,6 +454,7 @@ class BaseAdapter(metaclass=AdapterMeta):
             )
         if dbt.flags.USE_CACHE:
             self.cache.drop(relation)
+        self.introspection_cache.invalidate(relation)
         return ''
 
     @available
@@ -436,8 +477,23 @@ class BaseAdapter(metaclass=AdapterMeta):
 
         if dbt.flags.USE_CACHE:
             self.cache.rename(from_relation, to_relation)
+        self.introspection_cache.invalidate(from_relation)
+        self.introspection_cache.invalidate(to_relation)
         return ''
 
+    def cached_introspection(
+        self, relation, key: Hashable, fetch: Callable[[], T]
+    ) -> T:
+        """Get the result of a metadata query about the relation from the
+        introspection cache, or call fetch() to run it. Methods that query
+        metadata, like get_columns_in_relation, should go through this. The
+        cache is invalidated by cache_dropped, cache_renamed, cache_added and
+        any DDL run with execute() that names the relation.
+        """
+        if not dbt.flags.USE_CACHE:
+            return fetch()
+        return self.introspection_cache.get(relation, key, fetch)
+
     ###
     # Abstract methods for database-specific values, attributes, and types
     ###
@@ -733,6 +789,21 @@ class BaseAdapter(metaclass=AdapterMeta):
     @available.parse_none
     def get_relation(
         self, database: str, schema: str, identifier: str
+    ) -> Optional[BaseRelation]:
+        if self._schema_is_cached(database, schema):
+            return self._find_relation(database, schema, identifier)
+        # without the relations cache, each lookup lists the schema
+        relation = self.Relation.create(
+            database=database, schema=schema, identifier=identifier
+        )
+        return self.cached_introspection(
+            relation,
+            ('relation', database, schema, identifier),
+            lambda: self._find_relation(database, schema, identifier),
+        )
+
+    def _find_relation(
+        self, database: str, schema: str, identifier: str
     ) -> Optional[BaseRelation]:
         relations_list = self.list_relations(database, schema)
 
@@ -1072,6 +1143,15 @@ class BaseAdapter(metaclass=AdapterMeta):
             'age': age,
         }
 
+    def connection_affinity(
+        self, node: CompileResultNode
+    ) -> Optional[Hashable]:
+        """Return the affinity of the connections best suited to running the
+        node, if some are better than others. The connection pool hands out
+        an idle connection with that affinity if it has one. (passable)
+        """
+        return None
+
     def pre_model_hook(self, config: Mapping[str, Any]) -> Any:
         """A hook for running some operation before the model materialization
         runs. The hook can assume it has a connection available.
@@ -1,6 +1,9 @@
 from collections import namedtuple
 from copy import deepcopy
-from typing import List, Iterable, Optional
+from typing import (
+    Any, Callable, Dict, Hashable, List, Iterable, Optional, TypeVar
+)
+import re
 import threading
 
 from dbt.logger import CACHE_LOGGER as logger
@@ -518,3 +521,100 @@ class RelationsCache:
             drop_key = _make_key(relation)
             if drop_key in self.relations:
                 self.drop(drop_key)
+
+
+# statements that can create, drop or change the columns of a relation
+_DDL = re.compile(
+    r'(^|;)\s*(create|alter|drop|rename|truncate|replace)\b',
+    re.IGNORECASE | re.MULTILINE,
+)
+_COMMENTS = re.compile(r'/\*.*?\*/|--[^\n]*', re.DOTALL)
+
+T = TypeVar('T')
+
+
+class IntrospectionCache:
+    """Memoized results of adapter methods that query the database's metadata
+    about a relation, like its columns. Entries are kept until the relation
+    is changed through the adapter, and the whole cache is reset for each run.
+
+    :attr int hits: The number of lookups answered from the cache.
+    :attr int misses: The number of lookups that had to query the database.
+    """
+    def __init__(self) -> None:
+        self.entries: Dict[_ReferenceKey, Dict[Hashable, Any]] = {}
+        self.lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        # bumped by every invalidation, so results fetched while a relation
+        # was being changed aren't stored
+        self._generation = 0
+
+    def get(self, relation, key: Hashable, fetch: Callable[[], T]) -> T:
+        """Get the cached result for the relation and key, or call fetch() to
+        get it and cache it.
+        """
+        ref_key = _make_key(relation)
+        with self.lock:
+            entries = self.entries.get(ref_key, {})
+            if key in entries:
+                self.hits += 1
+                return entries[key]
+            self.misses += 1
+            generation = self._generation
+
+        # don't hold the lock while querying the database
+        result = fetch()
+        with self.lock:
+            if generation == self._generation:
+                self.entries.setdefault(ref_key, {})[key] = result
+        return result
+
+    def _invalidate_keys(self, keys: Iterable[_ReferenceKey]) -> None:
+        """Callers must hold the lock."""
+        self._generation += 1
+        for ref_key in keys:
+            self.entries.pop(ref_key, None)
+
+    def invalidate(self, relation) -> None:
+        """Forget everything cached about the relation."""
+        with self.lock:
+            self._invalidate_keys([_make_key(relation)])
+
+    def invalidate_schema(self, database: str, schema: str) -> None:
+        """Forget everything cached about relations in the schema."""
+        schema_key = (_lower(database), _lower(schema))
+        with self.lock:
+            self._invalidate_keys([
+                ref_key for ref_key in self.entries
+                if (ref_key.database, ref_key.schema) == schema_key
+            ])
+
+    def invalidate_for_sql(self, sql: str) -> None:
+        """If the sql has any DDL statements, forget everything cached about
+        the relations it names. A relation counts as named if its identifier
+        appears anywhere in the sql, so this can invalidate more than needed
+        but never less.
+        """
+        sql = _COMMENTS.sub('', sql)
+        if not _DDL.search(sql):
+            return
+        sql = sql.lower()
+        with self.lock:
+            named = [
+                ref_key for ref_key in self.entries
+                if ref_key.identifier is None or ref_key.identifier in sql
+            ]
+            if named:
+                logger.debug(
+                    'Invalidating introspection results for {}'
+                    .format(', '.join(map(dot_separated, named)))
+                )
+            self._invalidate_keys(named)
+
+    def clear(self) -> None:
+        """Clear the cache and reset its counters."""
+        with self.lock:
+            self._invalidate_keys(list(self.entries))
+            self.hits = 0
+            self.misses = 0
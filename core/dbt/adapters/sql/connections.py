@@ -1,16 +1,35 @@
 import abc
+import sys
 import time
-from typing import List, Optional, Tuple, Any, Iterable, Dict
+from typing import (
+    List, Optional, Tuple, Any, Iterable, Iterator, Dict, Sequence
+)
 
 import agate
+from agate.data_types import DataType
 
 import dbt.clients.agate_helper
+import dbt.clients.columnar
+import dbt.deprecations
 import dbt.exceptions
+import dbt.flags
+from dbt.clients.columnar import ColumnarTable
 from dbt.contracts.connection import Connection
 from dbt.adapters.base import BaseConnectionManager
 from dbt.logger import GLOBAL_LOGGER as logger
 
 
+# how many rows to fetch from a cursor at a time
+FETCH_BATCH_SIZE = 10000
+
+
+def _rows_size(rows: Sequence[Sequence[Any]]) -> int:
+    # estimated from about 100 of the rows, sizing every value is too slow
+    sample = rows[::max(1, len(rows) // 100)]
+    size = sum(sys.getsizeof(value) for row in sample for value in row)
+    return size * len(rows) // len(sample)
+
+
 class SQLConnectionManager(BaseConnectionManager):
     """The default connection manager with some common SQL methods implemented.
 
@@ -20,6 +39,13 @@ class SQLConnectionManager(BaseConnectionManager):
         - get_status
         - open
     """
+    # set on subclasses that define their own process_results
+    _overrides_process_results: bool = False
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if 'process_results' in vars(cls):
+            cls._overrides_process_results = True
 
     @abc.abstractmethod
     def cancel(self, connection: Connection):
@@ -33,7 +59,8 @@ class SQLConnectionManager(BaseConnectionManager):
         this_connection = self.get_if_exists()
         with self.lock:
             for connection in self.thread_connections.values():
-                if connection is this_connection:
+                # idle connections in the pool have nothing to cancel
+                if connection is this_connection or self.is_idle(connection):
                     continue
 
                 # if the connection failed, the handle will be None so we have
@@ -44,6 +71,22 @@ class SQLConnectionManager(BaseConnectionManager):
                     names.append(connection.name)
         return names
 
+    @classmethod
+    def is_healthy(cls, connection: Connection) -> bool:
+        try:
+            cursor = connection.handle.cursor()
+            cursor.execute('select 1')
+            cursor.fetchall()
+            # don't leave the check's transaction open
+            connection.handle.rollback()
+        except Exception as exc:
+            logger.debug(
+                'Connection "{}" failed its health check: {}'
+                .format(connection.name, exc)
+            )
+            return False
+        return True
+
     def add_query(
         self,
         sql: str,
@@ -70,11 +113,13 @@ class SQLConnectionManager(BaseConnectionManager):
 
             cursor = connection.handle.cursor()
             cursor.execute(sql, bindings)
+            elapsed = time.time() - pre
+            self.record_query(elapsed)
 
             logger.debug(
                 "SQL status: {status} in {elapsed:0.2f} seconds",
                 status=self.get_status(cursor),
-                elapsed=(time.time() - pre),
+                elapsed=elapsed,
             )
 
             return connection, cursor
@@ -90,20 +135,82 @@ class SQLConnectionManager(BaseConnectionManager):
     def process_results(
         cls, column_names: Iterable[str], rows: Iterable[Any]
     ) -> List[Dict[str, Any]]:
-
+        """Convert rows to dicts. Only used if a subclass overrides it, which
+        is deprecated: override convert_rows and get_column_types instead.
+        """
         return [dict(zip(column_names, row)) for row in rows]
 
+    @staticmethod
+    def _type_codes(description: Sequence[Sequence[Any]]) -> List[Any]:
+        return [column[1] if len(column) > 1 else None for column in description]
+
+    @classmethod
+    def get_column_types(
+        cls, description: Sequence[Sequence[Any]]
+    ) -> List[Optional[DataType]]:
+        """Get the agate type of each column in a cursor's description, or
+        None if it should be inferred from the column's values. (passable)
+        """
+        return [None] * len(description)
+
+    @classmethod
+    def convert_rows(
+        cls, description: Sequence[Sequence[Any]], rows: Sequence[Sequence[Any]]
+    ) -> Sequence[Sequence[Any]]:
+        """Convert any values the driver returns that agate can't handle.
+        (passable)
+        """
+        return rows
+
+    @classmethod
+    def fetch_batches(
+        cls, cursor: Any, batch_size: int = FETCH_BATCH_SIZE
+    ) -> Iterator[Sequence[Sequence[Any]]]:
+        """Fetch the cursor's rows a batch at a time with fetchmany(). If
+        --max-fetch-rows is set, raise as soon as the results have more rows
+        than that. Once all the rows are fetched, log how many there were and
+        roughly how many bytes they take up in memory.
+        """
+        max_rows = dbt.flags.MAX_FETCH_ROWS
+        num_rows = 0
+        num_bytes = 0
+        while True:
+            size = batch_size
+            if max_rows is not None:
+                # one more than the limit is enough to know it's been hit
+                size = min(size, max_rows - num_rows + 1)
+            rows = cursor.fetchmany(size)
+            if not rows:
+                break
+            num_rows += len(rows)
+            if max_rows is not None and num_rows > max_rows:
+                dbt.exceptions.raise_too_many_rows(max_rows)
+            num_bytes += _rows_size(rows)
+            yield rows
+        logger.debug("Fetched {} rows ({} bytes)", num_rows, num_bytes)
+
     @classmethod
     def get_result_from_cursor(cls, cursor: Any) -> agate.Table:
-        data: List[Any] = []
-        column_names: List[str] = []
+        if cursor.description is None:
+            return dbt.clients.agate_helper.table_from_rows([], [])
 
-        if cursor.description is not None:
-            column_names = [col[0] for col in cursor.description]
-            rows = cursor.fetchall()
+        column_names = [col[0] for col in cursor.description]
+        if cls._overrides_process_results:
+            dbt.deprecations.warn(
+                'adapter-process-results', adapter=cls.__name__
+            )
+            rows = [row for batch in cls.fetch_batches(cursor) for row in batch]
             data = cls.process_results(column_names, rows)
-
-        return dbt.clients.agate_helper.table_from_data(data, column_names)
+            return dbt.clients.agate_helper.table_from_data(data, column_names)
+
+        rows = [
+            row
+            for batch in cls.fetch_batches(cursor)
+            for row in cls.convert_rows(cursor.description, batch)
+        ]
+        return dbt.clients.agate_helper.table_from_rows(
+            rows, column_names, cls.get_column_types(cursor.description)
+        )
 
     def execute(
         self, sql: str, auto_begin: bool = False, fetch: bool = False, autocommit: bool = False
@@ -118,6 +225,28 @@ class SQLConnectionManager(BaseConnectionManager):
             table = dbt.clients.agate_helper.empty_table()
         return status, table
 
+    @classmethod
+    def get_columnar_result_from_cursor(cls, cursor: Any) -> ColumnarTable:
+        """Fetch the cursor's results into Arrow memory. By default, rows are
+        fetched and converted a batch at a time.
+        """
+        if cursor.description is None:
+            return dbt.clients.columnar.table_from_arrow(None)
+        column_names = [col[0] for col in cursor.description]
+        return dbt.clients.columnar.table_from_batches(
+            column_names, cls.fetch_batches(cursor)
+        )
+
+    def execute_columnar(
+        self, sql: str, auto_begin: bool = False
+    ) -> Tuple[str, ColumnarTable]:
+        dbt.clients.columnar.import_pyarrow()
+        sql = self._add_query_comment(sql)
+        logger.debug(sql)
+        _, cursor = self.add_query(sql, auto_begin)
+        status = self.get_status(cursor)
+        return status, self.get_columnar_result_from_cursor(cursor)
+
     def add_begin_query(self):
         return self.add_query("BEGIN", auto_begin=False)
 
@@ -140,6 +140,7 @@ class SQLAdapter(BaseAdapter):
             ALTER_COLUMN_TYPE_MACRO_NAME,
             kwargs=kwargs
         )
+        self.introspection_cache.invalidate(relation)
 
     def drop_relation(self, relation):
         if relation.type is None:
@@ -169,10 +170,16 @@ class SQLAdapter(BaseAdapter):
         )
 
     def get_columns_in_relation(self, relation: str):
-        return self.execute_macro(
-            GET_COLUMNS_IN_RELATION_MACRO_NAME,
-            kwargs={'relation': relation}
+        columns = self.cached_introspection(
+            relation,
+            'columns',
+            lambda: self.execute_macro(
+                GET_COLUMNS_IN_RELATION_MACRO_NAME,
+                kwargs={'relation': relation}
+            ),
         )
+        # callers may modify the list they get
+        return list(columns)
 
     def create_schema(self, database: str, schema: str) -> None:
         logger.debug('Creating schema "{}"."{}".', database, schema)
@@ -194,6 +201,7 @@ class SQLAdapter(BaseAdapter):
         self.execute_macro(DROP_SCHEMA_MACRO_NAME, kwargs=kwargs)
         # we can update the cache here
         self.cache.drop_schema(database, schema)
+        self.introspection_cache.invalidate_schema(database, schema)
 
     def list_relations_without_caching(
             self, information_schema, schema
@@ -1,21 +1,24 @@
 from codecs import BOM_UTF8
+from typing import Any, Optional, Sequence
 
 import agate
 import json
+from agate.data_types import DataType
 
 
 BOM = BOM_UTF8.decode('utf-8')  # '\ufeff'
 
-DEFAULT_TYPE_TESTER = agate.TypeTester(types=[
-    agate.data_types.Number(null_values=('null', '')),
-    agate.data_types.TimeDelta(null_values=('null', '')),
-    agate.data_types.Date(null_values=('null', '')),
-    agate.data_types.DateTime(null_values=('null', '')),
-    agate.data_types.Boolean(true_values=('true',),
-                             false_values=('false',),
-                             null_values=('null', '')),
-    agate.data_types.Text(null_values=('null', ''))
-])
+NUMBER = agate.data_types.Number(null_values=('null', ''))
+TIME_DELTA = agate.data_types.TimeDelta(null_values=('null', ''))
+DATE = agate.data_types.Date(null_values=('null', ''))
+DATE_TIME = agate.data_types.DateTime(null_values=('null', ''))
+BOOLEAN = agate.data_types.Boolean(true_values=('true',),
+                                   false_values=('false',),
+                                   null_values=('null', ''))
+TEXT = agate.data_types.Text(null_values=('null', ''))
+
+DEFAULT_TYPES = [NUMBER, TIME_DELTA, DATE, DATE_TIME, BOOLEAN, TEXT]
+DEFAULT_TYPE_TESTER = agate.TypeTester(types=DEFAULT_TYPES)
 
 
 def table_from_data(data, column_names):
@@ -33,6 +36,32 @@ def table_from_data(data, column_names):
         return table.select(column_names)
 
 
+def table_from_rows(
+    rows: Sequence[Sequence[Any]],
+    column_names: Sequence[str],
+    column_types: Optional[Sequence[Optional[DataType]]] = None,
+) -> agate.Table:
+    """Convert a sequence of row tuples into an Agate table. Columns with a
+    type in column_types are cast to it, and only the rest are inferred from
+    their values.
+    """
+    if column_types is None:
+        column_types = [None] * len(column_names)
+    known = [
+        column_type for column_type in column_types if column_type is not None
+    ]
+    if len(known) == len(column_names):
+        return agate.Table(rows, column_names, column_types=known)
+
+    force = {
+        name: column_type
+        for name, column_type in zip(column_names, column_types)
+        if column_type is not None
+    }
+    tester = agate.TypeTester(force=force, types=DEFAULT_TYPES)
+    return agate.Table(rows, column_names, column_types=tester)
+
+
 def table_from_data_flat(data, column_names):
     "Convert list of dictionaries into an Agate table"
 
@@ -0,0 +1,239 @@
+"""Query results kept in Arrow's columnar memory, with a read-only subset of
+agate's Table interface for macros.
+"""
+from typing import (
+    Any, Dict, Iterable, Iterator, List, Optional, Sequence
+)
+
+import agate
+
+import dbt.exceptions
+from dbt.clients.agate_helper import DEFAULT_TYPE_TESTER
+
+
+def import_pyarrow():
+    try:
+        import pyarrow  # type: ignore
+    except ImportError:
+        raise dbt.exceptions.RuntimeException(
+            'columnar results require the "pyarrow" package'
+        )
+    return pyarrow
+
+
+class Row(Sequence[Any]):
+    """A row of a ColumnarTable. Like agate rows, values can be looked up by
+    index or by column name.
+    """
+    def __init__(self, values: Sequence[Any], column_names: Sequence[str]):
+        self._values = values
+        self._column_names = column_names
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return self._values[self._column_names.index(key)]
+        return self._values[key]
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __eq__(self, other) -> bool:
+        return list(self) == list(other)
+
+    def __repr__(self) -> str:
+        return '<Row: {}>'.format(tuple(self._values))
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key not in self._column_names:
+            return default
+        return self[key]
+
+    def keys(self) -> List[str]:
+        return list(self._column_names)
+
+    def values(self) -> List[Any]:
+        return list(self._values)
+
+    def items(self) -> List[Any]:
+        return list(zip(self._column_names, self._values))
+
+    def dict(self) -> Dict[str, Any]:
+        return dict(self.items())
+
+
+class Rows(Sequence[Row]):
+    """The rows of a ColumnarTable, converted to python values one record
+    batch at a time as they're iterated.
+    """
+    def __init__(self, table: 'ColumnarTable'):
+        self._table = table
+
+    def __len__(self) -> int:
+        return self._table.arrow.num_rows
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return list(self)[idx]
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError('row index out of range')
+        values = [column[idx].as_py() for column in self._table.arrow.columns]
+        return Row(values, self._table.column_names)
+
+    def __iter__(self) -> Iterator[Row]:
+        names = self._table.column_names
+        for batch in self._table.arrow.to_batches():
+            columns = [column.to_pylist() for column in batch.columns]
+            for values in zip(*columns):
+                yield Row(values, names)
+
+
+class Column(Sequence[Any]):
+    def __init__(self, name: str, values):
+        self.name = name
+        # a pyarrow ChunkedArray
+        self._values = values
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return self._values[idx].to_pylist()
+        return self._values[idx].as_py()
+
+    def __iter__(self) -> Iterator[Any]:
+        for chunk in self._values.chunks:
+            yield from chunk.to_pylist()
+
+    def values(self) -> List[Any]:
+        return self._values.to_pylist()
+
+    def values_distinct(self) -> List[Any]:
+        return self._values.unique().to_pylist()
+
+    def values_without_nulls(self) -> List[Any]:
+        return [value for value in self if value is not None]
+
+
+class Columns(Sequence[Column]):
+    """The columns of a ColumnarTable, by index or by name."""
+    def __init__(self, table: 'ColumnarTable'):
+        self._table = table
+
+    def __len__(self) -> int:
+        return self._table.arrow.num_columns
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            key = self._table.column_names.index(key)
+        name = self._table.column_names[key]
+        return Column(name, self._table.arrow.column(key))
+
+    def keys(self) -> List[str]:
+        return list(self._table.column_names)
+
+
+class ColumnarTable:
+    """A query result held in a pyarrow Table. It supports the parts of
+    agate's Table that macros read results with: column_names, columns,
+    rows, len() and iteration over rows, and print_table. Values are only
+    converted to python objects as they are read, and the Arrow table itself
+    is available as `arrow`. to_agate() makes a full agate Table.
+    """
+    def __init__(self, arrow_table):
+        self.arrow = arrow_table
+        self.column_names = tuple(arrow_table.column_names)
+        self.columns = Columns(self)
+        self.rows = Rows(self)
+
+    def __len__(self) -> int:
+        return self.arrow.num_rows
+
+    def __iter__(self) -> Iterator[Row]:
+        return iter(self.rows)
+
+    def to_agate(self, max_rows: Optional[int] = None) -> agate.Table:
+        arrow = self.arrow
+        if max_rows is not None:
+            arrow = arrow.slice(0, max_rows)
+        rows = list(zip(*(column.to_pylist() for column in arrow.columns)))
+        return agate.Table(
+            rows, self.column_names, column_types=DEFAULT_TYPE_TESTER
+        )
+
+    def print_table(self, max_rows: int = 20, *args, **kwargs) -> None:
+        table = self.to_agate(max_rows + 1)
+        table.print_table(max_rows, *args, **kwargs)  # type: ignore
+
+
+def _concat_arrays(pyarrow, arrays):
+    """Combine one column's arrays from several batches. Their inferred types
+    can differ (a batch of all nulls, or decimals of different precision),
+    in which case they're cast to the first batch's type, or if that fails,
+    the type is inferred from all the values at once.
+    """
+    types = [array.type for array in arrays if array.type != pyarrow.null()]
+    if not types:
+        return pyarrow.chunked_array(arrays, type=pyarrow.null())
+    target = types[0]
+    try:
+        return pyarrow.chunked_array(
+            [array.cast(target) for array in arrays], type=target
+        )
+    except (pyarrow.ArrowInvalid, pyarrow.ArrowNotImplementedError):
+        values: List[Any] = []
+        for array in arrays:
+            values.extend(array.to_pylist())
+        return pyarrow.chunked_array([pyarrow.array(values)])
+
+
+def table_from_batches(
+    column_names: Sequence[str], batches: Iterable[Sequence[Sequence[Any]]]
+) -> ColumnarTable:
+    """Build a ColumnarTable from batches of row tuples, converting each batch
+    to Arrow arrays before the next one is read, so only one batch of python
+    values exists at once.
+    """
+    pyarrow = import_pyarrow()
+    arrays: List[List[Any]] = [[] for _ in column_names]
+    for rows in batches:
+        for idx, values in enumerate(zip(*rows)):
+            arrays[idx].append(pyarrow.array(values, from_pandas=False))
+
+    columns = [
+        _concat_arrays(pyarrow, column_arrays) if column_arrays
+        else pyarrow.chunked_array([], type=pyarrow.null())
+        for column_arrays in arrays
+    ]
+    return ColumnarTable(
+        pyarrow.Table.from_arrays(columns, list(column_names))
+    )
+
+
+def table_from_agate(table: agate.Table) -> ColumnarTable:
+    """Convert an agate Table, for adapters without a columnar fetch."""
+    pyarrow = import_pyarrow()
+    columns = [
+        pyarrow.array(column.values(), from_pandas=False)
+        for column in table.columns
+    ]
+    return ColumnarTable(
+        pyarrow.Table.from_arrays(columns, list(table.column_names))
+    )
+
+
+def table_from_arrow(
+    arrow_table: Any, column_names: Optional[Sequence[str]] = None
+) -> ColumnarTable:
+    """Wrap a pyarrow Table, or None for an empty result with the given
+    column names.
+    """
+    if arrow_table is None:
+        pyarrow = import_pyarrow()
+        arrow_table = pyarrow.table({
+            name: pyarrow.array([], type=pyarrow.null())
+            for name in column_names or ()
+        })
+    return ColumnarTable(arrow_table)
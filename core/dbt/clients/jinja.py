@@ -3,7 +3,9 @@ import linecache
 import os
 import tempfile
 from contextlib import contextmanager
-from typing import List, Union, Set, Optional, Dict, Any, Callable, Iterator
+from typing import (
+    List, Union, Set, Optional, Dict, Any, Callable, Iterator, Tuple
+)
 
 import jinja2
 import jinja2._compat
@@ -117,6 +119,8 @@ template_cache = TemplateCache()
 class BaseMacroGenerator:
     def __init__(self, context: Optional[Dict[str, Any]] = None) -> None:
         self.context: Optional[Dict[str, Any]] = context
+        # (template, context, macro) from the last get_macro() call
+        self._macro_cache: Optional[Tuple[Any, Dict[str, Any], Any]] = None
 
     def get_template(self):
         raise NotImplementedError('get_template not implemented!')
@@ -127,11 +131,22 @@ class BaseMacroGenerator:
     def get_macro(self):
         name = self.get_name()
         template = self.get_template()
+        # making the module is expensive, and macros like statement() get
+        # called many times with the same context. Only rebuild it when the
+        # template or the context object changes.
+        cached = self._macro_cache
+        if (
+            cached is not None and
+            cached[0] is template and
+            cached[1] is self.context
+        ):
+            return cached[2]
         # make the module. previously we set both vars and local, but that's
         # redundant: They both end up in the same place
         module = template.make_module(vars=self.context, shared=False)
         macro = module.__dict__[dbt.utils.get_dbt_macro_name(name)]
         module.__dict__.update(self.context)
+        self._macro_cache = (template, self.context, macro)
         return macro
 
     @contextmanager
@@ -363,8 +378,38 @@ def render_template(template, ctx, node=None):
         dbt.exceptions.raise_compiler_error(str(e), node)
 
 
+# the start-of-block markers for the default jinja environment (we don't enable
+# line statements or line comments).
+_JINJA_MARKERS = ('{{', '{%', '{#')
+
+
+def is_template_free(string: Any) -> bool:
+    """Return True if rendering the given value with jinja would not evaluate
+    anything. Strings with '\r' in them are excluded, because jinja
+    normalizes newlines when it renders.
+    """
+    if not isinstance(string, str) or '\r' in string:
+        return False
+    return not any(marker in string for marker in _JINJA_MARKERS)
+
+
+def render_template_free(string: str) -> str:
+    """Render a string for which is_template_free() is True, with the same
+    result jinja would produce. By default, jinja drops a single trailing
+    newline.
+    """
+    if string.endswith('\n'):
+        return string[:-1]
+    return string
+
+
 def get_rendered(string, ctx, node=None,
                  capture_macros=False):
+    # building an environment and compiling a template is expensive, and a
+    # lot of what we render is plain SQL.
+    if is_template_free(string):
+        return render_template_free(string)
+
     template = get_template(string, ctx, node,
                             capture_macros=capture_macros)
 
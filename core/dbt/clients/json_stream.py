@@ -0,0 +1,183 @@
+"""Write large JSON documents to disk a piece at a time, so the whole document
+never has to be held in memory as one big dict or string.
+"""
+import gzip
+import io
+import json
+import os
+from typing import Any, Callable, Iterable, Iterator, IO, Optional, Tuple
+
+import dbt.exceptions
+import dbt.utils
+from dbt.clients.system import make_directory
+
+COMPRESSION_SUFFIXES = {
+    'gzip': '.gz',
+    'zstd': '.zst',
+}
+
+
+def _orjson_default(obj):
+    # orjson handles datetimes itself. Mirror the rest of dbt.utils.JSONEncoder
+    if isinstance(obj, dbt.utils.DECIMALS):
+        return float(obj)
+    if hasattr(obj, 'to_dict'):
+        return obj.to_dict()
+    raise TypeError(
+        'Object of type {} is not JSON serializable'
+        .format(type(obj).__name__)
+    )
+
+
+def _load_orjson() -> Optional[Callable[[Any], bytes]]:
+    """orjson is much faster than the standard library, use it if it's
+    installed. Versions before 3.0 can't write non-string keys, so they're
+    ignored.
+    """
+    try:
+        import orjson  # type: ignore
+    except ImportError:
+        return None
+    option = getattr(orjson, 'OPT_NON_STR_KEYS', None)
+    if option is None:
+        return None
+
+    def orjson_dumps(value: Any) -> bytes:
+        return orjson.dumps(value, default=_orjson_default, option=option)
+
+    return orjson_dumps
+
+
+_orjson_dumps = _load_orjson()
+
+# orjson can only write compact JSON, so the standard library does too
+SEPARATORS = (',', ':')
+
+
+def dumps(value: Any) -> str:
+    if _orjson_dumps is not None:
+        return _orjson_dumps(value).decode('utf-8')
+    return json.dumps(
+        value, cls=dbt.utils.JSONEncoder, separators=SEPARATORS
+    )
+
+
+class StreamedObject:
+    """A JSON object whose members are generated as they're written. Each
+    member's value may itself be a StreamedObject or StreamedList.
+    """
+    def __init__(self, items: Iterable[Tuple[str, Any]]) -> None:
+        self.items = items
+
+
+class StreamedList:
+    """A JSON array whose members are generated as they're written."""
+    def __init__(self, items: Iterable[Any]) -> None:
+        self.items = items
+
+
+class RawJSON(str):
+    """A string that is already encoded JSON, written out as-is."""
+
+
+def _write_value(fp: IO[str], value: Any) -> None:
+    if isinstance(value, RawJSON):
+        fp.write(value)
+        return
+    if isinstance(value, StreamedList):
+        fp.write('[')
+        first = True
+        for item in value.items:
+            if not first:
+                fp.write(SEPARATORS[0])
+            first = False
+            _write_value(fp, item)
+        fp.write(']')
+        return
+    if not isinstance(value, StreamedObject):
+        fp.write(dumps(value))
+        return
+
+    fp.write('{')
+    first = True
+    for key, item in value.items:
+        if not first:
+            fp.write(SEPARATORS[0])
+        first = False
+        fp.write(dumps(key))
+        fp.write(SEPARATORS[1])
+        _write_value(fp, item)
+    fp.write('}')
+
+
+def _open_for_write(path: str, compression: Optional[str]) -> IO[str]:
+    if compression is None:
+        return open(path, 'w', encoding='utf-8')
+    elif compression == 'gzip':
+        return gzip.open(path, 'wt', encoding='utf-8')
+    elif compression == 'zstd':
+        try:
+            import zstandard  # type: ignore
+        except ImportError:
+            raise dbt.exceptions.RuntimeException(
+                'zstd compression requires the "zstandard" package'
+            )
+        writer = zstandard.ZstdCompressor().stream_writer(open(path, 'wb'))
+        return io.TextIOWrapper(writer, encoding='utf-8')
+    else:
+        raise dbt.exceptions.InternalException(
+            'Unknown compression "{}"'.format(compression)
+        )
+
+
+def write_json_stream(
+    path: str, value: Any, compression: Optional[str] = None
+) -> None:
+    """Write value to path as JSON, expanding any StreamedObjects as they are
+    written. With a compression of 'gzip' or 'zstd', compress the output.
+
+    The document is written to a temporary file that replaces path once it is
+    complete, so readers never see a partial file.
+    """
+    make_directory(os.path.dirname(path))
+    tmp_path = path + '.tmp'
+    try:
+        with _open_for_write(tmp_path, compression) as fp:
+            _write_value(fp, value)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+class JSONLinesWriter:
+    """Append values to a JSON-lines file one at a time. Each line is flushed
+    as soon as it's written, so other processes can follow the file.
+    """
+    def __init__(self, path: str) -> None:
+        make_directory(os.path.dirname(path))
+        self.path = path
+        self._fp: Optional[IO[str]] = open(path, 'w', encoding='utf-8')
+
+    def write(self, value: Any) -> None:
+        if self._fp is None:
+            raise dbt.exceptions.InternalException(
+                'Write to closed JSON-lines file "{}"'.format(self.path)
+            )
+        self._fp.write(dumps(value))
+        self._fp.write('\n')
+        self._fp.flush()
+
+    def close(self) -> None:
+        if self._fp is not None:
+            self._fp.close()
+            self._fp = None
+
+
+def read_json_lines(path: str) -> Iterator[RawJSON]:
+    """Yield each line of a JSON-lines file as RawJSON, without decoding it."""
+    with open(path, 'r', encoding='utf-8') as fp:
+        for line in fp:
+            line = line.rstrip('\n')
+            if line:
+                yield RawJSON(line)
@@ -58,6 +58,42 @@ def find_matching(root_path,
     return matching
 
 
+def scan_files(path):
+    """
+    Recursively list the files under the directory at `path` with
+    os.scandir, yielding (absolute_path, stat_result) pairs. Like os.walk, the
+    files in a directory come before the contents of its subdirectories,
+    symlinks to directories are not followed, and a missing directory has no
+    files.
+    """
+    try:
+        entries = list(os.scandir(path))
+    except OSError:
+        return
+
+    subdirectories = []
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+
+        if is_dir:
+            if not entry.is_symlink():
+                subdirectories.append(entry.path)
+            continue
+
+        try:
+            stat_result = entry.stat()
+        except OSError:
+            # broken symlinks and files that were just removed
+            continue
+        yield entry.path, stat_result
+
+    for subdirectory in subdirectories:
+        yield from scan_files(subdirectory)
+
+
 def load_file_contents(path, strip=True):
     with open(path, 'rb') as handle:
         to_return = handle.read().decode('utf-8')
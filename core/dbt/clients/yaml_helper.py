@@ -3,6 +3,13 @@ import dbt.exceptions
 import yaml
 import yaml.scanner
 
+# the C loader (backed by libyaml) is much faster than the pure-python one, but
+# it's only available if pyyaml was built with libyaml.
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader  # type: ignore
+
 
 YAML_ERROR_MESSAGE = """
 Syntax error near line {line_number}
@@ -46,7 +53,7 @@ def contextualized_yaml_error(raw_contents, error):
 
 def load_yaml_text(contents):
     try:
-        return yaml.safe_load(contents)
+        return yaml.load(contents, Loader=SafeLoader)
     except (yaml.scanner.ScannerError, yaml.YAMLError) as e:
         if hasattr(e, 'problem_mark'):
             error = contextualized_yaml_error(contents, e)
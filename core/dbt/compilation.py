@@ -1,6 +1,6 @@
 import itertools
 import os
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
 
 import dbt.utils
 import dbt.include
@@ -53,11 +53,10 @@ def print_compile_stats(stats):
 
 
 def _add_prepended_cte(prepended_ctes, new_cte):
-    for cte in prepended_ctes:
-        if cte.id == new_cte.id:
-            cte.sql = new_cte.sql
-            return
-    prepended_ctes.append(new_cte)
+    """prepended_ctes is an OrderedDict of CTE id -> InjectedCTE. Re-adding an
+    existing id replaces its sql but keeps its original position.
+    """
+    prepended_ctes[new_cte.id] = new_cte
 
 
 def _extend_prepended_ctes(prepended_ctes, new_prepended_ctes):
@@ -65,6 +64,34 @@ def _extend_prepended_ctes(prepended_ctes, new_prepended_ctes):
         _add_prepended_cte(prepended_ctes, new_cte)
 
 
+def _injected_ctes_for(ephemeral, manifest):
+    """Get the flattened list of CTEs that a reference to the given ephemeral
+    node injects: all of its own prepended CTEs, followed by itself.
+
+    The result is memoized on the manifest for the rest of the run. Entries
+    are only reused while the manifest still holds the exact node they were
+    built from, so recompiling a node invalidates its entry.
+    """
+    cached = manifest.injected_cte_cache.get(ephemeral.unique_id)
+    if cached is not None and cached[0] is ephemeral:
+        return cached[1]
+
+    ephemeral, new_prepended_ctes, manifest = recursively_prepend_ctes(
+        ephemeral, manifest
+    )
+    injected_ctes = OrderedDict()
+    _extend_prepended_ctes(injected_ctes, new_prepended_ctes)
+    new_cte_name = "__dbt__CTE__{}".format(ephemeral.name)
+    sql = " {} as (\n{}\n)".format(new_cte_name, ephemeral.compiled_sql)
+    _add_prepended_cte(
+        injected_ctes, InjectedCTE(id=ephemeral.unique_id, sql=sql)
+    )
+
+    result = list(injected_ctes.values())
+    manifest.injected_cte_cache[ephemeral.unique_id] = (ephemeral, result)
+    return result
+
+
 def prepend_ctes(model, manifest):
     model, _, manifest = recursively_prepend_ctes(model, manifest)
 
@@ -79,22 +106,17 @@ def recursively_prepend_ctes(model, manifest):
         if not isinstance(model, tuple(COMPILED_TYPES.values())):
             raise dbt.exceptions.InternalException("Bad model type: {}".format(type(model)))
 
-    prepended_ctes = []
+    prepended_ctes = OrderedDict()
 
     for cte in model.extra_ctes:
-        cte_id = cte.id
-        cte_to_add = manifest.nodes.get(cte_id)
-        cte_to_add, new_prepended_ctes, manifest = recursively_prepend_ctes(cte_to_add, manifest)
-        _extend_prepended_ctes(prepended_ctes, new_prepended_ctes)
-        new_cte_name = "__dbt__CTE__{}".format(cte_to_add.name)
-        sql = " {} as (\n{}\n)".format(new_cte_name, cte_to_add.compiled_sql)
-        _add_prepended_cte(prepended_ctes, InjectedCTE(id=cte_id, sql=sql))
+        cte_to_add = manifest.nodes.get(cte.id)
+        _extend_prepended_ctes(prepended_ctes, _injected_ctes_for(cte_to_add, manifest))
 
-    model.prepend_ctes(prepended_ctes)
+    model.prepend_ctes(list(prepended_ctes.values()))
 
     manifest.update_node(model)
 
-    return (model, prepended_ctes, manifest)
+    return (model, model.extra_ctes, manifest)
 
 
 class Compiler:
@@ -121,7 +143,11 @@ class Compiler:
                 "injected_sql": None,
             }
         )
-        compiled_node = _compiled_type_for(node).from_dict(data)
+        # the parsed node was already validated, so outside of strict mode
+        # there's no need to do it again
+        compiled_node = _compiled_type_for(node).from_dict(
+            data, validate=dbt.flags.STRICT_MODE
+        )
 
         context = dbt.context.runtime.generate(compiled_node, self.config, manifest)
         context.update(extra_context)
@@ -237,6 +263,10 @@ def compile_node(adapter, config, node, manifest, extra_context, write=True):
 
 def _inject_runtime_config(adapter, node, extra_context):
     wrapped_sql = node.wrapped_sql
+    if dbt.clients.jinja.is_template_free(wrapped_sql):
+        # skip building a context: there is nothing to render it with
+        node.wrapped_sql = dbt.clients.jinja.render_template_free(wrapped_sql)
+        return node
     context = _node_context(adapter, node)
     context.update(extra_context)
     sql = dbt.clients.jinja.get_rendered(wrapped_sql, context)
@@ -244,8 +274,20 @@ def _inject_runtime_config(adapter, node, extra_context):
     return node
 
 
+# (active user, runtime context) for the most recent active user
+_runtime_context = None
+
+
 def _node_context(adapter, node):
-    return {
-        "run_started_at": dbt.tracking.active_user.run_started_at,
-        "invocation_id": dbt.tracking.active_user.invocation_id,
-    }
+    global _runtime_context
+    active_user = dbt.tracking.active_user
+    if _runtime_context is None or _runtime_context[0] is not active_user:
+        _runtime_context = (
+            active_user,
+            {
+                "run_started_at": active_user.run_started_at,
+                "invocation_id": active_user.invocation_id,
+            },
+        )
+    # callers update the result with their own extra context, so copy it
+    return dict(_runtime_context[1])
@@ -0,0 +1,138 @@
+"""Tune how many nodes run at once from how the warehouse is responding."""
+import asyncio
+import threading
+from typing import List, Optional, Tuple
+
+from dbt.logger import GLOBAL_LOGGER as logger
+
+
+# adjust the limit after this many queries
+WINDOW_SIZE = 10
+# the window is congested if more than this fraction of query time was spent
+# queued in the warehouse...
+QUEUED_FRACTION_THRESHOLD = 0.2
+# ...or if even its fastest query took this many times the baseline latency.
+LATENCY_RATIO_THRESHOLD = 2.0
+# on congestion, multiply the limit by this
+DECREASE_FACTOR = 0.7
+# the baseline can rise by this factor each window, so a lasting change in
+# the warehouse eventually becomes the new normal.
+BASELINE_DRIFT = 1.1
+
+
+class AdaptiveConcurrency:
+    """An additive-increase, multiplicative-decrease limit on the number of
+    nodes that run at once, between 1 and max_limit.
+
+    Queries report their run time and, if the adapter knows it, how long they
+    were queued in the warehouse. After each window of queries the limit grows
+    by one, unless the window looks congested: a lot of time spent queued, or
+    latency well above the baseline. Then it shrinks by DECREASE_FACTOR.
+
+    Latency is judged by the fastest query in the window against the fastest
+    seen so far (the baseline), as TCP Vegas does with round trip times. Models
+    take wildly different amounts of time, but when the warehouse is busy even
+    the cheap queries slow down.
+    """
+    def __init__(self, max_limit: int, initial: Optional[int] = None) -> None:
+        self.max_limit = max(max_limit, 1)
+        if initial is None:
+            initial = (self.max_limit + 1) // 2
+        self.limit = float(max(1, min(initial, self.max_limit)))
+        self.in_flight = 0
+        self.baseline: Optional[float] = None
+        self._window: List[Tuple[float, Optional[float]]] = []
+        self._condition = threading.Condition()
+
+    @property
+    def current_limit(self) -> int:
+        return int(self.limit)
+
+    def try_acquire(self) -> bool:
+        """Take a slot for a node if one is free."""
+        with self._condition:
+            if self.in_flight >= self.current_limit:
+                return False
+            self.in_flight += 1
+            return True
+
+    def acquire(self) -> None:
+        """Take a slot for a node, waiting for one to be free."""
+        with self._condition:
+            while self.in_flight >= self.current_limit:
+                self._condition.wait()
+            self.in_flight += 1
+
+    def release(self) -> None:
+        with self._condition:
+            self.in_flight -= 1
+            self._condition.notify()
+
+    def record(self, elapsed: float, queued: Optional[float] = None) -> None:
+        """Record a query's run time and queued time. This is a connection
+        manager's query_listener.
+        """
+        with self._condition:
+            self._window.append((elapsed, queued))
+            if len(self._window) >= WINDOW_SIZE:
+                self._adjust()
+
+    def _adjust(self) -> None:
+        """Update the limit from the current window of queries.
+
+        Callers must hold the condition.
+        """
+        window, self._window = self._window, []
+        fastest = min(elapsed for elapsed, _ in window)
+        latency_ratio = 1.0
+        if self.baseline is None:
+            self.baseline = fastest
+        else:
+            if self.baseline > 0:
+                latency_ratio = fastest / self.baseline
+            self.baseline = min(fastest, self.baseline * BASELINE_DRIFT)
+
+        queued = [
+            (elapsed, queued) for elapsed, queued in window
+            if queued is not None
+        ]
+        queued_fraction = 0.0
+        total = sum(elapsed for elapsed, _ in queued)
+        if total > 0:
+            queued_fraction = sum(q for _, q in queued) / total
+
+        old_limit = self.current_limit
+        if (queued_fraction > QUEUED_FRACTION_THRESHOLD or
+                latency_ratio > LATENCY_RATIO_THRESHOLD):
+            self.limit = max(1.0, self.limit * DECREASE_FACTOR)
+            action = 'decreasing'
+        else:
+            self.limit = min(float(self.max_limit), self.limit + 1)
+            action = 'increasing'
+
+        logger.debug(
+            'Adaptive concurrency: {:.0%} of query time queued, fastest query '
+            '{:.2f}s ({:.1f}x baseline), {} limit from {} to {}'
+            .format(queued_fraction, fastest, latency_ratio, action,
+                    old_limit, self.current_limit)
+        )
+        if self.current_limit > old_limit:
+            self._condition.notify_all()
+
+
+class AsyncSlots:
+    """Take slots from an AdaptiveConcurrency on an event loop, without
+    blocking it. All releases must happen on the loop.
+    """
+    def __init__(self, controller: AdaptiveConcurrency) -> None:
+        self.controller = controller
+        self._released = asyncio.Event()
+
+    async def acquire(self) -> None:
+        while not self.controller.try_acquire():
+            self._released.clear()
+            await self._released.wait()
+
+    def release(self) -> None:
+        self.controller.release()
+        self._released.set()
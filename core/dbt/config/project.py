@@ -150,7 +150,7 @@ class Project:
                  analysis_paths, docs_paths, target_path, snapshot_paths,
                  clean_targets, log_path, modules_path, quoting, models,
                  on_run_start, on_run_end, seeds, snapshots, dbt_version,
-                 packages, query_comment):
+                 packages, query_comment, concurrency_limits):
         self.project_name = project_name
         self.version = version
         self.project_root = project_root
@@ -175,6 +175,10 @@ class Project:
         self.dbt_version = dbt_version
         self.packages = packages
         self.query_comment = query_comment
+        # the most nodes in each concurrency group that may run at once
+        self.concurrency_limits = concurrency_limits
+        # precompiled models/seeds/snapshots configs, for SourceConfig
+        self.config_tries = {}
 
     @staticmethod
     def _preprocess(project_dict):
@@ -260,6 +264,13 @@ class Project:
         snapshots = project_dict.get('snapshots', {})
         dbt_raw_version = project_dict.get('require-dbt-version', '>=0.0.0')
         query_comment = project_dict.get('query-comment', NoValue())
+        concurrency_limits = project_dict.get('concurrency-limits', {})
+        for group, limit in concurrency_limits.items():
+            if limit < 1:
+                raise DbtProjectError(
+                    'Invalid concurrency limit for group "{}": {} (it must be '
+                    'at least 1)'.format(group, limit)
+                )
 
         try:
             dbt_version = _parse_versions(dbt_raw_version)
@@ -296,6 +307,7 @@ class Project:
             dbt_version=dbt_version,
             packages=packages,
             query_comment=query_comment,
+            concurrency_limits=concurrency_limits,
         )
         # sanity check - this means an internal issue
         project.validate()
@@ -344,6 +356,7 @@ class Project:
             'require-dbt-version': [
                 v.to_version_string() for v in self.dbt_version
             ],
+            'concurrency-limits': self.concurrency_limits,
         })
         if with_packages:
             result.update(self.packages.to_dict())
@@ -22,7 +22,7 @@ class RuntimeConfig(Project, Profile):
                  log_path, modules_path, quoting, models, on_run_start,
                  on_run_end, seeds, snapshots, dbt_version, profile_name,
                  target_name, config, threads, credentials, packages,
-                 query_comment, args):
+                 query_comment, concurrency_limits, args):
         # 'vars'
         self.args = args
         self.cli_vars = parse_cli_vars(getattr(args, 'vars', '{}'))
@@ -53,6 +53,7 @@ class RuntimeConfig(Project, Profile):
             dbt_version=dbt_version,
             packages=packages,
             query_comment=query_comment,
+            concurrency_limits=concurrency_limits,
         )
         # 'profile'
         Profile.__init__(
@@ -104,6 +105,7 @@ class RuntimeConfig(Project, Profile):
             dbt_version=project.dbt_version,
             packages=project.packages,
             query_comment=project.query_comment,
+            concurrency_limits=project.concurrency_limits,
             profile_name=profile.profile_name,
             target_name=profile.target_name,
             config=profile.config,
@@ -1,7 +1,7 @@
 import itertools
 import json
 import os
-from typing import Callable, Any, Dict, List, Optional
+from typing import Callable, Any, Dict, List, Optional, Tuple
 
 import dbt.tracking
 from dbt.clients.jinja import undefined_error
@@ -232,30 +232,65 @@ class HasCredentialsContext(ConfigRenderContext):
         self,
         context: Dict[str, Any],
         macros: Dict[str, ParsedMacro],
+        layout: Optional['MacroLayout'] = None,
     ):
-        global_macros: List[Dict[str, Callable]] = []
-        local_macros: List[Dict[str, Callable]] = []
+        if layout is None:
+            layout = MacroLayout.build(macros, self.search_package_name)
+
+        generators: Dict[str, Callable] = {}
+        for key, macro in layout.namespaced:
+            generator = macro.generator(context)
+            generators[macro.unique_id] = generator
+            # adapter packages are part of the global project space
+            _add_macro_map(context, key, {macro.name: generator})
+
+        # global macros were loaded before local macros, so local macros take
+        # precedence
+        for name, unique_id in layout.top_level.items():
+            context[name] = generators[unique_id]
+
+
+class MacroLayout:
+    """Where each macro ends up in a context: the namespace it's added to, and
+    which macro wins for each name in the top level of the context. This only
+    depends on the macros and the root package name, so it can be computed
+    once per manifest instead of once per node.
+    """
+    def __init__(
+        self,
+        namespaced: List[Tuple[str, ParsedMacro]],
+        top_level: Dict[str, str],
+    ) -> None:
+        self.namespaced = namespaced
+        self.top_level = top_level
+
+    @classmethod
+    def build(
+        cls, macros: Dict[str, ParsedMacro], search_package_name: str
+    ) -> 'MacroLayout':
+        namespaced: List[Tuple[str, ParsedMacro]] = []
+        global_macros: List[ParsedMacro] = []
+        local_macros: List[ParsedMacro] = []
 
         for unique_id, macro in macros.items():
             if macro.resource_type != NodeType.Macro:
                 continue
             package_name = macro.package_name
 
-            macro_map: Dict[str, Callable] = {
-                macro.name: macro.generator(context)
-            }
-
-            # adapter packages are part of the global project space
-            _add_macro_map(context, package_name, macro_map)
+            key = package_name
+            if package_name in PACKAGES:
+                key = GLOBAL_PROJECT_NAME
+            namespaced.append((key, macro))
 
-            if package_name == self.search_package_name:
-                local_macros.append(macro_map)
+            if package_name == search_package_name:
+                local_macros.append(macro)
             elif package_name in PACKAGES:
-                global_macros.append(macro_map)
+                global_macros.append(macro)
 
-        # Load global macros before local macros -- local takes precedence
-        for macro_map in itertools.chain(global_macros, local_macros):
-            context.update(macro_map)
+        top_level: Dict[str, str] = {}
+        for macro in itertools.chain(global_macros, local_macros):
+            top_level[macro.name] = macro.unique_id
+        return cls(namespaced=namespaced, top_level=top_level)
 
 
 class QueryHeaderContext(HasCredentialsContext):
@@ -4,6 +4,7 @@ from typing_extensions import Protocol
 from typing import Union, Callable, Any, Dict, TypeVar, Type
 
 import dbt.clients.agate_helper
+from dbt.clients.columnar import ColumnarTable
 from dbt.contracts.graph.compiled import CompiledSeedNode
 from dbt.contracts.graph.parsed import ParsedSeedNode
 import dbt.exceptions
@@ -14,7 +15,7 @@ import dbt.writer
 from dbt.adapters.factory import get_adapter
 from dbt.node_types import NodeType
 from dbt.clients.jinja import get_rendered
-from dbt.context.base import Var, HasCredentialsContext
+from dbt.context.base import Var, HasCredentialsContext, MacroLayout
 from dbt.contracts.graph.manifest import Manifest
 
 
@@ -99,7 +100,15 @@ class ManifestParsedContext(HasCredentialsContext):
         self.manifest = manifest
 
     def add_macros(self, context):
-        self.add_macros_from(context, self.manifest.macros)
+        # every node's context is built from the same macros
+        layout = self.manifest.macro_cache.lookup(
+            self.manifest.macros,
+            ('context_layout', self.search_package_name),
+            lambda: MacroLayout.build(
+                self.manifest.macros, self.search_package_name
+            ),
+        )
+        self.add_macros_from(context, self.manifest.macros, layout)
 
 
 def _store_result(sql_results):
@@ -107,9 +116,15 @@ def _store_result(sql_results):
         if agate_table is None:
             agate_table = dbt.clients.agate_helper.empty_table()
 
+        if isinstance(agate_table, ColumnarTable):
+            # converted as they're read, not all up front
+            data = agate_table.rows
+        else:
+            data = dbt.clients.agate_helper.as_matrix(agate_table)
+
         sql_results[name] = dbt.utils.AttrDict({
             'status': status,
-            'data': dbt.clients.agate_helper.as_matrix(agate_table),
+            'data': data,
             'table': agate_table
         })
         return ''
@@ -154,8 +169,10 @@ def add_sql_handlers(context):
 
 def write(node, target_path, subdirectory):
     def fn(payload):
-        node.build_path = dbt.writer.write_node(
-            node, target_path, subdirectory, payload)
+        path = dbt.writer.write_node(node, target_path, subdirectory, payload)
+        # a skipped artifact keeps pointing at the last file actually written
+        if path is not None:
+            node.build_path = path
         return ''
 
     return fn
@@ -1,8 +1,10 @@
 import abc
 import itertools
+import time
 from dataclasses import dataclass, field
 from typing import (
-    Any, ClassVar, Dict, Tuple, Iterable, Optional, NewType, List, Type
+    Any, Callable, ClassVar, Dict, Tuple, Iterable, Optional, NewType, List,
+    Type
 )
 from typing_extensions import Protocol
 
@@ -36,12 +38,25 @@ class ConnectionOpenerProtocol(Protocol):
 class LazyHandle:
     """Opener must be a callable that takes a Connection object and opens the
     connection, updating the handle on the Connection.
+
+    If on_open is given, it's called with the number of seconds opening the
+    connection took, whether it succeeded or not.
     """
-    def __init__(self, opener: Type[ConnectionOpenerProtocol]):
+    def __init__(
+        self,
+        opener: Type[ConnectionOpenerProtocol],
+        on_open: Optional[Callable[[float], None]] = None,
+    ):
         self.opener = opener
+        self.on_open = on_open
 
     def resolve(self, connection: 'Connection') -> Any:
-        return self.opener.open(connection)
+        started = time.time()
+        try:
+            return self.opener.open(connection)
+        finally:
+            if self.on_open is not None:
+                self.on_open(time.time() - started)
 
 
 @dataclass(init=False)
@@ -162,3 +177,4 @@ class HasCredentials(Protocol):
 
 class AdapterRequiredConfig(HasCredentials):
     query_comment: Optional[str]
+    threads: int
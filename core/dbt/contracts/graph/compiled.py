@@ -13,6 +13,7 @@ from dbt.contracts.graph.parsed import (
     TestMetadata,
     PARSED_TYPES,
 )
+import dbt.flags
 from dbt.node_types import NodeType
 from dbt.contracts.util import Replaceable
 from dbt.exceptions import InternalException, RuntimeException
@@ -54,7 +55,8 @@ class CompiledNode(ParsedNode):
             self.compiled_sql,
             prepended_ctes,
         )
-        self.validate(self.to_dict())
+        if dbt.flags.STRICT_MODE:
+            self.validate(self.to_dict())
 
     def set_cte(self, cte_id: str, sql: str):
         """This is the equivalent of what self.extra_ctes[cte_id] = sql would
@@ -3,11 +3,14 @@ import hashlib
 import os
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional, Union, Mapping, Any
+from typing import (
+    Dict, List, Optional, Union, Mapping, Any, Tuple, Callable, TypeVar
+)
 from uuid import UUID
 
 from hologram import JsonSchemaMixin
 
+from dbt.clients.json_stream import StreamedObject, write_json_stream
 from dbt.contracts.graph.parsed import ParsedNode, ParsedMacro, \
     ParsedDocumentation
 from dbt.contracts.graph.compiled import CompileResultNode
@@ -19,9 +22,11 @@ from dbt.include.global_project import PACKAGES
 from dbt.logger import GLOBAL_LOGGER as logger
 from dbt.node_types import NodeType
 from dbt import tracking
+import dbt.flags
 import dbt.utils
 
 NodeEdgeMap = Dict[str, List[str]]
+T = TypeVar('T')
 
 
 @dataclass
@@ -209,7 +214,8 @@ def build_edges(nodes):
 
 
 def _deepcopy(value):
-    return value.from_dict(value.to_dict())
+    # the copy is of data dbt already built, so only validate it in strict mode
+    return value.from_dict(value.to_dict(), validate=dbt.flags.STRICT_MODE)
 
 
 class Locality(enum.IntEnum):
@@ -256,6 +262,35 @@ class MaterializationCandidate:
         return False
 
 
+class MacroCache:
+    """Memoized lookups that depend only on a manifest's macros. Any change to
+    the set of macros invalidates everything: replacing the macros dict or
+    changing its size is detected automatically, in-place replacements of
+    existing macros must go through Manifest.update_macros().
+    """
+    def __init__(self) -> None:
+        self._version: Optional[Tuple[int, int]] = None
+        self._values: Dict[Any, Any] = {}
+
+    def lookup(
+        self,
+        macros: Mapping[str, ParsedMacro],
+        key: Any,
+        build: Callable[[], T],
+    ) -> T:
+        version = (id(macros), len(macros))
+        if version != self._version:
+            self._values = {}
+            self._version = version
+        if key not in self._values:
+            self._values[key] = build()
+        return self._values[key]
+
+    def clear(self) -> None:
+        self._values = {}
+        self._version = None
+
+
 @dataclass
 class Manifest:
     """The manifest for the full graph, after parsing and during compilation.
@@ -268,6 +303,14 @@ class Manifest:
     files: Mapping[str, SourceFile]
     metadata: ManifestMetadata = field(default_factory=ManifestMetadata)
     flat_graph: Dict[str, Any] = field(default_factory=dict)
+    # unique ID -> (ephemeral node, flattened injected CTEs). This is a
+    # per-run cache owned by dbt.compilation, so it's never compared/written
+    injected_cte_cache: Dict[str, Any] = field(
+        default_factory=dict, compare=False, repr=False
+    )
+    macro_cache: MacroCache = field(
+        default_factory=MacroCache, compare=False, repr=False
+    )
 
     @classmethod
     def from_macros(cls, macros=None, files=None) -> 'Manifest':
@@ -298,6 +341,13 @@ class Manifest:
             )
         self.nodes[unique_id] = new_node
 
+    def update_macros(self, new_macros):
+        """Add the given macros to the manifest, replacing any existing macros
+        with the same unique IDs.
+        """
+        self.macros.update(new_macros)
+        self.macro_cache.clear()
+
     def build_flat_graph(self):
         """This attribute is used in context.common by each node, so we want to
         only build it once and avoid any concurrency issues around it.
@@ -368,6 +418,20 @@ class Manifest:
 
     def get_materialization_macro(
         self, project_name: str, materialization_name: str, adapter_type: str
+    ):
+        # the result only depends on the macros, and this is called for every
+        # node that runs.
+        return self.macro_cache.lookup(
+            self.macros,
+            ('materialization', project_name, materialization_name,
+             adapter_type),
+            lambda: self._find_materialization_macro(
+                project_name, materialization_name, adapter_type
+            ),
+        )
+
+    def _find_materialization_macro(
+        self, project_name: str, materialization_name: str, adapter_type: str
     ):
         adapter_macro_name, default_macro_name = [
             dbt.utils.get_materialization_macro_name(
@@ -516,8 +580,43 @@ class Manifest:
             omit_none=omit_none, validate=validate
         )
 
-    def write(self, path):
-        self.writable_manifest().write(path)
+    def write(self, path, linker=None, compression=None):
+        """Write the manifest to path as JSON. The document is the same as
+        to_dict(omit_none=False), but nodes, macros, docs and files are
+        serialized and written one at a time instead of building it all in
+        memory first.
+
+        If a linker for this manifest is given, the child and parent maps come
+        from its graph. Otherwise they are built from the nodes.
+        """
+        if linker is None:
+            child_map, parent_map = build_edges(self.nodes.values())
+        else:
+            child_map, parent_map = linker.edge_maps()
+
+        # like Writable.write(), keep keys with null values
+        def streamed(values):
+            return StreamedObject(
+                (k, v.to_dict(omit_none=False)) for k, v in values.items()
+            )
+
+        # in the same RFC3339 form hologram writes datetimes in
+        generated_at = self.generated_at.isoformat()
+        if self.generated_at.tzinfo is None:
+            generated_at += 'Z'
+
+        document = StreamedObject([
+            ('nodes', streamed(self.nodes)),
+            ('macros', streamed(self.macros)),
+            ('docs', streamed(self.docs)),
+            ('disabled', [n.to_dict(omit_none=False) for n in self.disabled]),
+            ('generated_at', generated_at),
+            ('parent_map', parent_map),
+            ('child_map', child_map),
+            ('metadata', self.metadata.to_dict(omit_none=False)),
+            ('files', streamed(self.files)),
+        ])
+        write_json_stream(path, document, compression=compression)
 
     def expect(self, unique_id: str) -> CompileResultNode:
         if unique_id not in self.nodes:
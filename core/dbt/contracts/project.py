@@ -154,6 +154,7 @@ class Project(HyphenatedJsonSchemaMixin, Replaceable):
     snapshots: Dict[str, Any] = field(default_factory=dict)
     packages: List[PackageSpec] = field(default_factory=list)
     query_comment: Optional[Union[str, NoValue]] = NoValue()
+    concurrency_limits: Dict[str, int] = field(default_factory=dict)
 
     @classmethod
     def from_dict(cls, data, validate=True):
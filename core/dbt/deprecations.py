@@ -96,6 +96,17 @@ class ColumnQuotingDeprecation(DBTDeprecation):
     '''
 
 
+class ProcessResultsDeprecation(DBTDeprecation):
+    _name = 'adapter-process-results'
+
+    _description = '''
+    The connection manager "{adapter}" overrides process_results. This is
+    slower than the default, because every row is converted to a dict, and it
+    will stop being called in a future version of dbt. Override convert_rows
+    and get_column_types instead.
+    '''.lstrip()
+
+
 _adapter_renamed_description = """\
 The adapter function `adapter.{old_name}` is deprecated and will be removed in
  a future release of dbt. Please use `adapter.{new_name}` instead.
@@ -136,6 +147,7 @@ deprecations_list: List[DBTDeprecation] = [
     MaterializationReturnDeprecation(),
     NotADictionaryDeprecation(),
     ColumnQuotingDeprecation(),
+    ProcessResultsDeprecation(),
 ]
 
 deprecations: Dict[str, DBTDeprecation] = {
@@ -361,6 +361,13 @@ def raise_database_error(msg, node=None) -> NoReturn:
     raise DatabaseException(msg, node)
 
 
+def raise_too_many_rows(max_rows) -> NoReturn:
+    raise_database_error(
+        'Query returned more than {} rows, the limit set with '
+        '--max-fetch-rows'.format(max_rows)
+    )
+
+
 def raise_dependency_error(msg) -> NoReturn:
     raise DependencyException(msg)
 
@@ -1,6 +1,6 @@
 import os
 import multiprocessing
-from typing import Optional
+from typing import FrozenSet, Optional
 # initially all flags are set to None, the on-load call of reset() will set
 # them for their first time.
 STRICT_MODE = None
@@ -10,6 +10,16 @@ WARN_ERROR = None
 TEST_NEW_PARSER = None
 WRITE_JSON = None
 PARTIAL_PARSE = None
+# the target subdirectories ('compiled', 'run') that dbt should not write to
+SKIP_ARTIFACTS: FrozenSet[str] = frozenset()
+# how to compress the manifest ('gzip', 'zstd'), or None to write plain json
+MANIFEST_COMPRESSION: Optional[str] = None
+# run queries as async jobs on an event loop, where the adapter supports it
+ASYNC_QUERIES = None
+# adjust how many nodes run at once from query latency, up to --threads
+ADAPTIVE_CONCURRENCY = None
+# fail statements that fetch more than this many rows, or None for no limit
+MAX_FETCH_ROWS: Optional[int] = None
 
 
 def env_set_truthy(key: str) -> Optional[str]:
@@ -42,7 +52,9 @@ MP_CONTEXT = _get_context()
 
 def reset():
     global STRICT_MODE, FULL_REFRESH, USE_CACHE, WARN_ERROR, TEST_NEW_PARSER, \
-        WRITE_JSON, PARTIAL_PARSE, MP_CONTEXT
+        WRITE_JSON, PARTIAL_PARSE, MP_CONTEXT, SKIP_ARTIFACTS, \
+        MANIFEST_COMPRESSION, ASYNC_QUERIES, ADAPTIVE_CONCURRENCY, \
+        MAX_FETCH_ROWS
 
     STRICT_MODE = False
     FULL_REFRESH = False
@@ -52,11 +64,18 @@ def reset():
     WRITE_JSON = True
     PARTIAL_PARSE = False
     MP_CONTEXT = _get_context()
+    SKIP_ARTIFACTS = frozenset()
+    MANIFEST_COMPRESSION = None
+    ASYNC_QUERIES = False
+    ADAPTIVE_CONCURRENCY = False
+    MAX_FETCH_ROWS = None
 
 
 def set_from_args(args):
     global STRICT_MODE, FULL_REFRESH, USE_CACHE, WARN_ERROR, TEST_NEW_PARSER, \
-        WRITE_JSON, PARTIAL_PARSE, MP_CONTEXT
+        WRITE_JSON, PARTIAL_PARSE, MP_CONTEXT, SKIP_ARTIFACTS, \
+        MANIFEST_COMPRESSION, ASYNC_QUERIES, ADAPTIVE_CONCURRENCY, \
+        MAX_FETCH_ROWS
 
     USE_CACHE = getattr(args, 'use_cache', USE_CACHE)
 
@@ -71,6 +90,13 @@ def set_from_args(args):
     WRITE_JSON = getattr(args, 'write_json', WRITE_JSON)
     PARTIAL_PARSE = getattr(args, 'partial_parse', None)
     MP_CONTEXT = _get_context()
+    SKIP_ARTIFACTS = frozenset(getattr(args, 'skip_artifacts', None) or ())
+    MANIFEST_COMPRESSION = getattr(args, 'manifest_compression', None)
+    ASYNC_QUERIES = getattr(args, 'async_queries', ASYNC_QUERIES)
+    ADAPTIVE_CONCURRENCY = getattr(
+        args, 'adaptive_concurrency', ADAPTIVE_CONCURRENCY
+    )
+    MAX_FETCH_ROWS = getattr(args, 'max_fetch_rows', None)
 
 
 # initialize everything to the defaults on module load
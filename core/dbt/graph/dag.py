@@ -0,0 +1,289 @@
+from array import array
+from collections import deque
+from typing import (
+    Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+)
+
+import dbt.exceptions
+
+
+def _build_csr(
+    size: int, pairs: Sequence[Tuple[int, int]], key: int
+) -> Tuple[array, array]:
+    """Build compressed sparse row adjacency from (source, target) pairs. If
+    key is 0 the rows are sources (successors), if it's 1 they are targets
+    (predecessors). Pairs keep their relative order within each row.
+    """
+    value = 1 - key
+    offsets = array('i', bytes(4 * (size + 1)))
+    for pair in pairs:
+        offsets[pair[key] + 1] += 1
+    for idx in range(size):
+        offsets[idx + 1] += offsets[idx]
+
+    targets = array('i', bytes(4 * len(pairs)))
+    positions = offsets[:-1]
+    for pair in pairs:
+        row = pair[key]
+        targets[positions[row]] = pair[value]
+        positions[row] += 1
+    return offsets, targets
+
+
+class DAG:
+    """A compact, immutable directed graph of unique IDs.
+
+    Each node gets an integer index, and the edges are stored as compressed
+    sparse row arrays in both directions, so traversals don't pay for a dict
+    per node and per edge the way networkx graphs do. Cycles can be
+    represented (so they can be found and reported), but topological_order()
+    requires an acyclic graph.
+    """
+    def __init__(
+        self,
+        nodes: Iterable[str] = (),
+        edges: Iterable[Tuple[str, str]] = (),
+    ) -> None:
+        ids = list(dict.fromkeys(nodes))
+        index = {uid: idx for idx, uid in enumerate(ids)}
+        pairs: Dict[Tuple[int, int], None] = {}
+        for src, dst in edges:
+            for uid in (src, dst):
+                if uid not in index:
+                    index[uid] = len(ids)
+                    ids.append(uid)
+            pairs[(index[src], index[dst])] = None
+        self._setup(ids, index, list(pairs))
+
+    def _setup(
+        self,
+        ids: List[str],
+        index: Dict[str, int],
+        pairs: Sequence[Tuple[int, int]],
+    ) -> None:
+        self._ids = ids
+        self._index = index
+        self._succ_offsets, self._succ = _build_csr(len(ids), pairs, 0)
+        self._pred_offsets, self._pred = _build_csr(len(ids), pairs, 1)
+        self._topological_order: Optional[array] = None
+
+    @classmethod
+    def _from_pairs(
+        cls, ids: List[str], pairs: Sequence[Tuple[int, int]]
+    ) -> 'DAG':
+        """Build a graph from node IDs and unique pairs of indices into them.
+        """
+        graph = cls.__new__(cls)
+        index = {uid: idx for idx, uid in enumerate(ids)}
+        graph._setup(ids, index, pairs)
+        return graph
+
+    @classmethod
+    def from_networkx(cls, graph) -> 'DAG':
+        return cls(graph.nodes(), graph.edges())
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, uid) -> bool:
+        return uid in self._index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._ids)
+
+    def nodes(self) -> List[str]:
+        return list(self._ids)
+
+    def edges(self) -> List[Tuple[str, str]]:
+        ids = self._ids
+        offsets = self._succ_offsets
+        return [
+            (ids[src], ids[dst])
+            for src in range(len(ids))
+            for dst in self._succ[offsets[src]:offsets[src + 1]]
+        ]
+
+    def index(self, uid: str) -> int:
+        return self._index[uid]
+
+    def node_id(self, idx: int) -> str:
+        return self._ids[idx]
+
+    def successor_indices(self, idx: int) -> array:
+        return self._succ[self._succ_offsets[idx]:self._succ_offsets[idx + 1]]
+
+    def predecessor_indices(self, idx: int) -> array:
+        return self._pred[self._pred_offsets[idx]:self._pred_offsets[idx + 1]]
+
+    def successors(self, uid: str) -> List[str]:
+        ids = self._ids
+        return [ids[i] for i in self.successor_indices(self._index[uid])]
+
+    def predecessors(self, uid: str) -> List[str]:
+        ids = self._ids
+        return [ids[i] for i in self.predecessor_indices(self._index[uid])]
+
+    def in_degrees(self) -> array:
+        """Return a new array of each node's in-degree, by node index."""
+        offsets = self._pred_offsets
+        return array('i', (
+            offsets[idx + 1] - offsets[idx] for idx in range(len(self._ids))
+        ))
+
+    def _reachable(
+        self, uids: Iterable[str], offsets: array, targets: array
+    ) -> Set[str]:
+        seen = bytearray(len(self._ids))
+        stack: List[int] = []
+        for uid in uids:
+            idx = self._index[uid]
+            stack.extend(targets[offsets[idx]:offsets[idx + 1]])
+        found = []
+        while stack:
+            idx = stack.pop()
+            if seen[idx]:
+                continue
+            seen[idx] = 1
+            found.append(idx)
+            stack.extend(targets[offsets[idx]:offsets[idx + 1]])
+        ids = self._ids
+        return {ids[idx] for idx in found}
+
+    def descendants(self, uids: Iterable[str]) -> Set[str]:
+        """Return every node reachable from any of the given nodes. The given
+        nodes are only included if they are reachable from one another.
+        """
+        return self._reachable(uids, self._succ_offsets, self._succ)
+
+    def ancestors(self, uids: Iterable[str]) -> Set[str]:
+        """Return every node that can reach any of the given nodes. The given
+        nodes are only included if they are reachable from one another.
+        """
+        return self._reachable(uids, self._pred_offsets, self._pred)
+
+    def _selected_indices(self, uids: Iterable[str]) -> List[int]:
+        keep = bytearray(len(self._ids))
+        for uid in uids:
+            idx = self._index.get(uid)
+            if idx is not None:
+                keep[idx] = 1
+        return [idx for idx in range(len(self._ids)) if keep[idx]]
+
+    def subgraph(self, uids: Iterable[str]) -> 'DAG':
+        """Return the graph induced by the given nodes. Nodes that aren't in
+        the graph are ignored.
+        """
+        kept = self._selected_indices(uids)
+        new_index = {old: new for new, old in enumerate(kept)}
+        pairs = [
+            (new_index[old], new_index[dst])
+            for old in kept
+            for dst in self.successor_indices(old)
+            if dst in new_index
+        ]
+        return self._from_pairs([self._ids[idx] for idx in kept], pairs)
+
+    def transitive_subgraph(self, uids: Iterable[str]) -> 'DAG':
+        """Return a graph of the given nodes where a node has an edge to
+        another if there is a path between them that only passes through
+        nodes that were left out. Reachability between the given nodes is
+        the same as in this graph. Nodes that aren't in the graph are ignored.
+        """
+        kept = self._selected_indices(uids)
+        new_index = {old: new for new, old in enumerate(kept)}
+        pairs: List[Tuple[int, int]] = []
+        for old in kept:
+            seen: Set[int] = set()
+            stack = list(self.successor_indices(old))
+            while stack:
+                idx = stack.pop()
+                if idx in seen:
+                    continue
+                seen.add(idx)
+                if idx in new_index:
+                    pairs.append((new_index[old], new_index[idx]))
+                else:
+                    stack.extend(self.successor_indices(idx))
+        return self._from_pairs([self._ids[idx] for idx in kept], pairs)
+
+    def topological_index_order(self) -> array:
+        """Return the node indices in topological order. Ties are broken by
+        the order nodes were added in.
+        """
+        if self._topological_order is not None:
+            return self._topological_order
+
+        in_degrees = self.in_degrees()
+        ready = deque(
+            idx for idx in range(len(self._ids)) if in_degrees[idx] == 0
+        )
+        order = array('i')
+        while ready:
+            idx = ready.popleft()
+            order.append(idx)
+            for child in self.successor_indices(idx):
+                in_degrees[child] -= 1
+                if in_degrees[child] == 0:
+                    ready.append(child)
+
+        if len(order) != len(self._ids):
+            cycle = self.find_cycle() or []
+            raise dbt.exceptions.InternalException(
+                'Graph has a cycle: {}'.format(' --> '.join(cycle))
+            )
+        self._topological_order = order
+        return order
+
+    def topological_order(self) -> List[str]:
+        ids = self._ids
+        return [ids[idx] for idx in self.topological_index_order()]
+
+    def _shortest_path(self, src: int, dst: int) -> List[int]:
+        parents = {src: src}
+        queue = deque([src])
+        while queue:
+            idx = queue.popleft()
+            if idx == dst:
+                break
+            for child in self.successor_indices(idx):
+                if child not in parents:
+                    parents[child] = idx
+                    queue.append(child)
+        path = [dst]
+        while path[-1] != src:
+            path.append(parents[path[-1]])
+        path.reverse()
+        return path
+
+    def find_cycle(self) -> Optional[List[str]]:
+        """Find a cycle in the graph with a depth-first search that stops at
+        the first back edge, so it's linear in the size of the graph. Return
+        the nodes along the cycle, or None if there isn't one.
+        """
+        done = bytearray(len(self._ids))
+        for start in range(len(self._ids)):
+            if done[start]:
+                continue
+            # the current path from start, and an iterator over the
+            # successors of each node on it that haven't been visited yet.
+            path = [start]
+            on_path = {start}
+            stack = [iter(self.successor_indices(start))]
+            while stack:
+                for child in stack[-1]:
+                    if child in on_path:
+                        # the path from child back around may be long, report
+                        # the shortest one.
+                        cycle = self._shortest_path(child, path[-1])
+                        return [self._ids[idx] for idx in cycle]
+                    if not done[child]:
+                        path.append(child)
+                        on_path.add(child)
+                        stack.append(iter(self.successor_indices(child)))
+                        break
+                else:
+                    stack.pop()
+                    idx = path.pop()
+                    on_path.remove(idx)
+                    done[idx] = 1
+        return None
@@ -1,7 +1,6 @@
 from enum import Enum
 
-import networkx as nx  # type: ignore
-
+from dbt.graph.dag import DAG
 from dbt.logger import GLOBAL_LOGGER as logger
 from dbt.utils import is_enabled, coalesce
 from dbt.node_types import NodeType
@@ -243,33 +242,32 @@ class MultiSelector:
 
 
 class Graph:
-    """A wrapper around the networkx graph that understands SelectionCriteria
-    and how they interact with the graph.
+    """A wrapper around the dependency graph that understands
+    SelectionCriteria and how they interact with the graph.
     """
     def __init__(self, graph):
-        self.graph = graph
+        if isinstance(graph, Graph):
+            graph = graph.graph
+        elif not isinstance(graph, DAG):
+            # a networkx graph
+            graph = DAG.from_networkx(graph)
+        self.graph: DAG = graph
 
     def nodes(self):
-        return set(self.graph.nodes())
+        return set(self.graph)
 
     def __iter__(self):
-        return iter(self.graph.nodes())
+        return iter(self.graph)
 
     def select_childrens_parents(self, selected):
         ancestors_for = self.select_children(selected) | selected
         return self.select_parents(ancestors_for) | ancestors_for
 
     def select_children(self, selected):
-        descendants = set()
-        for node in selected:
-            descendants.update(nx.descendants(self.graph, node))
-        return descendants
+        return self.graph.descendants(selected)
 
     def select_parents(self, selected):
-        ancestors = set()
-        for node in selected:
-            ancestors.update(nx.ancestors(self.graph, node))
-        return ancestors
+        return self.graph.ancestors(selected)
 
     def select_successors(self, selected):
         successors = set()
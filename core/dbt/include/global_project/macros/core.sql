@@ -1,4 +1,4 @@
-{% macro statement(name=None, fetch_result=False, auto_begin=True) -%}
+{% macro statement(name=None, fetch_result=False, auto_begin=True, columnar=False) -%}
   {%- if execute: -%}
     {%- set sql = caller() -%}
 
@@ -7,7 +7,11 @@
       {{ write(sql) }}
     {%- endif -%}
 
-    {%- set status, res = adapter.execute(sql, auto_begin=auto_begin, fetch=fetch_result) -%}
+    {%- if columnar -%}
+      {%- set status, res = adapter.execute(sql, auto_begin=auto_begin, fetch=fetch_result, columnar=true) -%}
+    {%- else -%}
+      {%- set status, res = adapter.execute(sql, auto_begin=auto_begin, fetch=fetch_result) -%}
+    {%- endif -%}
     {%- if name is not none -%}
       {{ store_result(name, status=status, agate_table=res) }}
     {%- endif -%}
@@ -1,6 +1,6 @@
 
-{% macro run_query(sql) %}
-  {% call statement("run_query_statement", fetch_result=true, auto_begin=false) %}
+{% macro run_query(sql, columnar=false) %}
+  {% call statement("run_query_statement", fetch_result=true, auto_begin=false, columnar=columnar) %}
     {{ sql }}
   {% endcall %}
 
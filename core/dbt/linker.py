@@ -1,10 +1,14 @@
+import heapq
+import time
+from array import array
 from queue import PriorityQueue
-from typing import Iterable, Set, Optional
+from typing import Dict, Iterable, List, Set, Optional, Tuple
 import networkx as nx  # type: ignore
 import threading
 
 
 from dbt.contracts.graph.manifest import Manifest
+from dbt.graph.dag import DAG
 from dbt.node_types import NodeType
 
 
@@ -24,30 +28,82 @@ def is_ephemeral_dependency(node):
             node.get_materialization() == 'ephemeral')
 
 
+def concurrency_groups(node) -> List[str]:
+    """Return the concurrency groups a node belongs to: the ones named by its
+    `concurrency_group` config (a name or a list of names), plus
+    'schema:<schema>' and 'tag:<tag>' for its schema and each of its tags.
+    """
+    groups: List[str] = []
+    config = getattr(node, 'config', None)
+    if config is not None:
+        configured = config.get('concurrency_group')
+        if isinstance(configured, str):
+            groups.append(configured)
+        elif configured:
+            groups.extend(configured)
+    schema = getattr(node, 'schema', None)
+    if schema:
+        groups.append('schema:{}'.format(schema))
+    groups.extend('tag:{}'.format(tag) for tag in getattr(node, 'tags', ()))
+    return groups
+
+
+class GroupWait:
+    """How many times nodes in a concurrency group were held back because the
+    group was full, and for how long in total.
+    """
+    def __init__(self) -> None:
+        self.holds = 0
+        self.seconds = 0.0
+
+
 class GraphQueue:
     """A fancy queue that is backed by the dependency graph.
-    Note: this will mutate input!
 
     This queue is thread-safe for `mark_done` calls, though you must ensure
     that separate threads do not call `.empty()` or `__len__()` and `.get()` at
     the same time, as there is an unlocked race!
+
+    If concurrency_limits are given, at most that many nodes in each named
+    concurrency group (see `concurrency_groups`) are handed out at once. A
+    ready node whose group is full is held back until a node in the group is
+    done, and other ready nodes are handed out meanwhile.
     """
-    def __init__(self, graph, manifest):
+    def __init__(
+        self,
+        graph: DAG,
+        manifest,
+        concurrency_limits: Optional[Dict[str, int]] = None,
+    ):
         self.graph = graph
         self.manifest = manifest
+        self.concurrency_limits = concurrency_limits or {}
+        # the limited groups of each node that has been handed out
+        self._node_groups: Dict[str, List[str]] = {}
+        # the number of handed out nodes in each limited group
+        self._group_running: Dict[str, int] = {}
+        # nodes held back by a full group as (score, node ID) heaps, by group
+        self._held: Dict[str, List[Tuple[int, str]]] = {}
+        # the group holding each held node, and when it was held
+        self._held_since: Dict[str, Tuple[str, float]] = {}
+        self.group_waits: Dict[str, GroupWait] = {}
         # store the queue as a priority queue.
-        self.inner = PriorityQueue()
+        self.inner: 'PriorityQueue[Tuple[int, str]]' = PriorityQueue()
         # things that have been popped off the queue but not finished
         # and worker thread reservations
-        self.in_progress = set()
+        self.in_progress: Set[str] = set()
         # things that are in the queue
-        self.queued = set()
+        self.queued: Set[str] = set()
         # this lock controls most things
         self.lock = threading.Lock()
+        # the number of unfinished parents of each node, by graph index.
+        self._in_degrees: array = graph.in_degrees()
+        # the number of nodes that have not been marked done
+        self._remaining = len(graph)
         # store the 'score' of each node as a number. Lower is higher priority.
         self._scores = self._calculate_scores()
         # populate the initial queue
-        self._find_new_additions()
+        self._find_new_additions(range(len(graph)))
 
     def _include_in_cost(self, node_id):
         node = self.manifest.expect(node_id)
@@ -65,22 +121,40 @@ class GraphQueue:
         The score is stored as a negative number because the internal
         PriorityQueue picks lowest values first.
 
-        We could do this in one pass over the graph instead of len(self.graph)
-        passes but this is easy. For large graphs this may hurt performance.
+        This walks the graph once in reverse topological order, building each
+        node's set of blocking descendants as a bitmask from its children's.
+        A child's mask is dropped once all of its parents have used it.
 
         This operates on the graph, so it would require a lock if called from
         outside __init__.
 
-        :return Dict[str, int]: The score dict, mapping unique IDs to integer
-            scores. Lower scores are higher priority.
+        :return Dict[int, int]: The score dict, mapping graph indices to
+            integer scores. Lower scores are higher priority.
         """
+        graph = self.graph
+        order = graph.topological_index_order()
+        # each blocking node gets a bit, numbered by reverse topological
+        # position so a node's descendants all fit in fewer bits than its own
+        # position does.
+        bits = {}
+        for pos, idx in enumerate(order):
+            if self._include_in_cost(graph.node_id(idx)):
+                bits[idx] = 1 << (len(order) - 1 - pos)
+            else:
+                bits[idx] = 0
+        unused_parents = graph.in_degrees()
+        masks: Dict[int, int] = {}
         scores = {}
-        for node in self.graph.nodes():
-            score = -1 * len([
-                d for d in nx.descendants(self.graph, node)
-                if self._include_in_cost(d)
-            ])
-            scores[node] = score
+        for idx in reversed(order):
+            mask = 0
+            for child in graph.successor_indices(idx):
+                mask |= masks[child] | bits[child]
+                unused_parents[child] -= 1
+                if unused_parents[child] == 0:
+                    del masks[child]
+            if unused_parents[idx] > 0:
+                masks[idx] = mask
+            scores[idx] = -1 * bin(mask).count('1')
         return scores
 
     def get(self, block=True, timeout=None):
@@ -96,11 +170,72 @@ class GraphQueue:
         See `queue.PriorityQueue` for more information on `get()` behavior and
         exceptions.
         """
-        _, node_id = self.inner.get(block=block, timeout=timeout)
-        with self.lock:
-            self._mark_in_progress(node_id)
+        while True:
+            item = self.inner.get(block=block, timeout=timeout)
+            node_id = item[1]
+            with self.lock:
+                full_group = self._full_group(node_id)
+                if full_group is None:
+                    self._mark_in_progress(node_id)
+                    break
+                self._hold(full_group, item)
+                # it'll be put on the inner queue again, keep join() balanced.
+                self.inner.task_done()
         return self.manifest.expect(node_id)
 
+    def _limited_groups(self, node_id) -> List[str]:
+        if node_id not in self._node_groups:
+            self._node_groups[node_id] = [
+                group
+                for group in concurrency_groups(self.manifest.expect(node_id))
+                if group in self.concurrency_limits
+            ]
+        return self._node_groups[node_id]
+
+    def _full_group(self, node_id) -> Optional[str]:
+        """Return a limited group of the node that is running as many nodes as
+        it may, or None if the node can run now.
+
+        Callers must hold the lock.
+        """
+        if not self.concurrency_limits:
+            return None
+        for group in self._limited_groups(node_id):
+            running = self._group_running.get(group, 0)
+            if running >= self.concurrency_limits[group]:
+                return group
+        return None
+
+    def _hold(self, group, item):
+        """Hold a node back until a slot in the group frees up.
+
+        Callers must hold the lock.
+        """
+        heapq.heappush(self._held.setdefault(group, []), item)
+        self._held_since[item[1]] = (group, time.time())
+
+    def _release_groups(self, node_id):
+        """Free the node's slots in its groups, and put held nodes back on the
+        inner queue to take them. Held nodes that another full group still
+        blocks move to that group, until one that can run takes the slot.
+
+        Callers must hold the lock.
+        """
+        for group in self._node_groups.pop(node_id, ()):
+            self._group_running[group] -= 1
+            held = self._held.get(group)
+            while held:
+                item = heapq.heappop(held)
+                _, held_at = self._held_since.pop(item[1])
+                wait = self.group_waits.setdefault(group, GroupWait())
+                wait.holds += 1
+                wait.seconds += time.time() - held_at
+                full_group = self._full_group(item[1])
+                if full_group is None:
+                    self.inner.put(item)
+                    break
+                self._hold(full_group, item)
+
     def __len__(self):
         """The length of the queue is the number of tasks left for the queue to
         give out, regardless of where they are. Incomplete tasks are not part
@@ -109,7 +244,7 @@ class GraphQueue:
         This takes the lock.
         """
         with self.lock:
-            return len(self.graph) - len(self.in_progress)
+            return self._remaining - len(self.in_progress)
 
     def empty(self):
         """The graph queue is 'empty' if it all remaining nodes in the graph
@@ -130,15 +265,18 @@ class GraphQueue:
         """
         return node in self.in_progress or node in self.queued
 
-    def _find_new_additions(self):
-        """Find any nodes in the graph that need to be added to the internal
-        queue and add them.
+    def _find_new_additions(self, candidates: Iterable[int]):
+        """Add any of the candidate nodes (by graph index) that have no
+        unfinished parents to the internal queue.
 
         Callers must hold the lock.
         """
-        for node, in_degree in self.graph.in_degree():
-            if not self._already_known(node) and in_degree == 0:
-                self.inner.put((self._scores[node], node))
+        for idx in candidates:
+            if self._in_degrees[idx] != 0:
+                continue
+            node = self.graph.node_id(idx)
+            if not self._already_known(node):
+                self.inner.put((self._scores[idx], node))
                 self.queued.add(node)
 
     def mark_done(self, node_id):
@@ -150,8 +288,12 @@ class GraphQueue:
         """
         with self.lock:
             self.in_progress.remove(node_id)
-            self.graph.remove_node(node_id)
-            self._find_new_additions()
+            self._remaining -= 1
+            self._release_groups(node_id)
+            children = self.graph.successor_indices(self.graph.index(node_id))
+            for child in children:
+                self._in_degrees[child] -= 1
+            self._find_new_additions(children)
             self.inner.task_done()
 
     def _mark_in_progress(self, node_id):
@@ -163,6 +305,11 @@ class GraphQueue:
         """
         self.queued.remove(node_id)
         self.in_progress.add(node_id)
+        if self.concurrency_limits:
+            for group in self._limited_groups(node_id):
+                self._group_running[group] = (
+                    self._group_running.get(group, 0) + 1
+                )
 
     def join(self):
         """Join the queue. Blocks until all tasks are marked as done.
@@ -176,7 +323,19 @@ class Linker:
     def __init__(self, data=None):
         if data is None:
             data = {}
-        self.graph = nx.DiGraph(**data)
+        # graph attributes, only used when writing the graph out
+        self.data = data
+        # nodes and edges are collected in insertion order, and the compact
+        # graph is built from them the first time it's needed.
+        self._nodes: Dict[str, None] = {}
+        self._edges: Dict[Tuple[str, str], None] = {}
+        self._graph: Optional[DAG] = None
+
+    @property
+    def graph(self) -> DAG:
+        if self._graph is None:
+            self._graph = DAG(self._nodes, self._edges)
+        return self._graph
 
     def edges(self):
         return self.graph.edges()
@@ -185,53 +344,46 @@ class Linker:
         return self.graph.nodes()
 
     def find_cycles(self):
-        # There's a networkx find_cycle function, but there's a bug in the
-        # nx 1.11 release that prevents us from using it. We should use that
-        # function when we upgrade to 2.X. More info:
-        #     https://github.com/networkx/networkx/pull/2473
-        cycles = list(nx.simple_cycles(self.graph))
+        """Return one cycle in the graph as a string of unique IDs joined by
+        arrows, or None if the graph has no cycles.
+        """
+        cycle = self.graph.find_cycle()
 
-        if len(cycles) > 0:
-            cycle_nodes = cycles[0]
-            cycle_nodes.append(cycle_nodes[0])
-            return " --> ".join(cycle_nodes)
+        if cycle is not None:
+            cycle.append(cycle[0])
+            return " --> ".join(cycle)
 
         return None
 
-    def build_subset_graph(self, include_nodes: Iterable[str]):
-        """Create and return a new graph that is a shallow copy of the graph,
-        but with only the nodes in include_nodes. Transitive edges across
-        removed nodes are preserved as explicit new edges.
+    def build_subset_graph(self, include_nodes: Iterable[str]) -> DAG:
+        """Create and return a new graph with only the nodes in include_nodes.
+        Transitive edges across removed nodes are preserved as explicit new
+        edges.
         """
-        new_graph = nx.algorithms.transitive_closure(self.graph)
-
         include_nodes = set(include_nodes)
 
-        for node in self.graph.nodes():
-            if node not in include_nodes:
-                new_graph.remove_node(node)
-
         for node in include_nodes:
-            if node not in new_graph:
+            if node not in self.graph:
                 raise RuntimeError(
                     "Couldn't find model '{}' -- does it exist or is "
                     "it disabled?".format(node)
                 )
-        return new_graph
+        return self.graph.transitive_subgraph(include_nodes)
 
     def as_graph_queue(
-        self, manifest: Manifest, limit_to: Optional[Iterable[str]] = None
+        self,
+        manifest: Manifest,
+        limit_to: Optional[Iterable[str]] = None,
+        concurrency_limits: Optional[Dict[str, int]] = None,
     ) -> GraphQueue:
         """Returns a queue over nodes in the graph that tracks progress of
         dependecies.
         """
         if limit_to is None:
-            graph_nodes = self.graph.nodes()
+            new_graph = self.graph
         else:
-            graph_nodes = limit_to
-
-        new_graph = self.build_subset_graph(graph_nodes)
-        return GraphQueue(new_graph, manifest)
+            new_graph = self.build_subset_graph(limit_to)
+        return GraphQueue(new_graph, manifest, concurrency_limits)
 
     def sorted_ephemeral_ancestors(
         self, manifest: Manifest, unique_id: str
@@ -263,34 +415,64 @@ class Linker:
 
         ephemeral_graph = self.build_subset_graph(ephemerals)
         # we can just topo sort this because we know there are no cycles.
-        return nx.topological_sort(ephemeral_graph)
+        return ephemeral_graph.topological_order()
 
     def get_dependent_nodes(self, node):
-        return nx.descendants(self.graph, node)
+        return self.graph.descendants([node])
+
+    def edge_maps(self) -> Tuple[Dict[str, List[str]], Dict[str, List[str]]]:
+        """Return the child map and parent map of the graph: each node's
+        unique ID mapped to the sorted unique IDs of its children/parents.
+        """
+        child_map = {
+            node: sorted(self.graph.successors(node))
+            for node in self.graph.nodes()
+        }
+        parent_map = {
+            node: sorted(self.graph.predecessors(node))
+            for node in self.graph.nodes()
+        }
+        return child_map, parent_map
 
     def dependency(self, node1, node2):
         "indicate that node1 depends on node2"
-        self.graph.add_node(node1)
-        self.graph.add_node(node2)
-        self.graph.add_edge(node2, node1)
+        self._nodes[node1] = None
+        self._nodes[node2] = None
+        self._edges[(node2, node1)] = None
+        self._graph = None
 
     def add_node(self, node):
-        self.graph.add_node(node)
+        self._nodes[node] = None
+        self._graph = None
 
     def remove_node(self, node):
-        children = nx.descendants(self.graph, node)
-        self.graph.remove_node(node)
+        children = self.graph.descendants([node])
+        del self._nodes[node]
+        self._edges = {
+            edge: None for edge in self._edges if node not in edge
+        }
+        self._graph = None
         return children
 
     def write_graph(self, outfile, manifest):
         """Write the graph to a gpickle file. Before doing so, serialize and
         include all nodes in their corresponding graph entries.
         """
-        out_graph = _updated_graph(self.graph, manifest)
+        out_graph = _updated_graph(self.to_networkx(), manifest)
         nx.write_gpickle(out_graph, outfile)
 
     def read_graph(self, infile):
-        self.graph = nx.read_gpickle(infile)
+        graph = nx.read_gpickle(infile)
+        self.data = dict(graph.graph)
+        self._nodes = dict.fromkeys(graph.nodes())
+        self._edges = dict.fromkeys(graph.edges())
+        self._graph = None
+
+    def to_networkx(self):
+        graph = nx.DiGraph(**self.data)
+        graph.add_nodes_from(self.graph.nodes())
+        graph.add_edges_from(self.graph.edges())
+        return graph
 
 
 def _updated_graph(graph, manifest):
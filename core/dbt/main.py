@@ -203,6 +203,18 @@ def run_from_args(parsed):
     return task, results
 
 
+def _non_negative_int(value):
+    try:
+        parsed = int(value)
+    except ValueError:
+        parsed = -1
+    if parsed < 0:
+        raise argparse.ArgumentTypeError(
+            "expected a non-negative integer, got {}".format(value)
+        )
+    return parsed
+
+
 def _build_base_subparser():
     base_subparser = argparse.ArgumentParser(add_help=False)
 
@@ -752,7 +764,66 @@ def parse_args(args, cls=DBTArgumentParser):
         action="store_false",
         dest="write_json",
         help="""
-        If set, skip writing the manifest and run_results.json files to disk
+        If set, skip writing the manifest, run_results.json and
+        run_results.jsonl files to disk
+        """,
+    )
+
+    p.add_argument(
+        "--no-write-artifacts",
+        action="append",
+        dest="skip_artifacts",
+        choices=["compiled", "run"],
+        metavar="SUBDIRECTORY",
+        help="""
+        If set, skip writing SQL files to the given subdirectory of the target
+        path ('compiled' or 'run'). May be passed more than once.
+        """,
+    )
+
+    p.add_argument(
+        "--manifest-compression",
+        choices=["gzip", "zstd"],
+        default=None,
+        help="""
+        If set, compress the manifest with the given method. The manifest is
+        written to manifest.json.gz or manifest.json.zst instead of
+        manifest.json. The 'zstd' method requires the zstandard package.
+        """,
+    )
+
+    p.add_argument(
+        "--async-queries",
+        action="store_true",
+        help="""
+        If set, and the adapter can run queries as async jobs, submit queries
+        for tests as jobs and wait for them on one event loop. A test only
+        uses a thread while it submits, polls or fetches its job, not while
+        the job runs. --threads still limits how many nodes run at once, and
+        the size of the thread pool. Requires Python 3.7 or newer.
+        """,
+    )
+
+    p.add_argument(
+        "--max-fetch-rows",
+        type=_non_negative_int,
+        default=None,
+        metavar="ROWS",
+        help="""
+        If set, fail any statement whose fetched results have more than this
+        many rows. Rows are fetched in batches, but every fetched row is still
+        kept in memory, so this caps how large a result can get rather than
+        reducing the memory a result takes up.
+        """,
+    )
+
+    p.add_argument(
+        "--adaptive-concurrency",
+        action="store_true",
+        help="""
+        If set, adjust how many nodes run at once as the run goes, backing off
+        when queries slow down or wait in the warehouse's queue and ramping up
+        while they don't. --threads is the most that will run at once.
         """,
     )
 
@@ -97,6 +97,26 @@ class BaseRunner:
 
         return result
 
+    def supports_async(self) -> bool:
+        """Whether this node can be run on an event loop with
+        run_with_hooks_async(), so it doesn't need a thread of its own.
+        """
+        return False
+
+    async def run_with_hooks_async(self, manifest):
+        if self.skip:
+            return self.on_skip()
+
+        if not self.node.is_ephemeral_model:
+            self.before_execute()
+
+        result = await self.safe_run_async(manifest)
+
+        if not self.node.is_ephemeral_model:
+            self.after_execute(result)
+
+        return result
+
     def _build_run_result(self, node, start_time, error, status, timing_info,
                           skip=False, fail=None, warn=None, agate_table=None):
         execution_time = time.time() - start_time
@@ -145,15 +165,18 @@ class BaseRunner:
             agate_table=result.agate_table,
         )
 
+    def _compile_with_timing(self, manifest, ctx):
+        with collect_timing_info('compile') as timing_info:
+            # if we fail here, we still have a compiled node to return
+            # this has the benefit of showing a build path for the errant
+            # model
+            ctx.node = self.compile(manifest)
+        ctx.timing.append(timing_info)
+
     def compile_and_execute(self, manifest, ctx):
         result = None
         with self.adapter.connection_for(self.node):
-            with collect_timing_info('compile') as timing_info:
-                # if we fail here, we still have a compiled node to return
-                # this has the benefit of showing a build path for the errant
-                # model
-                ctx.node = self.compile(manifest)
-            ctx.timing.append(timing_info)
+            self._compile_with_timing(manifest, ctx)
 
             # for ephemeral nodes, we only want to compile, not run
             if not ctx.node.is_ephemeral_model:
@@ -165,6 +188,20 @@ class BaseRunner:
 
         return result
 
+    async def compile_and_execute_async(self, manifest, ctx):
+        result = None
+        with self.adapter.connection_for(self.node):
+            self._compile_with_timing(manifest, ctx)
+
+            if not ctx.node.is_ephemeral_model:
+                with collect_timing_info('execute') as timing_info:
+                    result = await self.execute_async(ctx.node, manifest)
+                    ctx.node = result.node
+
+                ctx.timing.append(timing_info)
+
+        return result
+
     def _handle_catchable_exception(self, e, ctx):
         if e.node is None:
             e.node = ctx.node
@@ -226,6 +263,27 @@ class BaseRunner:
             if exc_str is not None and result.error is None:
                 error = exc_str
 
+        return self._safe_run_result(ctx, started, result, error)
+
+    async def safe_run_async(self, manifest):
+        started = time.time()
+        ctx = ExecutionContext(self.node)
+        error = None
+        result = None
+
+        try:
+            result = await self.compile_and_execute_async(manifest, ctx)
+        except Exception as e:
+            error = self.handle_exception(e, ctx)
+        finally:
+            exc_str = self._safe_release_connection()
+
+            if exc_str is not None and result.error is None:
+                error = exc_str
+
+        return self._safe_run_result(ctx, started, result, error)
+
+    def _safe_run_result(self, ctx, started, result, error):
         if error is not None:
             # we could include compile time for runtime errors here
             result = self.error_result(ctx.node, error, started, [])
@@ -259,6 +317,9 @@ class BaseRunner:
     def run(self, compiled_node, manifest):
         return self.execute(compiled_node, manifest)
 
+    async def execute_async(self, compiled_node, manifest):
+        raise NotImplementedException()
+
     def after_execute(self, result):
         raise NotImplementedException()
 
@@ -545,7 +606,9 @@ class TestRunner(CompileRunner):
             test.wrapped_sql,
             auto_begin=True,
             fetch=True)
+        return self._failed_rows(test, table)
 
+    def _failed_rows(self, test, table):
         num_rows = len(table.rows)
         if num_rows != 1:
             num_cols = len(table.columns)
@@ -561,6 +624,20 @@ class TestRunner(CompileRunner):
 
     def execute(self, test, manifest):
         failed_rows = self.execute_test(test)
+        return self._build_test_result(test, failed_rows)
+
+    def supports_async(self):
+        return self.adapter.supports_async_queries()
+
+    async def execute_async(self, test, manifest):
+        # tests only read, so they don't need a transaction
+        res, table = await self.adapter.execute_async(
+            test.wrapped_sql, fetch=True
+        )
+        failed_rows = self._failed_rows(test, table)
+        return self._build_test_result(test, failed_rows)
+
+    def _build_test_result(self, test, failed_rows):
         severity = test.config.severity.upper()
 
         if failed_rows == 0:
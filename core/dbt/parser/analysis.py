@@ -9,7 +9,8 @@ from dbt.parser.search import FilesystemSearcher, FileBlock
 class AnalysisParser(SimpleSQLParser[ParsedAnalysisNode]):
     def get_paths(self):
         return FilesystemSearcher(
-            self.project, self.project.analysis_paths, '.sql'
+            self.project, self.project.analysis_paths, '.sql',
+            self.file_index,
         )
 
     def parse_from_dict(self, dct, validate=True) -> ParsedAnalysisNode:
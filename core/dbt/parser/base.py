@@ -24,7 +24,7 @@ from dbt.include.global_project import PROJECT_NAME as GLOBAL_PROJECT_NAME
 from dbt.node_types import NodeType
 from dbt.source_config import SourceConfig
 from dbt.parser.results import ParseResult, ManifestNodes
-from dbt.parser.search import FileBlock
+from dbt.parser.search import FileBlock, FileIndex, ScandirFileIndex
 from dbt.clients.system import load_file_contents
 
 # internally, the parser may store a less-restrictive type that will be
@@ -42,9 +42,19 @@ ConfiguredBlockType = TypeVar('ConfiguredBlockType', bound=FileBlock)
 
 
 class BaseParser(Generic[FinalValue]):
-    def __init__(self, results: ParseResult, project: Project) -> None:
+    def __init__(
+        self,
+        results: ParseResult,
+        project: Project,
+        file_index: Optional[FileIndex] = None,
+    ) -> None:
         self.results = results
         self.project = project
+        # parsers of the same project should share one index, so the project
+        # directories are only scanned once.
+        if file_index is None:
+            file_index = ScandirFileIndex(project.project_root)
+        self.file_index = file_index
         # this should be a superset of [x.path for x in self.results.files]
         # because we fill it via search()
         self.searched: List[FilePath] = []
@@ -90,8 +100,9 @@ class Parser(BaseParser[FinalValue], Generic[FinalValue]):
         project: Project,
         root_project: RuntimeConfig,
         macro_manifest: Manifest,
+        file_index: Optional[FileIndex] = None,
     ) -> None:
-        super().__init__(results, project)
+        super().__init__(results, project, file_index)
         self.root_project = root_project
         self.macro_manifest = macro_manifest
 
@@ -106,8 +117,11 @@ class ConfiguredParser(
         project: Project,
         root_project: RuntimeConfig,
         macro_manifest: Manifest,
+        file_index: Optional[FileIndex] = None,
     ) -> None:
-        super().__init__(results, project, root_project, macro_manifest)
+        super().__init__(
+            results, project, root_project, macro_manifest, file_index
+        )
         self._get_schema_func: Optional[RelationUpdate] = None
         self._get_alias_func: Optional[RelationUpdate] = None
 
@@ -275,7 +289,17 @@ class ConfiguredParser(
         }
         dct.update(kwargs)
         try:
-            return self.parse_from_dict(dct)
+            if dbt.flags.STRICT_MODE:
+                return self.parse_from_dict(dct, validate=True)
+            # dbt built everything here but the config, so that's all that
+            # needs validating outside of strict mode. The config has to be
+            # validated before it's decoded, since decoding a badly typed
+            # config can fail with arbitrary errors.
+            parsed_node = self.parse_from_dict(
+                {**dct, 'config': {}}, validate=False
+            )
+            parsed_node.config = parsed_node.config.from_dict(dct['config'])
+            return parsed_node
         except ValidationError as exc:
             msg = validator_error_message(exc)
             # this is a bit silly, but build an UnparsedNode just for error
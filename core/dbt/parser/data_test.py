@@ -8,7 +8,8 @@ from dbt.utils import get_pseudo_test_path
 class DataTestParser(SimpleSQLParser[ParsedTestNode]):
     def get_paths(self):
         return FilesystemSearcher(
-            self.project, self.project.test_paths, '.sql'
+            self.project, self.project.test_paths, '.sql',
+            self.file_index,
         )
 
     def parse_from_dict(self, dct, validate=True) -> ParsedTestNode:
@@ -20,6 +20,7 @@ class DocumentationParser(Parser[ParsedDocumentation]):
             project=self.project,
             relative_dirs=self.project.docs_paths,
             extension='.md',
+            file_index=self.file_index,
         )
 
     @property
@@ -19,6 +19,7 @@ class MacroParser(BaseParser[ParsedMacro]):
             project=self.project,
             relative_dirs=self.project.macro_paths,
             extension='.sql',
+            file_index=self.file_index,
         )
 
     @property
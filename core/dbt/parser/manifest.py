@@ -2,7 +2,7 @@ import itertools
 import os
 import pickle
 from datetime import datetime
-from typing import Dict, Optional, Mapping, Callable, Any
+from typing import Dict, Optional, Mapping, Callable, Any, Tuple
 
 from dbt.include.global_project import PACKAGES
 import dbt.exceptions
@@ -23,7 +23,7 @@ from dbt.parser.macros import MacroParser
 from dbt.parser.models import ModelParser
 from dbt.parser.results import ParseResult
 from dbt.parser.schemas import SchemaParser
-from dbt.parser.search import FileBlock
+from dbt.parser.search import FileBlock, FileIndex, ScandirFileIndex
 from dbt.parser.seeds import SeedParser
 from dbt.parser.snapshots import SnapshotParser
 from dbt.parser.util import ParserUtils
@@ -31,6 +31,8 @@ from dbt.version import __version__
 
 
 PARTIAL_PARSE_FILE_NAME = "partial_parse.pickle"
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".dbt", "cache")
+CACHE_DIR = os.path.expanduser(os.getenv("DBT_CACHE_DIR", DEFAULT_CACHE_DIR))
 PARSING_STATE = DbtProcessState("parsing")
 DEFAULT_PARTIAL_PARSE = True
 
@@ -98,6 +100,13 @@ class ManifestLoader:
 
         self.results: ParseResult = make_parse_result(root_project, all_projects)
         self._loaded_file_cache: Dict[str, FileBlock] = {}
+        # one shared index of each project's files, for all of its parsers
+        self._file_indexes: Dict[str, FileIndex] = {}
+
+    def _get_file_index(self, project: Project) -> FileIndex:
+        if project.project_name not in self._file_indexes:
+            self._file_indexes[project.project_name] = ScandirFileIndex(project.project_root)
+        return self._file_indexes[project.project_name]
 
     def _load_macros(
         self, old_results: Optional[ParseResult], internal_manifest: Optional[Manifest] = None
@@ -110,7 +119,7 @@ class ManifestLoader:
 
         # TODO: go back to skipping the internal manifest during macro parsing
         for project in projects.values():
-            parser = MacroParser(self.results, project)
+            parser = MacroParser(self.results, project, self._get_file_index(project))
             for path in parser.search():
                 self.parse_with_cache(path, parser, old_results)
 
@@ -142,9 +151,10 @@ class ManifestLoader:
     def parse_project(
         self, project: Project, macro_manifest: Manifest, old_results: Optional[ParseResult]
     ) -> None:
+        file_index = self._get_file_index(project)
         parsers = []
         for cls in _parser_types:
-            parser = cls(self.results, project, self.root_project, macro_manifest)
+            parser = cls(self.results, project, self.root_project, macro_manifest, file_index)
             parsers.append(parser)
 
         # per-project cache.
@@ -175,6 +185,7 @@ class ManifestLoader:
             self.parse_project(project, macro_manifest, old_results)
 
     def write_parse_results(self):
+        self.results.prune_yaml_documents()
         path = os.path.join(self.root_project.target_path, PARTIAL_PARSE_FILE_NAME)
         make_directory(self.root_project.target_path)
         with open(path, "wb") as fp:
@@ -243,6 +254,10 @@ class ManifestLoader:
             try:
                 with open(path, "rb") as fp:
                     result: ParseResult = pickle.load(fp)
+                # loaded yaml only depends on the file contents, so it's still
+                # good when the rest of the cached results are not.
+                if result.dbt_version == __version__:
+                    self.results.yaml_documents.update(result.yaml_documents)
                 # keep this check inside the try/except in case something about
                 # the file has changed in weird ways, perhaps due to being a
                 # different version of dbt
@@ -295,12 +310,26 @@ class ManifestLoader:
             manifest.build_flat_graph()
             return manifest
 
+    def load_internal_macros(self) -> Manifest:
+        """Load the macros of the internal projects, using the user-level cache
+        of them if partial parsing is enabled.
+        """
+        if not self._partial_parse_enabled():
+            return self.load_only_macros()
+
+        path = internal_manifest_cache_path(self.all_projects)
+        manifest = read_internal_manifest(path)
+        if manifest is None:
+            manifest = self.load_only_macros()
+            write_internal_manifest(path, manifest)
+        return manifest
+
     @classmethod
     def load_internal(cls, root_config: RuntimeConfig) -> Manifest:
         with PARSING_STATE:
             projects = load_internal_projects(root_config)
             loader = cls(root_config, projects)
-            return loader.load_only_macros()
+            return loader.load_internal_macros()
 
 
 def _check_resource_uniqueness(manifest):
@@ -381,6 +410,67 @@ def load_internal_projects(config):
     return dict(_load_projects(config, internal_project_names()))
 
 
+def _project_file_stats(project_root: str):
+    for dirpath, dirnames, filenames in os.walk(project_root):
+        # skip things like __pycache__, which change without the project
+        # itself changing
+        dirnames[:] = sorted(d for d in dirnames if not d.startswith("__"))
+        for filename in sorted(filenames):
+            path = os.path.join(dirpath, filename)
+            stat = os.stat(path)
+            yield "{}:{}:{}".format(path, stat.st_size, stat.st_mtime_ns)
+
+
+def internal_manifest_cache_path(projects: Mapping[str, Project]) -> str:
+    """Get the path of the cached internal manifest for the given internal
+    projects. The internal projects only change when dbt or a plugin is
+    upgraded (or edited in place, in a development install), so the path
+    is keyed by the dbt version and the size and modification time of every
+    file in each project.
+    """
+    parts = [__version__]
+    for name, project in sorted(projects.items()):
+        parts.append(name)
+        parts.extend(_project_file_stats(project.project_root))
+    key = FileHash.from_contents("\0".join(parts)).checksum
+    return os.path.join(CACHE_DIR, __version__, "internal_manifest-{}.pickle".format(key))
+
+
+def read_internal_manifest(path: str) -> Optional[Manifest]:
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "rb") as fp:
+            macros, files = pickle.load(fp)
+    except Exception as exc:
+        logger.debug(
+            "Failed to load internal manifest from {}: {}".format(path, exc), exc_info=True,
+        )
+        return None
+    return Manifest.from_macros(macros=macros, files=files)
+
+
+def write_internal_manifest(path: str, manifest: Manifest) -> None:
+    """Write the internal manifest's macros to the cache. A failure to write
+    the cache is not an error, the next run will just have to parse them
+    again.
+    """
+    value: Tuple[Any, Any] = (manifest.macros, manifest.files)
+    tmp_path = "{}.{}.tmp".format(path, os.getpid())
+    try:
+        make_directory(os.path.dirname(path))
+        with open(tmp_path, "wb") as fp:
+            pickle.dump(value, fp, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except Exception as exc:
+        logger.debug(
+            "Failed to write internal manifest to {}: {}".format(path, exc), exc_info=True,
+        )
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
 def load_internal_manifest(config: RuntimeConfig) -> Manifest:
     return ManifestLoader.load_internal(config)
 
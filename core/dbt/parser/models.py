@@ -7,7 +7,8 @@ from dbt.parser.search import FilesystemSearcher, FileBlock
 class ModelParser(SimpleSQLParser[ParsedModelNode]):
     def get_paths(self):
         return FilesystemSearcher(
-            self.project, self.project.source_paths, '.sql'
+            self.project, self.project.source_paths, '.sql',
+            self.file_index,
         )
 
     def parse_from_dict(self, dct, validate=True) -> ParsedModelNode:
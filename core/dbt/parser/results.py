@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import TypeVar, MutableMapping, Mapping, Union, List
+from typing import TypeVar, MutableMapping, Mapping, Union, List, Any, Callable
 
 from hologram import JsonSchemaMixin
 
@@ -55,6 +55,8 @@ class ParseResult(JsonSchemaMixin, Writable, Replaceable):
     patches: MutableMapping[str, ParsedNodePatch] = dict_field()
     files: MutableMapping[str, SourceFile] = dict_field()
     disabled: MutableMapping[str, List[ParsedNode]] = dict_field()
+    # loaded yaml documents, by the checksum of the file they came from
+    yaml_documents: MutableMapping[str, Any] = dict_field()
     dbt_version: str = __version__
 
     def get_file(self, source_file: SourceFile) -> SourceFile:
@@ -178,6 +180,27 @@ class ParseResult(JsonSchemaMixin, Writable, Replaceable):
         my_checksum = self.files[key].checksum
         return my_checksum == source_file.checksum
 
+    def load_yaml(
+        self, source_file: SourceFile, loader: Callable[[str], Any]
+    ) -> Any:
+        """Load the yaml in source_file with the given loader, unless a file
+        with the same checksum has already been loaded. The document is
+        shared between every file with that checksum, so callers must not
+        modify it.
+        """
+        key = source_file.checksum.checksum
+        if key not in self.yaml_documents:
+            self.yaml_documents[key] = loader(source_file.contents)
+        return self.yaml_documents[key]
+
+    def prune_yaml_documents(self) -> None:
+        """Drop the cached yaml documents that don't belong to a known file.
+        """
+        checksums = {f.checksum.checksum for f in self.files.values()}
+        for key in list(self.yaml_documents):
+            if key not in checksums:
+                del self.yaml_documents[key]
+
     @classmethod
     def rpc(cls):
         # ugh!
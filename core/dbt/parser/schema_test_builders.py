@@ -1,4 +1,5 @@
 import hashlib
+import keyword
 import re
 from dataclasses import dataclass
 from typing import Generic, TypeVar, Dict, Any, Tuple, Optional, List, Union
@@ -43,10 +44,60 @@ def get_nice_schema_test_name(
     return filename, name
 
 
+FUNCTION_PATTERN = re.compile(
+    r'^\s*(env_var|ref|var|source|doc)\s*\(.+\)\s*$'
+)
+
+
+_STRING_LITERAL = r'''(?:'[^'\\]*'|"[^"\\]*")'''
+# a ref() or source() call with one or two plain string arguments
+STATIC_CALL_PATTERN = re.compile(
+    r'^\s*(?P<function>ref|source)\s*\('
+    r'\s*(?P<first>{0})\s*(?:,\s*(?P<second>{0})\s*)?'
+    r'\)\s*$'.format(_STRING_LITERAL)
+)
+
+
+# the schema tests that ship with dbt, and the arguments their macros require
+BUILTIN_TEST_ARGS: Dict[str, Tuple[str, ...]] = {
+    'not_null': (),
+    'unique': (),
+    'accepted_values': ('values',),
+    'relationships': ('to', 'field'),
+}
+
+
+def parse_static_call(value: str) -> Optional[Tuple[str, List[str]]]:
+    """If value is a ref() or source() call with literal arguments, return
+    the function name and its arguments. Otherwise, return None.
+    """
+    match = STATIC_CALL_PATTERN.match(value)
+    if match is None:
+        return None
+    args = [
+        arg[1:-1] for arg in match.group('first', 'second') if arg is not None
+    ]
+    function = match.group('function')
+    if function == 'source' and len(args) != 2:
+        return None
+    return function, args
+
+
+def _is_literal(value: Any) -> bool:
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return True
+    if isinstance(value, list):
+        return all(_is_literal(v) for v in value)
+    if isinstance(value, dict):
+        return all(
+            isinstance(k, str) and _is_literal(v) for k, v in value.items()
+        )
+    return False
+
+
 def as_kwarg(key: str, value: Any) -> str:
     test_value = str(value)
-    is_function = re.match(r'^\s*(env_var|ref|var|source|doc)\s*\(.+\)\s*$',
-                           test_value)
+    is_function = FUNCTION_PATTERN.match(test_value)
 
     # if the value is a function, don't wrap it in quotes!
     if is_function:
@@ -236,6 +287,9 @@ class TestBuilder(Generic[Target]):
                     type(test_name), test_name
                 )
             )
+        # the test definition may be part of a cached yaml document, so build
+        # a new dict instead of modifying it.
+        test_args = dict(test_args)
         if name is not None:
             test_args['column_name'] = name
         return test_name, test_args
@@ -289,6 +343,50 @@ class TestBuilder(Generic[Target]):
             severity=self.severity()
         )
 
+    def static_dependencies(
+        self
+    ) -> Optional[Tuple[List[List[str]], List[List[str]]]]:
+        """Return the refs and sources that rendering the raw sql at parse time
+        would record, if they can be found without rendering it. That is the
+        case for the built-in tests when every argument is a literal or a
+        ref()/source() call with literal arguments. Otherwise, return None.
+
+        This doesn't check which macro the test name resolves to, callers have
+        to make sure it's the built-in one.
+        """
+        if self.namespace is not None:
+            return None
+        required = BUILTIN_TEST_ARGS.get(self.name)
+        if required is None:
+            return None
+        if any(arg not in self.args for arg in required):
+            return None
+        if not re.match(r'^\w*$', self.severity()):
+            return None
+
+        refs: List[List[str]] = []
+        sources: List[List[str]] = []
+        # same order as the arguments in build_raw_sql()
+        values = [self.build_model_str()]
+        for key in sorted(self.args):
+            if not key.isidentifier() or keyword.iskeyword(key):
+                return None
+            values.append(self.args[key])
+
+        for value in values:
+            if isinstance(value, str) and FUNCTION_PATTERN.match(value):
+                call = parse_static_call(value)
+                if call is None:
+                    return None
+                function, call_args = call
+                if function == 'ref':
+                    refs.append(call_args)
+                else:
+                    sources.append(call_args)
+            elif not _is_literal(value):
+                return None
+        return refs, sources
+
     def build_model_str(self):
         if isinstance(self.target, ModelTarget):
             fmt = "ref('{0.name}')"
@@ -1,5 +1,7 @@
 import os
-from typing import Iterable, Dict, Any, Union, List, Optional
+from typing import (
+    Iterable, Dict, Any, Union, List, Optional, FrozenSet
+)
 
 from hologram import ValidationError
 
@@ -25,12 +27,13 @@ from dbt.exceptions import (
     validator_error_message, JSONValidationException,
     raise_invalid_schema_yml_version, ValidationException, CompilationException
 )
+from dbt.include.global_project import PROJECT_NAME as GLOBAL_PROJECT_NAME
 from dbt.node_types import NodeType
 from dbt.parser.base import SimpleParser
 from dbt.parser.search import FileBlock, FilesystemSearcher
 from dbt.parser.schema_test_builders import (
     TestBuilder, SourceTarget, ModelTarget, Target,
-    SchemaTestBlock, TargetBlock, YamlBlock,
+    SchemaTestBlock, TargetBlock, YamlBlock, BUILTIN_TEST_ARGS,
 )
 from dbt.utils import get_pseudo_test_path
 
@@ -119,7 +122,8 @@ class SchemaParser(SimpleParser[SchemaTestBlock, ParsedTestNode]):
 
     def get_paths(self):
         return FilesystemSearcher(
-            self.project, self.project.source_paths, '.yml'
+            self.project, self.project.source_paths, '.yml',
+            self.file_index,
         )
 
     def parse_from_dict(self, dct, validate=True) -> ParsedTestNode:
@@ -207,7 +211,7 @@ class SchemaParser(SimpleParser[SchemaTestBlock, ParsedTestNode]):
         """
         path: str = source_file.path.relative_path
         try:
-            return load_yaml_text(source_file.contents)
+            return self.results.load_yaml(source_file, load_yaml_text)
         except ValidationException as e:
             reason = validator_error_message(e)
             raise CompilationException(
@@ -275,10 +279,48 @@ class SchemaParser(SimpleParser[SchemaTestBlock, ParsedTestNode]):
             column_name=block.column_name,
             test_metadata=metadata,
         )
-        self.render_update(node, config)
+        dependencies = None
+        if builder.name in self._builtin_tests():
+            dependencies = builder.static_dependencies()
+        if dependencies is None:
+            self.render_update(node, config)
+        else:
+            # rendering a built-in test only records its refs/sources and
+            # sets the severity, so skip the expensive part.
+            refs, sources = dependencies
+            node.refs.extend(refs)
+            node.sources.extend(sources)
+            try:
+                config.update_in_model_config(
+                    {'severity': builder.severity()}
+                )
+                self.update_parsed_node(node, config)
+            except ValidationError as exc:
+                msg = validator_error_message(exc)
+                raise CompilationException(msg, node=node) from exc
         self.add_result_node(block, node)
         return node
 
+    def _find_builtin_tests(self) -> FrozenSet[str]:
+        overridden = {
+            m.name for m in self.macro_manifest.macros.values()
+            if m.package_name != GLOBAL_PROJECT_NAME
+        }
+        return frozenset(
+            name for name in BUILTIN_TEST_ARGS
+            if 'test_{}'.format(name) not in overridden
+        )
+
+    def _builtin_tests(self) -> FrozenSet[str]:
+        """The built-in tests that are not overridden by a macro in any
+        other package.
+        """
+        return self.macro_manifest.macro_cache.lookup(
+            self.macro_manifest.macros,
+            'builtin_schema_tests',
+            self._find_builtin_tests,
+        )
+
     def parse_test(
         self,
         target_block: TargetBlock,
@@ -1,14 +1,16 @@
+import abc
 import os
 from dataclasses import dataclass
 from typing import (
-    List, Callable, Iterable, Set, Union, Iterator, TypeVar, Generic
+    List, Callable, Iterable, Set, Union, Iterator, TypeVar, Generic, Dict,
+    Optional,
 )
 
 from dbt.clients.jinja import extract_toplevel_blocks, BlockTag
-from dbt.clients.system import find_matching
+from dbt.clients.system import scan_files
 from dbt.config import Project
 from dbt.contracts.graph.manifest import SourceFile, FilePath
-from dbt.exceptions import CompilationException, InternalException
+from dbt.exceptions import CompilationException
 
 
 @dataclass
@@ -58,30 +60,128 @@ class FullBlock(FileBlock):
         return self.block.full_block
 
 
+@dataclass
+class IndexedFile:
+    absolute_path: str
+    name: str
+    mtime: float
+    size: int
+
+
+def _matches_extension(name: str, extension: str) -> bool:
+    """Match file names the way the pattern '[!.#~]*<extension>' does: skip
+    hidden, backup and editor lock files.
+    """
+    if len(name) <= len(extension) or name[0] in '.#~':
+        return False
+    return os.path.normcase(name).endswith(os.path.normcase(extension))
+
+
+class FileIndex(metaclass=abc.ABCMeta):
+    """An index of the files under a project root that parsers search by
+    directory and extension.
+    """
+    @abc.abstractmethod
+    def find(
+        self, relative_dirs: List[str], extension: str
+    ) -> Iterator[FilePath]:
+        """Find the files under the given directories (relative to the project
+        root) with the given extension.
+        """
+        raise NotImplementedError('find not implemented!')
+
+    @abc.abstractmethod
+    def invalidate(self, path: Optional[str] = None) -> None:
+        """Forget what the index knows about the given absolute path (a file
+        or directory), or about everything if path is None. Something watching
+        the filesystem can call this to keep the index up to date.
+        """
+        raise NotImplementedError('invalidate not implemented!')
+
+
+class ScandirFileIndex(FileIndex):
+    """A FileIndex that scans each directory tree at most once, no matter how
+    many parsers search it or whether their directories overlap.
+    """
+    def __init__(self, project_root: str) -> None:
+        self.project_root = project_root
+        self._root = os.path.normpath(project_root)
+        # absolute path of a scanned directory -> the files under it
+        self._scanned: Dict[str, List[IndexedFile]] = {}
+
+    def _scan(self, directory: str) -> List[IndexedFile]:
+        return [
+            IndexedFile(
+                absolute_path=path,
+                name=os.path.basename(path),
+                mtime=stat_result.st_mtime,
+                size=stat_result.st_size,
+            )
+            for path, stat_result in scan_files(directory)
+        ]
+
+    def _files_under(self, directory: str) -> List[IndexedFile]:
+        if directory in self._scanned:
+            return self._scanned[directory]
+
+        # if a parent directory was already scanned, filter its files
+        for scanned, files in self._scanned.items():
+            if directory.startswith(scanned + os.sep):
+                prefix = directory + os.sep
+                return [f for f in files if f.absolute_path.startswith(prefix)]
+
+        files = self._scan(directory)
+        self._scanned[directory] = files
+        return files
+
+    def find(
+        self, relative_dirs: List[str], extension: str
+    ) -> Iterator[FilePath]:
+        for relative_dir in relative_dirs:
+            directory = os.path.normpath(
+                os.path.join(self._root, relative_dir)
+            )
+            prefix_len = len(directory) + len(os.sep)
+            for indexed in self._files_under(directory):
+                if not _matches_extension(indexed.name, extension):
+                    continue
+                yield FilePath(
+                    searched_path=relative_dir,
+                    relative_path=indexed.absolute_path[prefix_len:],
+                    project_root=self.project_root,
+                )
+
+    def invalidate(self, path: Optional[str] = None) -> None:
+        if path is None:
+            self._scanned.clear()
+            return
+        path = os.path.normpath(path)
+        for scanned in list(self._scanned):
+            if (
+                path == scanned or
+                path.startswith(scanned + os.sep) or
+                scanned.startswith(path + os.sep)
+            ):
+                del self._scanned[scanned]
+
+
 class FilesystemSearcher(Iterable[FilePath]):
     def __init__(
-        self, project: Project, relative_dirs: List[str], extension: str
+        self,
+        project: Project,
+        relative_dirs: List[str],
+        extension: str,
+        file_index: Optional[FileIndex] = None,
     ) -> None:
         self.project = project
         self.relative_dirs = relative_dirs
         self.extension = extension
+        if file_index is None:
+            file_index = ScandirFileIndex(project.project_root)
+        self.file_index = file_index
 
     def __iter__(self) -> Iterator[FilePath]:
-        ext = "[!.#~]*" + self.extension
-
-        root = self.project.project_root
-
-        for result in find_matching(root, self.relative_dirs, ext):
-            if 'searched_path' not in result or 'relative_path' not in result:
-                raise InternalException(
-                    'Invalid result from find_matching: {}'.format(result)
-                )
-            file_match = FilePath(
-                searched_path=result['searched_path'],
-                relative_path=result['relative_path'],
-                project_root=root,
-            )
-            yield file_match
+        return self.file_index.find(self.relative_dirs, self.extension)
 
 
 Block = Union[BlockContents, FullBlock]
@@ -9,7 +9,8 @@ from dbt.parser.search import FileBlock, FilesystemSearcher
 class SeedParser(SimpleSQLParser[ParsedSeedNode]):
     def get_paths(self):
         return FilesystemSearcher(
-            self.project, self.project.data_paths, '.csv'
+            self.project, self.project.data_paths, '.csv',
+            self.file_index,
         )
 
     def parse_from_dict(self, dct, validate=True) -> ParsedSeedNode:
@@ -22,7 +22,8 @@ class SnapshotParser(
 ):
     def get_paths(self):
         return FilesystemSearcher(
-            self.project, self.project.snapshot_paths, '.sql'
+            self.project, self.project.snapshot_paths, '.sql',
+            self.file_index,
         )
 
     def parse_from_dict(self, dct, validate=True) -> IntermediateSnapshotNode:
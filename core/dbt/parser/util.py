@@ -262,7 +262,7 @@ class ParserUtils:
         if config.args.single_threaded or SINGLE_THREADED_HANDLER:
             manifest = manifest.deepcopy()
         # it's ok for macros to silently override a local project macro name
-        manifest.macros.update(macros)
+        manifest.update_macros(macros)
 
         manifest.add_nodes({node.unique_id: node})
         cls.process_sources_for_node(
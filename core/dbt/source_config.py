@@ -1,3 +1,5 @@
+import copy
+
 import dbt.exceptions
 
 from dbt.utils import deep_merge
@@ -5,6 +7,18 @@ from dbt.node_types import NodeType
 from dbt.adapters.factory import get_adapter_class_by_name
 
 
+class ProjectConfigTrie:
+    """A node in the precompiled form of a project's models/seeds/snapshots
+    config. The config is the merged project config for an fqn that reaches
+    this node. The children are keyed by fqn level and built the first time
+    they are looked up. A child of None means the level is not configured.
+    """
+    def __init__(self, config, level_configs):
+        self.config = config
+        self.level_configs = level_configs
+        self.children = {}
+
+
 class SourceConfig:
     AppendListFields = {'pre-hook', 'post-hook', 'tags'}
     ExtendDictFields = {'vars', 'column_types', 'quoting', 'persist_docs'}
@@ -18,6 +32,7 @@ class SourceConfig:
         'severity',
         'sql_header',
         'incremental_strategy',
+        'concurrency_group',
 
         # snapshots
         'target_database',
@@ -57,9 +72,6 @@ class SourceConfig:
             merged_config.update(intermediary_merged)
         return merged_config
 
-    # this is re-evaluated every time `config` is called.
-    # we can cache it, but that complicates things.
-    # TODO : see how this fares performance-wise
     @property
     def config(self):
         """
@@ -72,8 +84,15 @@ class SourceConfig:
          if this is a top-level model:
            - active project config
            - in-model config
+
+        The result is cached until the in-model config changes. Callers get
+        their own copy.
         """
+        if self._config is None:
+            self._config = self._build_config()
+        return copy.deepcopy(self._config)
 
+    def _build_config(self):
         defaults = {"enabled": True, "materialized": "view"}
 
         if self.node_type == NodeType.Seed:
@@ -102,6 +121,7 @@ class SourceConfig:
         return self.active_project.credentials.translate_aliases(config)
 
     def update_in_model_config(self, config):
+        self._config = None
         config = self._translate_adapter_aliases(config)
         for key, value in config.items():
             if key in self.AppendListFields:
@@ -162,7 +182,15 @@ class SourceConfig:
 
         return relevant_configs
 
-    def get_project_config(self, runtime_config):
+    def _project_config_section(self, runtime_config):
+        if self.node_type == NodeType.Seed:
+            return 'seeds', runtime_config.seeds
+        elif self.node_type == NodeType.Snapshot:
+            return 'snapshots', runtime_config.snapshots
+        else:
+            return 'models', runtime_config.models
+
+    def _build_config_trie(self, model_configs):
         # most configs are overwritten by a more specific config, but pre/post
         # hooks are appended!
         config = {}
@@ -171,38 +199,58 @@ class SourceConfig:
         for k in self.ExtendDictFields:
             config[k] = {}
 
-        if self.node_type == NodeType.Seed:
-            model_configs = runtime_config.seeds
-        elif self.node_type == NodeType.Snapshot:
-            model_configs = runtime_config.snapshots
-        else:
-            model_configs = runtime_config.models
-
         if model_configs is None:
-            return config
+            return ProjectConfigTrie(config, {})
 
         # mutates config
         self.smart_update(config, model_configs)
+        return ProjectConfigTrie(config, model_configs)
 
-        fqn = self.fqn[:]
-        for level in fqn:
-            level_config = model_configs.get(level, None)
-            if level_config is None:
-                break
+    def _build_config_trie_child(self, parent, level):
+        level_config = parent.level_configs.get(level, None)
+        if level_config is None:
+            return None
 
-            # mutates config
-            relevant_configs = self.smart_update(config, level_config)
+        config = copy.deepcopy(parent.config)
+        # mutates config
+        relevant_configs = self.smart_update(config, level_config)
+
+        clobber_configs = {
+            k: v for (k, v) in relevant_configs.items()
+            if k not in self.AppendListFields and
+            k not in self.ExtendDictFields
+        }
 
-            clobber_configs = {
-                k: v for (k, v) in relevant_configs.items()
-                if k not in self.AppendListFields and
-                k not in self.ExtendDictFields
-            }
+        config.update(clobber_configs)
+        return ProjectConfigTrie(config, level_config)
 
-            config.update(clobber_configs)
-            model_configs = model_configs[level]
+    def get_config_trie(self, runtime_config):
+        """Get the precompiled config trie for this node type's section of the
+        given project's config. It is stored on the project, and rebuilt if the
+        section is replaced.
+        """
+        section, model_configs = self._project_config_section(runtime_config)
+        key = (section, frozenset(self.AdapterSpecificConfigs))
+        cached = runtime_config.config_tries.get(key)
+        if cached is not None and cached[0] is model_configs:
+            return cached[1]
+        trie = self._build_config_trie(model_configs)
+        runtime_config.config_tries[key] = (model_configs, trie)
+        return trie
+
+    def get_project_config(self, runtime_config):
+        node = self.get_config_trie(runtime_config)
+        for level in self.fqn:
+            if level not in node.children:
+                node.children[level] = self._build_config_trie_child(
+                    node, level
+                )
+            child = node.children[level]
+            if child is None:
+                break
+            node = child
 
-        return config
+        return copy.deepcopy(node.config)
 
     def load_config_from_own_project(self):
         return self.get_project_config(self.own_project)
@@ -15,9 +15,16 @@ class FreshnessTask(GraphRunnableTask):
         else:
             return os.path.join(self.config.target_path, RESULT_FILE_NAME)
 
+    def result_stream_path(self):
+        # sources.json has its own format, build it from the results at the end
+        return None
+
     def raise_on_first_error(self):
         return False
 
+    def opens_connections(self):
+        return True
+
     def build_query(self):
         include = [
             'source:{}'.format(s)
@@ -214,7 +214,8 @@ class GenerateTask(CompileTask):
 
         path = os.path.join(self.config.target_path, CATALOG_FILENAME)
         results.write(path)
-        write_manifest(self.config, self.manifest)
+        # the docs site reads manifest.json, so never compress this one
+        write_manifest(self.config, self.manifest, linker=self.linker)
 
         dbt.ui.printer.print_timestamped_line(
             'Catalog written to {}'.format(os.path.abspath(path))
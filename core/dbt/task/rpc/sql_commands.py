@@ -100,7 +100,7 @@ class RemoteRunSQLTask(RPCTask[RPCExecParameters]):
             for node in macro_parser.parse_remote(macros):
                 macro_overrides[node.unique_id] = node
 
-        self.manifest.macros.update(macro_overrides)
+        self.manifest.update_macros(macro_overrides)
         rpc_parser = RPCCallParser(
             results=results,
             project=self.config,
@@ -21,6 +21,9 @@ from dbt.ui.printer import (
     print_hook_end_line,
     print_timestamped_line,
     print_run_end_messages,
+    print_connection_pool_line,
+    print_concurrency_group_lines,
+    print_introspection_cache_line,
     get_counts,
 )
 
@@ -74,6 +77,9 @@ class RunTask(CompileTask):
     def raise_on_first_error(self):
         return False
 
+    def opens_connections(self):
+        return True
+
     def populate_adapter_cache(self, adapter):
         adapter.set_relations_cache(self.manifest)
 
@@ -183,6 +189,11 @@ class RunTask(CompileTask):
 
     def after_hooks(self, adapter, results, elapsed):
         self.print_results_line(results, elapsed)
+        print_connection_pool_line(adapter.connections.pool_stats)
+        print_introspection_cache_line(adapter.introspection_cache)
+        print_concurrency_group_lines(
+            self.job_queue.concurrency_limits, self.job_queue.group_waits
+        )
 
     def build_query(self):
         return {
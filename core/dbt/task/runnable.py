@@ -1,7 +1,12 @@
+import asyncio
+import dataclasses
 import os
+import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from multiprocessing.dummy import Pool as ThreadPool
+from queue import Empty
 
 from dbt.task.base import ConfiguredTask
 from dbt.adapters.factory import get_adapter
@@ -15,7 +20,16 @@ from dbt.logger import (
     ModelMetadata,
     NodeCount,
 )
+from dbt.clients.json_stream import (
+    COMPRESSION_SUFFIXES,
+    JSONLinesWriter,
+    StreamedList,
+    StreamedObject,
+    read_json_lines,
+    write_json_stream,
+)
 from dbt.compilation import compile_manifest
+from dbt.concurrency import AdaptiveConcurrency, AsyncSlots
 from dbt.contracts.results import ExecutionResult
 from dbt.perf_utils import get_full_manifest
 
@@ -23,17 +37,26 @@ import dbt.exceptions
 import dbt.flags
 import dbt.ui.printer
 import dbt.utils
+import dbt.writer
 
 import dbt.graph.selector
 
 RESULT_FILE_NAME = "run_results.json"
+RESULT_STREAM_FILE_NAME = "run_results.jsonl"
 MANIFEST_FILE_NAME = "manifest.json"
 RUNNING_STATE = DbtProcessState("running")
 
 
-def write_manifest(config, manifest):
+def write_manifest(config, manifest, linker=None, compression=None):
     if dbt.flags.WRITE_JSON:
-        manifest.write(os.path.join(config.target_path, MANIFEST_FILE_NAME))
+        filename = MANIFEST_FILE_NAME
+        if compression is not None:
+            filename += COMPRESSION_SUFFIXES[compression]
+        manifest.write(
+            os.path.join(config.target_path, filename),
+            linker=linker,
+            compression=compression,
+        )
 
 
 class ManifestTask(ConfiguredTask):
@@ -44,7 +67,14 @@ class ManifestTask(ConfiguredTask):
 
     def load_manifest(self):
         self.manifest = get_full_manifest(self.config)
-        write_manifest(self.config, self.manifest)
+
+    def write_manifest(self):
+        write_manifest(
+            self.config,
+            self.manifest,
+            linker=self.linker,
+            compression=dbt.flags.MANIFEST_COMPRESSION,
+        )
 
     def compile_manifest(self):
         self.linker = compile_manifest(self.config, self.manifest)
@@ -52,7 +82,12 @@ class ManifestTask(ConfiguredTask):
 
     def _runtime_initialize(self):
         self.load_manifest()
-        self.compile_manifest()
+        try:
+            self.compile_manifest()
+        finally:
+            # write the manifest even if compiling fails, but use the linker's
+            # graph for the child/parent maps when there is one.
+            self.write_manifest()
 
 
 class GraphRunnableTask(ManifestTask):
@@ -66,6 +101,8 @@ class GraphRunnableTask(ManifestTask):
         self.node_results = []
         self._skipped_children = {}
         self._raise_next_tick = None
+        self._result_stream = None
+        self._concurrency = None
 
     def index_offset(self, value: int) -> int:
         return value
@@ -78,7 +115,9 @@ class GraphRunnableTask(ManifestTask):
     def _runtime_initialize(self):
         super()._runtime_initialize()
         selected_nodes = self.select_nodes()
-        self.job_queue = self.linker.as_graph_queue(self.manifest, selected_nodes)
+        self.job_queue = self.linker.as_graph_queue(
+            self.manifest, selected_nodes, self.config.concurrency_limits
+        )
 
         # we use this a couple times. order does not matter.
         self._flattened_nodes = [self.manifest.nodes[uid] for uid in selected_nodes]
@@ -97,6 +136,24 @@ class GraphRunnableTask(ManifestTask):
     def result_path(self):
         return os.path.join(self.config.target_path, RESULT_FILE_NAME)
 
+    def result_stream_path(self):
+        """The JSON-lines file that results are appended to as nodes finish,
+        or None to only write results at the end of the run.
+        """
+        return os.path.join(self.config.target_path, RESULT_STREAM_FILE_NAME)
+
+    def opens_connections(self):
+        """Whether nodes run against the database, so connections should be
+        opened ahead of time.
+        """
+        return False
+
+    def keep_result_tables(self):
+        """Whether results should hold on to their agate tables after they
+        have been recorded. Tables can be large, so by default they're dropped.
+        """
+        return False
+
     def get_runner(self, node):
         adapter = get_adapter(self.config)
 
@@ -135,6 +192,30 @@ class GraphRunnableTask(ManifestTask):
 
         return result
 
+    async def call_runner_async(self, runner):
+        """Run a runner on the event loop. Other tasks on the loop share this
+        thread, so log contexts are bound to the task instead.
+        """
+        uid_context = UniqueID(runner.node.unique_id)
+        with RUNNING_STATE.contextbound(), uid_context.contextbound():
+            startctx = TimestampNamed("node_started_at")
+            index = self.index_offset(runner.node_index)
+            extended_metadata = ModelMetadata(runner.node, index)
+            with startctx.contextbound(), extended_metadata.contextbound():
+                logger.debug("Began running node {}".format(runner.node.unique_id))
+            status = "error"
+            try:
+                result = await runner.run_with_hooks_async(self.manifest)
+                status = runner.get_result_status(result)
+            finally:
+                finishctx = TimestampNamed("node_finished_at")
+                with finishctx.contextbound(), DbtModelState(status).contextbound():
+                    logger.debug("Finished running node {}".format(runner.node.unique_id))
+        if result.error is not None and self.raise_on_first_error():
+            self._raise_next_tick = result.error
+
+        return result
+
     def _submit(self, pool, args, callback):
         """If the caller has passed the magic 'single-threaded' flag, call the
         function directly instead of pool.apply_async. The single-threaded flag
@@ -163,8 +244,12 @@ class GraphRunnableTask(ManifestTask):
             """
             self._handle_result(result)
             self.job_queue.mark_done(result.node.unique_id)
+            if self._concurrency is not None:
+                self._concurrency.release()
 
         while not self.job_queue.empty():
+            if self._concurrency is not None:
+                self._concurrency.acquire()
             node = self.job_queue.get()
             self._raise_set_error()
             runner = self.get_runner(node)
@@ -183,6 +268,67 @@ class GraphRunnableTask(ManifestTask):
 
         return
 
+    async def run_queue_async(self, executor, limit):
+        """Run nodes from the queue, at most `limit` at a time. Nodes whose
+        runners support it run as tasks on the event loop, the rest are sent
+        to the executor.
+        """
+        loop = asyncio.get_event_loop()
+        if self._concurrency is not None:
+            slots = AsyncSlots(self._concurrency)
+        else:
+            slots = asyncio.Semaphore(limit)
+        running = set()
+
+        async def run_node(runner):
+            try:
+                if runner.supports_async():
+                    result = await self.call_runner_async(runner)
+                else:
+                    result = await loop.run_in_executor(
+                        executor, self.call_runner, runner
+                    )
+                self._handle_result(result)
+                self.job_queue.mark_done(result.node.unique_id)
+            finally:
+                slots.release()
+
+        try:
+            while not self.job_queue.empty():
+                await slots.acquire()
+                self._raise_set_error()
+                try:
+                    node = self.job_queue.get(block=False)
+                except Empty:
+                    # everything that's ready is running: wait for something
+                    # to finish, so its children can become ready.
+                    slots.release()
+                    if not running:
+                        raise dbt.exceptions.InternalException(
+                            "No nodes are running, but none are ready to run"
+                        )
+                    done, _ = await asyncio.wait(
+                        running, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for task in done:
+                        running.discard(task)
+                        task.result()
+                    continue
+
+                runner = self.get_runner(node)
+                if runner.node.unique_id in self._skipped_children:
+                    cause = self._skipped_children.pop(runner.node.unique_id)
+                    runner.do_skip(cause=cause)
+                running.add(loop.create_task(run_node(runner)))
+
+            await asyncio.gather(*running)
+        except Exception:
+            for task in running:
+                task.cancel()
+            await asyncio.gather(*running, return_exceptions=True)
+            raise
+        self._raise_set_error()
+
     def _handle_result(self, result):
         """Mark the result as completed, insert the `CompiledResultNode` into
         the manifest, and mark any descendants (potentially with a 'cause' if
@@ -190,6 +336,10 @@ class GraphRunnableTask(ManifestTask):
         """
         is_ephemeral = result.node.is_ephemeral_model
         if not is_ephemeral:
+            if self._result_stream is not None:
+                self._result_stream.write(result.to_dict(omit_none=False))
+            if not self.keep_result_tables() and hasattr(result, "agate_table"):
+                result.agate_table = None
             self.node_results.append(result)
 
         node = result.node
@@ -206,13 +356,49 @@ class GraphRunnableTask(ManifestTask):
         num_threads = self.config.threads
         target_name = self.config.target_name
 
-        text = "Concurrency: {} threads (target='{}')"
+        use_async = self.use_async_queries()
+        if use_async:
+            text = "Concurrency: {} threads, async queries (target='{}')"
+        else:
+            text = "Concurrency: {} threads (target='{}')"
         concurrency_line = text.format(num_threads, target_name)
         with NodeCount(self.num_nodes):
             dbt.ui.printer.print_timestamped_line(concurrency_line)
         with TextOnly():
             dbt.ui.printer.print_timestamped_line("")
 
+        if self.opens_connections():
+            adapter = get_adapter(self.config)
+            adapter.prewarm_connections(min(num_threads, self.num_nodes))
+
+        self._start_adaptive_concurrency(num_threads)
+        try:
+            if use_async:
+                return self.execute_nodes_async(num_threads)
+            return self.execute_nodes_threaded(num_threads)
+        finally:
+            self._stop_adaptive_concurrency()
+
+    def _start_adaptive_concurrency(self, num_threads):
+        if not dbt.flags.ADAPTIVE_CONCURRENCY or self.config.args.single_threaded:
+            return
+        self._concurrency = AdaptiveConcurrency(num_threads)
+        adapter = get_adapter(self.config)
+        adapter.connections.query_listener = self._concurrency.record
+        logger.debug(
+            "Adaptive concurrency: starting at {} of {} threads".format(
+                self._concurrency.current_limit, num_threads
+            )
+        )
+
+    def _stop_adaptive_concurrency(self):
+        if self._concurrency is None:
+            return
+        adapter = get_adapter(self.config)
+        adapter.connections.query_listener = None
+        self._concurrency = None
+
+    def execute_nodes_threaded(self, num_threads):
         pool = ThreadPool(num_threads)
         try:
             self.run_queue(pool)
@@ -221,22 +407,9 @@ class GraphRunnableTask(ManifestTask):
             pool.close()
             pool.terminate()
 
-            adapter = get_adapter(self.config)
-
-            if not adapter.is_cancelable():
-                msg = (
-                    "The {} adapter does not support query "
-                    "cancellation. Some queries may still be "
-                    "running!".format(adapter.type())
-                )
-
-                yellow = dbt.ui.printer.COLOR_FG_YELLOW
-                dbt.ui.printer.print_timestamped_line(msg, yellow)
+            if not self._cancel_open_connections():
                 raise
 
-            for conn_name in adapter.cancel_open_connections():
-                dbt.ui.printer.print_cancel_line(conn_name)
-
             pool.join()
 
             dbt.ui.printer.print_run_end_messages(self.node_results, early_exit=True)
@@ -248,6 +421,77 @@ class GraphRunnableTask(ManifestTask):
 
         return self.node_results
 
+    def use_async_queries(self) -> bool:
+        if not dbt.flags.ASYNC_QUERIES or self.config.args.single_threaded:
+            return False
+        if sys.version_info < (3, 7):
+            raise dbt.exceptions.RuntimeException(
+                "--async-queries requires Python 3.7 or newer"
+            )
+        adapter = get_adapter(self.config)
+        if not adapter.supports_async_queries():
+            logger.debug(
+                "The {} adapter does not support async queries, running "
+                "nodes on threads".format(adapter.type())
+            )
+            return False
+        return True
+
+    def execute_nodes_async(self, num_threads):
+        # threads are only started for nodes that can't run on the loop, and
+        # for the blocking calls that async jobs make, so --threads bounds
+        # both.
+        executor = ThreadPoolExecutor(
+            max_workers=num_threads, thread_name_prefix="Thread"
+        )
+        loop = asyncio.new_event_loop()
+        loop.set_default_executor(executor)
+        try:
+            loop.run_until_complete(self.run_queue_async(executor, num_threads))
+
+        except KeyboardInterrupt:
+            if not self._cancel_open_connections():
+                raise
+
+            # let the remaining tasks release their connections
+            tasks = asyncio.all_tasks(loop)
+            for task in tasks:
+                task.cancel()
+            loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+            executor.shutdown()
+
+            dbt.ui.printer.print_run_end_messages(self.node_results, early_exit=True)
+
+            raise
+
+        finally:
+            loop.close()
+
+        executor.shutdown()
+
+        return self.node_results
+
+    def _cancel_open_connections(self) -> bool:
+        """Cancel the queries running on the adapter's connections. Return
+        False if the adapter can't cancel queries.
+        """
+        adapter = get_adapter(self.config)
+
+        if not adapter.is_cancelable():
+            msg = (
+                "The {} adapter does not support query "
+                "cancellation. Some queries may still be "
+                "running!".format(adapter.type())
+            )
+
+            yellow = dbt.ui.printer.COLOR_FG_YELLOW
+            dbt.ui.printer.print_timestamped_line(msg, yellow)
+            return False
+
+        for conn_name in adapter.cancel_open_connections():
+            dbt.ui.printer.print_cancel_line(conn_name)
+        return True
+
     def _mark_dependent_errors(self, node_id, result, cause):
         for dep_node_id in self.linker.get_dependent_nodes(node_id):
             self._skipped_children[dep_node_id] = cause
@@ -264,19 +508,48 @@ class GraphRunnableTask(ManifestTask):
     def after_hooks(self, adapter, results, elapsed):
         pass
 
+    def open_result_stream(self):
+        path = self.result_stream_path()
+        if dbt.flags.WRITE_JSON and path is not None:
+            self._result_stream = JSONLinesWriter(path)
+
+    def close_result_stream(self):
+        if self._result_stream is not None:
+            self._result_stream.close()
+
+    def write_result(self, result):
+        """Write the results file. If results were streamed during the run,
+        copy them out of the stream instead of serializing them again.
+        """
+        if self._result_stream is None:
+            result.write(self.result_path())
+            return
+
+        # everything but the results themselves is small
+        summary = dataclasses.replace(result, results=[]).to_dict(omit_none=False)
+        summary["results"] = StreamedList(read_json_lines(self._result_stream.path))
+        write_json_stream(self.result_path(), StreamedObject(summary.items()))
+
     def execute_with_hooks(self, selected_uids):
         adapter = get_adapter(self.config)
+        # introspection results are only kept for one run
+        adapter.introspection_cache.clear()
+        self.open_result_stream()
         try:
-            self.before_hooks(adapter)
-            started = time.time()
-            self.before_run(adapter, selected_uids)
-            res = self.execute_nodes()
-            self.after_run(adapter, res)
-            elapsed = time.time() - started
-            self.after_hooks(adapter, res, elapsed)
+            # compiled and run SQL files are written in the background, and
+            # flushed before the task ends.
+            with dbt.writer.background_writer():
+                self.before_hooks(adapter)
+                started = time.time()
+                self.before_run(adapter, selected_uids)
+                res = self.execute_nodes()
+                self.after_run(adapter, res)
+                elapsed = time.time() - started
+                self.after_hooks(adapter, res, elapsed)
 
         finally:
             adapter.cleanup_connections()
+            self.close_result_stream()
 
         result = self.get_result(results=res, elapsed_time=elapsed, generated_at=datetime.utcnow())
         return result
@@ -301,7 +574,7 @@ class GraphRunnableTask(ManifestTask):
         result = self.execute_with_hooks(selected_uids)
 
         if dbt.flags.WRITE_JSON:
-            result.write(self.result_path())
+            self.write_result(result)
 
         self.task_end_messages(result.results)
         return result
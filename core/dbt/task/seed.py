@@ -21,6 +21,9 @@ class SeedTask(RunTask):
     def get_runner_type(self):
         return SeedRunner
 
+    def keep_result_tables(self):
+        return self.args.show
+
     def task_end_messages(self, results):
         if self.args.show:
             self.show_tables(results)
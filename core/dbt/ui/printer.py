@@ -292,6 +292,42 @@ def print_run_status_line(results) -> None:
     logger.info(stats_line.format(**stats))
 
 
+def print_connection_pool_line(stats) -> None:
+    msg = (
+        "Connections: opened {opened} in {open_time:0.2f}s, reused {reused}, "
+        "waited {wait_time:0.2f}s"
+    ).format(
+        opened=stats.opened,
+        open_time=stats.open_time,
+        reused=stats.reused,
+        wait_time=stats.wait_time,
+    )
+    print_timestamped_line(msg)
+
+
+def print_introspection_cache_line(cache) -> None:
+    if cache.hits == 0 and cache.misses == 0:
+        return
+    msg = "Introspection cache: {hits} hits, {misses} misses".format(
+        hits=cache.hits, misses=cache.misses
+    )
+    print_timestamped_line(msg)
+
+
+def print_concurrency_group_lines(limits, group_waits) -> None:
+    for group, wait in sorted(group_waits.items()):
+        msg = (
+            "Concurrency group '{group}' (limit {limit}): nodes waited "
+            "{seconds:0.2f}s for a slot, {holds} times"
+        ).format(
+            group=group,
+            limit=limits[group],
+            seconds=wait.seconds,
+            holds=wait.holds,
+        )
+        print_timestamped_line(msg)
+
+
 def print_run_result_error(
     result, newline: bool = True, is_warning: bool = False
 ) -> None:
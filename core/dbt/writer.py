@@ -1,14 +1,189 @@
 import os.path
+import queue
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 
 import dbt.clients.system
+import dbt.exceptions
+import dbt.flags
 
+from dbt.logger import GLOBAL_LOGGER as logger
+
+
+def _is_unchanged(path: str, payload: str) -> bool:
+    """Return True if the file at path already has exactly the given contents.
+    Checking the size first means we only read files that could match.
+    """
+    try:
+        if os.path.getsize(path) != len(payload.encode('utf-8')):
+            return False
+        with open(path, 'r', encoding='utf-8') as fp:
+            return fp.read() == payload
+    except OSError:
+        return False
+
+
+class ArtifactWriter:
+    """Write compiled/run artifacts on a dedicated thread, so worker threads
+    never block on the filesystem.
+
+    Payloads for the same path that are queued before the writer gets to them
+    are coalesced into a single write of the most recent payload, files that
+    already have the given contents are left alone, and each directory is only
+    created once.
+    """
+    def __init__(self) -> None:
+        self._queue: 'queue.Queue[Optional[Tuple[str, str]]]' = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._known_dirs: Set[str] = set()
+        self._errors: List[Tuple[str, Exception]] = []
+        self.written = 0
+        self.skipped = 0
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._run, name='dbt-artifact-writer', daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, path: str, payload: str) -> None:
+        if self._thread is None:
+            raise dbt.exceptions.InternalException(
+                'Artifact writer was not started before submit()'
+            )
+        self._queue.put((path, payload))
+
+    def _next_batch(self) -> Tuple[Dict[str, str], int, bool]:
+        """Block for the next item, then drain whatever else is queued. Return
+        the payloads to write by path, the number of items taken from the
+        queue, and whether the stop sentinel was seen.
+        """
+        batch: Dict[str, str] = {}
+        count = 0
+        stop = False
+        item = self._queue.get()
+        while True:
+            count += 1
+            if item is None:
+                stop = True
+            else:
+                path, payload = item
+                batch[path] = payload
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+        return batch, count, stop
+
+    def _run(self) -> None:
+        stop = False
+        while not stop:
+            batch, count, stop = self._next_batch()
+            try:
+                for path, payload in batch.items():
+                    self.write(path, payload)
+            finally:
+                for _ in range(count):
+                    self._queue.task_done()
+
+    def write(self, path: str, payload: str) -> None:
+        payload = str(payload)
+        try:
+            if _is_unchanged(path, payload):
+                self.skipped += 1
+                return
+            dirname = os.path.dirname(path)
+            if dirname not in self._known_dirs:
+                dbt.clients.system.make_directory(dirname)
+                self._known_dirs.add(dirname)
+            with open(path, 'w', encoding='utf-8') as fp:
+                fp.write(payload)
+            self.written += 1
+        except Exception as exc:
+            logger.debug('Error writing artifact "{}": {}'.format(path, exc))
+            self._errors.append((path, exc))
+
+    def flush(self) -> None:
+        """Wait for every queued payload to be written. If any writes failed,
+        raise an error about the first one.
+        """
+        self._queue.join()
+        if self._errors:
+            path, exc = self._errors[0]
+            self._errors.clear()
+            raise dbt.exceptions.RuntimeException(
+                'Failed to write "{}": {}'.format(path, exc)
+            ) from exc
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        try:
+            self.flush()
+        finally:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+            logger.debug(
+                'Artifact writer finished: {} files written, {} unchanged'
+                .format(self.written, self.skipped)
+            )
+
+
+_active_writer: Optional[ArtifactWriter] = None
+
+
+@contextmanager
+def background_writer() -> Iterator[ArtifactWriter]:
+    """Send all write_node() calls in this block to a background writer
+    thread, and flush it on the way out. If a background writer is already
+    active, reuse it and leave flushing to its owner.
+
+    Write errors are only raised if the block itself succeeded. If the block
+    raised, write errors are logged instead so the original error is the one
+    that propagates.
+    """
+    global _active_writer
+    if _active_writer is not None:
+        yield _active_writer
+        return
+
+    writer = ArtifactWriter()
+    writer.start()
+    _active_writer = writer
+    try:
+        yield writer
+    except BaseException:
+        _active_writer = None
+        try:
+            writer.stop()
+        except dbt.exceptions.RuntimeException as exc:
+            logger.warning('Error writing artifacts: {}'.format(exc))
+        raise
+    _active_writer = None
+    writer.stop()
+
+
+def write_node(node, target_path, subdirectory, payload) -> Optional[str]:
+    """Write the payload for the node under target_path/subdirectory and
+    return the path written. If writing to the subdirectory was turned off
+    with --no-write-artifacts, nothing is written and None is returned.
+    """
+    if subdirectory in dbt.flags.SKIP_ARTIFACTS:
+        return None
 
-def write_node(node, target_path, subdirectory, payload):
     node_path = node.path
 
     full_path = os.path.join(target_path, subdirectory, node.package_name,
                              node_path)
 
-    dbt.clients.system.write_file(full_path, payload)
+    writer = _active_writer
+    if writer is None:
+        dbt.clients.system.write_file(full_path, payload)
+    else:
+        writer.submit(full_path, payload)
 
     return full_path
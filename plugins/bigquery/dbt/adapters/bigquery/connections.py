@@ -10,7 +10,9 @@ import google.cloud.bigquery
 from google.api_core import retry
 
 import dbt.clients.agate_helper
+import dbt.clients.columnar
 import dbt.exceptions
+import dbt.flags
 from dbt.adapters.base import BaseConnectionManager, Credentials
 from dbt.logger import GLOBAL_LOGGER as logger
 
@@ -185,16 +187,24 @@ class BigQueryConnectionManager(BaseConnectionManager):
 
     @classmethod
     def get_table_from_response(cls, resp):
+        cls._check_max_rows(resp)
         column_names = [field.name for field in resp.schema]
         return dbt.clients.agate_helper.table_from_data_flat(resp,
                                                              column_names)
 
-    def raw_execute(self, sql, fetch=False):
-        conn = self.get_thread_connection()
-        client = conn.handle
-
-        logger.debug('On {}: {}', conn.name, sql)
+    @staticmethod
+    def _check_max_rows(resp):
+        # the row count is known before any pages are fetched
+        max_rows = dbt.flags.MAX_FETCH_ROWS
+        total_rows = getattr(resp, 'total_rows', None)
+        if total_rows is None:
+            return
+        if max_rows is not None and total_rows > max_rows:
+            dbt.exceptions.raise_too_many_rows(max_rows)
+        logger.debug('Fetching {} rows', total_rows)
 
+    @staticmethod
+    def _query_job_params(conn):
         job_params = {'use_legacy_sql': False}
 
         priority = conn.credentials.priority
@@ -203,6 +213,15 @@ class BigQueryConnectionManager(BaseConnectionManager):
         else:
             job_params[
                 'priority'] = google.cloud.bigquery.QueryPriority.INTERACTIVE
+        return job_params
+
+    def raw_execute(self, sql, fetch=False):
+        conn = self.get_thread_connection()
+        client = conn.handle
+
+        logger.debug('On {}: {}', conn.name, sql)
+
+        job_params = self._query_job_params(conn)
 
         def fn():
             return self._query_and_results(client, sql, conn, job_params)
@@ -221,11 +240,26 @@ class BigQueryConnectionManager(BaseConnectionManager):
         else:
             res = dbt.clients.agate_helper.empty_table()
 
+        return self._query_status(query_job), res
+
+    def execute_columnar(self, sql, auto_begin=False):
+        dbt.clients.columnar.import_pyarrow()
+        sql = self._add_query_comment(sql)
+        query_job, iterator = self.raw_execute(sql, fetch=True)
+
+        self._check_max_rows(iterator)
+        with self.exception_handler(sql):
+            res = dbt.clients.columnar.table_from_arrow(iterator.to_arrow())
+
+        return self._query_status(query_job), res
+
+    def _query_status(self, query_job, conn=None):
         if query_job.statement_type == 'CREATE_VIEW':
             status = 'CREATE VIEW'
 
         elif query_job.statement_type == 'CREATE_TABLE_AS_SELECT':
-            conn = self.get_thread_connection()
+            if conn is None:
+                conn = self.get_thread_connection()
             client = conn.handle
             table = client.get_table(query_job.destination)
             status = 'CREATE TABLE ({})'.format(table.num_rows)
@@ -239,7 +273,36 @@ class BigQueryConnectionManager(BaseConnectionManager):
         else:
             status = 'OK'
 
-        return status, res
+        return status
+
+    @classmethod
+    def supports_async_jobs(cls):
+        return True
+
+    def submit_job(self, conn, sql):
+        client = conn.handle
+
+        logger.debug('On {}: {}', conn.name, sql)
+
+        job_config = google.cloud.bigquery.QueryJobConfig(
+            **self._query_job_params(conn)
+        )
+        with self.exception_handler(sql):
+            return client.query(sql, job_config=job_config)
+
+    def job_done(self, job):
+        with self.exception_handler(job.query):
+            return job.done()
+
+    def job_result(self, conn, job, fetch=False):
+        with self.exception_handler(job.query):
+            iterator = job.result()
+            self._record_job(job)
+            if fetch:
+                res = self.get_table_from_response(iterator)
+            else:
+                res = dbt.clients.agate_helper.empty_table()
+            return self._query_status(job, conn), res
 
     def create_bigquery_table(self, database, schema, table_name, callback,
                               sql):
@@ -329,9 +392,22 @@ class BigQueryConnectionManager(BaseConnectionManager):
         job_config = google.cloud.bigquery.QueryJobConfig(**job_params)
         query_job = client.query(sql, job_config=job_config)
         iterator = query_job.result(timeout=timeout)
+        self._record_job(query_job)
 
         return query_job, iterator
 
+    def _record_job(self, query_job):
+        """Report the job's run time and how long it waited for slots."""
+        created = query_job.created
+        started = query_job.started
+        ended = query_job.ended
+        if created is None or ended is None:
+            return
+        queued = None
+        if started is not None:
+            queued = (started - created).total_seconds()
+        self.record_query((ended - created).total_seconds(), queued)
+
     def _retry_and_handle(self, msg, conn, fn):
         """retry a function call within the context of exception_handler."""
         with self.exception_handler(msg):
@@ -76,6 +76,7 @@ class BigQueryAdapter(BaseAdapter):
                                            conn)
         relation_object = dataset.table(relation.identifier)
         client.delete_table(relation_object)
+        self.introspection_cache.invalidate(relation)
 
     def truncate_relation(self, relation: BigQueryRelation) -> None:
         raise dbt.exceptions.NotImplementedException(
@@ -126,6 +127,15 @@ class BigQueryAdapter(BaseAdapter):
 
     def get_columns_in_relation(
         self, relation: BigQueryRelation
+    ) -> List[BigQueryColumn]:
+        columns = self.cached_introspection(
+            relation, 'columns', lambda: self._get_columns(relation)
+        )
+        # callers may modify the list they get
+        return list(columns)
+
+    def _get_columns(
+        self, relation: BigQueryRelation
     ) -> List[BigQueryColumn]:
         try:
             table = self.connections.get_bq_table(
@@ -192,11 +202,21 @@ class BigQueryAdapter(BaseAdapter):
                 identifier=identifier
             )
 
-        try:
-            table = self.connections.get_bq_table(database, schema, identifier)
-        except google.api_core.exceptions.NotFound:
-            table = None
-        return self._bq_table_to_relation(table)
+        def fetch():
+            try:
+                table = self.connections.get_bq_table(
+                    database, schema, identifier
+                )
+            except google.api_core.exceptions.NotFound:
+                table = None
+            return self._bq_table_to_relation(table)
+
+        relation = self.Relation.create(
+            database=database, schema=schema, identifier=identifier
+        )
+        return self.cached_introspection(
+            relation, ('relation', database, schema, identifier), fetch
+        )
 
     def create_schema(self, database: str, schema: str) -> None:
         logger.debug('Creating schema "{}.{}".', database, schema)
@@ -206,6 +226,7 @@ class BigQueryAdapter(BaseAdapter):
         logger.debug('Dropping schema "{}.{}".', database, schema)
         self.connections.drop_dataset(database, schema)
         self.cache.drop_schema(database, schema)
+        self.introspection_cache.invalidate_schema(database, schema)
 
     @classmethod
     def quote(cls, identifier: str) -> str:
@@ -376,11 +397,14 @@ class BigQueryAdapter(BaseAdapter):
     ###
     @available.parse_none
     def make_date_partitioned_table(self, relation):
-        return self.connections.create_date_partitioned_table(
-            database=relation.database,
-            schema=relation.schema,
-            table_name=relation.identifier
-        )
+        try:
+            return self.connections.create_date_partitioned_table(
+                database=relation.database,
+                schema=relation.schema,
+                table_name=relation.identifier
+            )
+        finally:
+            self.introspection_cache.invalidate(relation)
 
     @available.parse(lambda *a, **k: '')
     def execute_model(self, model, materialization, sql_override=None,
@@ -402,13 +426,23 @@ class BigQueryAdapter(BaseAdapter):
                     f'unique id of "{model_uid}"'
                 )
 
-        if materialization == 'view':
-            res = self._materialize_as_view(model)
-        elif materialization == 'table':
-            res = self._materialize_as_table(model, sql_override, decorator)
-        else:
-            msg = "Invalid relation type: '{}'".format(materialization)
-            raise dbt.exceptions.RuntimeException(msg, model)
+        relation = self.Relation.create(
+            database=model.get('database'),
+            schema=model.get('schema'),
+            identifier=model.get('alias'),
+        )
+        try:
+            if materialization == 'view':
+                res = self._materialize_as_view(model)
+            elif materialization == 'table':
+                res = self._materialize_as_table(
+                    model, sql_override, decorator
+                )
+            else:
+                msg = "Invalid relation type: '{}'".format(materialization)
+                raise dbt.exceptions.RuntimeException(msg, model)
+        finally:
+            self.introspection_cache.invalidate(relation)
 
         return res
 
@@ -461,6 +495,7 @@ class BigQueryAdapter(BaseAdapter):
 
         new_table = google.cloud.bigquery.Table(table_ref, schema=new_schema)
         client.update_table(new_table, ['schema'])
+        self.introspection_cache.invalidate(relation)
 
     @available.parse_none
     def load_dataframe(self, database, schema, table_name, agate_table,
@@ -482,6 +517,9 @@ class BigQueryAdapter(BaseAdapter):
         timeout = self.connections.get_timeout(conn)
         with self.connections.exception_handler("LOAD TABLE"):
             self.poll_until_job_completes(job, timeout)
+        self.introspection_cache.invalidate(self.Relation.create(
+            database=database, schema=schema, identifier=table_name
+        ))
 
     @classmethod
     def _catalog_filter_table(
@@ -1,7 +1,9 @@
 from contextlib import contextmanager
 
 import psycopg2
+import psycopg2.extensions
 
+import dbt.clients.agate_helper
 import dbt.exceptions
 from dbt.adapters.base import Credentials
 from dbt.adapters.sql import SQLConnectionManager
@@ -12,6 +14,27 @@ from dataclasses import dataclass
 from typing import Optional
 
 
+def _by_type_code(types):
+    return {
+        type_code: agate_type
+        for typecaster, agate_type in types
+        for type_code in typecaster.values
+    }
+
+
+# the agate types of the columns psycopg2 converts to python values, by type
+# oid
+COLUMN_TYPES = _by_type_code([
+    (psycopg2.extensions.BOOLEAN, dbt.clients.agate_helper.BOOLEAN),
+    (psycopg2.NUMBER, dbt.clients.agate_helper.NUMBER),
+    (psycopg2.STRING, dbt.clients.agate_helper.TEXT),
+    (psycopg2.extensions.DATE, dbt.clients.agate_helper.DATE),
+    (psycopg2.extensions.PYDATETIME, dbt.clients.agate_helper.DATE_TIME),
+    (psycopg2.extensions.PYDATETIMETZ, dbt.clients.agate_helper.DATE_TIME),
+    (psycopg2.extensions.INTERVAL, dbt.clients.agate_helper.TIME_DELTA),
+])
+
+
 @dataclass
 class PostgresCredentials(Credentials):
     host: str
@@ -132,3 +155,8 @@ class PostgresConnectionManager(SQLConnectionManager):
     @classmethod
     def get_status(cls, cursor):
         return cursor.statusmessage
+
+    @classmethod
+    def get_column_types(cls, description):
+        type_codes = cls._type_codes(description)
+        return [COLUMN_TYPES.get(code) for code in type_codes]
@@ -1,13 +1,20 @@
+import inspect
 import re
+import time
 from io import StringIO
 from contextlib import contextmanager
 import datetime
 import pytz
 
 import snowflake.connector
+import snowflake.connector.constants
+import snowflake.connector.cursor
 import snowflake.connector.errors
 
+import dbt.clients.agate_helper
+import dbt.clients.columnar
 import dbt.exceptions
+import dbt.flags
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import serialization
 from dbt.adapters.base import Credentials
@@ -15,7 +22,48 @@ from dbt.adapters.sql import SQLConnectionManager
 from dbt.logger import GLOBAL_LOGGER as logger
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import Any, Dict, List, Optional
+
+
+_USE_WAREHOUSE = re.compile(
+    r"^use\s+warehouse\s+(.+?)\s*;?$", re.IGNORECASE | re.DOTALL
+)
+_BLOCK_COMMENT = re.compile(r"/\*.*?\*/", re.DOTALL)
+_ERROR_LINE = re.compile(r"\bline (\d+) at position\b")
+
+# the agate types of snowflake columns, by type name. TIME and BINARY
+# columns are inferred from their values.
+_AGATE_TYPES = {
+    "FIXED": dbt.clients.agate_helper.NUMBER,
+    "REAL": dbt.clients.agate_helper.NUMBER,
+    "TEXT": dbt.clients.agate_helper.TEXT,
+    "VARIANT": dbt.clients.agate_helper.TEXT,
+    "OBJECT": dbt.clients.agate_helper.TEXT,
+    "ARRAY": dbt.clients.agate_helper.TEXT,
+    "DATE": dbt.clients.agate_helper.DATE,
+    "TIMESTAMP": dbt.clients.agate_helper.DATE_TIME,
+    "TIMESTAMP_LTZ": dbt.clients.agate_helper.DATE_TIME,
+    "TIMESTAMP_TZ": dbt.clients.agate_helper.DATE_TIME,
+    "TIMESTAMP_NTZ": dbt.clients.agate_helper.DATE_TIME,
+    "BOOLEAN": dbt.clients.agate_helper.BOOLEAN,
+}
+_FIELD_ID_TO_NAME = snowflake.connector.constants.FIELD_ID_TO_NAME
+COLUMN_TYPES = {
+    type_code: _AGATE_TYPES[name]
+    for type_code, name in _FIELD_ID_TO_NAME.items()
+    if name in _AGATE_TYPES
+}
+# columns whose values have a time zone
+_TIME_ZONE_TYPE_CODES = frozenset(
+    type_code
+    for type_code, name in _FIELD_ID_TO_NAME.items()
+    if name in ("TIMESTAMP_LTZ", "TIMESTAMP_TZ")
+)
+
+# newer connectors can send several statements in one request
+MULTI_STATEMENT_SUPPORTED = "num_statements" in inspect.signature(
+    snowflake.connector.cursor.SnowflakeCursor.execute
+).parameters
 
 
 @dataclass
@@ -29,6 +77,7 @@ class SnowflakeCredentials(Credentials):
     private_key_path: Optional[str]
     private_key_passphrase: Optional[str]
     client_session_keep_alive: bool = False
+    batch_statements: bool = False
 
     @property
     def type(self):
@@ -43,6 +92,7 @@ class SnowflakeCredentials(Credentials):
             "warehouse",
             "role",
             "client_session_keep_alive",
+            "batch_statements",
         )
 
     def auth_args(self):
@@ -73,9 +123,122 @@ class SnowflakeCredentials(Credentials):
         )
 
 
+@dataclass
+class WarehouseState:
+    """The warehouse a session is using, or None if it isn't known yet, and
+    the warehouse it should switch to before its next query, if any.
+    """
+
+    handle: Any
+    current: Optional[str]
+    wanted: Optional[str] = None
+
+
 class SnowflakeConnectionManager(SQLConnectionManager):
+    """Each session's warehouse is tracked, so dbt only asks Snowflake for it
+    once per session. Switching warehouses is deferred until the next query,
+    so switching back and forth between queries is free.
+    """
+
     TYPE = "snowflake"
 
+    def __init__(self, profile):
+        super().__init__(profile)
+        # by id() of the connection
+        self._warehouses: Dict[int, WarehouseState] = {}
+        batch_statements = profile.credentials.batch_statements
+        if batch_statements and not MULTI_STATEMENT_SUPPORTED:
+            logger.debug(
+                "batch_statements is set, but this version of "
+                "snowflake-connector-python can't run several statements in "
+                "one request. Statements will be run one at a time."
+            )
+
+    @staticmethod
+    def warehouse_key(name: str) -> str:
+        """Snowflake uppercases unquoted identifiers."""
+        if len(name) > 1 and name.startswith('"') and name.endswith('"'):
+            return name[1:-1]
+        return name.upper()
+
+    def _same_warehouse(
+        self, first: Optional[str], second: Optional[str]
+    ) -> bool:
+        if first is None or second is None:
+            return False
+        return self.warehouse_key(first) == self.warehouse_key(second)
+
+    def _set_current_warehouse(
+        self, connection, state, warehouse: Optional[str]
+    ) -> None:
+        state.current = warehouse
+        if warehouse is None:
+            self.set_affinity(connection, None)
+        else:
+            self.set_affinity(connection, self.warehouse_key(warehouse))
+
+    def _warehouse_state(self, connection) -> WarehouseState:
+        handle = connection.handle
+        state = self._warehouses.get(id(connection))
+        if state is None or state.handle is not handle:
+            # a new session starts on the profile's warehouse
+            state = WarehouseState(handle=handle, current=None)
+            self._set_current_warehouse(
+                connection, state, connection.credentials.warehouse
+            )
+            self._warehouses[id(connection)] = state
+        return state
+
+    def get_warehouse(self) -> str:
+        """Get the warehouse this thread's connection is using, including a
+        switch that hasn't happened yet.
+        """
+        connection = self.get_thread_connection()
+        state = self._warehouse_state(connection)
+        if state.wanted is not None:
+            return state.wanted
+        if state.current is None:
+            _, table = self.execute(
+                "select current_warehouse() as warehouse", fetch=True
+            )
+            if len(table) == 0 or len(table[0]) == 0:
+                # can this happen?
+                raise dbt.exceptions.RuntimeException(
+                    "Could not get current warehouse: no results"
+                )
+            self._set_current_warehouse(connection, state, str(table[0][0]))
+        return state.current
+
+    def cleanup_all(self) -> None:
+        super().cleanup_all()
+        with self.lock:
+            self._warehouses.clear()
+
+    def use_warehouse(self, warehouse: str) -> None:
+        """Switch this thread's connection to the given warehouse before its
+        next query. Quotes are never applied.
+        """
+        state = self._warehouse_state(self.get_thread_connection())
+        state.wanted = warehouse
+
+    def _switch_warehouse(self, connection) -> None:
+        state = self._warehouse_state(connection)
+        wanted, state.wanted = state.wanted, None
+        if wanted is None or self._same_warehouse(wanted, state.current):
+            return
+        sql = self._add_query_comment("use warehouse {}".format(wanted))
+        logger.debug(sql)
+        super().add_query(sql, auto_begin=False)
+        self._set_current_warehouse(connection, state, wanted)
+
+    def _track_use_warehouse(self, connection, sql: str) -> None:
+        """Notice warehouse switches in user-provided SQL, like hooks."""
+        match = _USE_WAREHOUSE.match(_BLOCK_COMMENT.sub("", sql).strip())
+        if match is not None:
+            state = self._warehouse_state(connection)
+            state.wanted = None
+            self._set_current_warehouse(connection, state, match.group(1))
+
     @contextmanager
     def exception_handler(self, sql):
         try:
@@ -179,24 +342,156 @@ class SnowflakeConnectionManager(SQLConnectionManager):
         return [part[0] for part in split_query]
 
     @classmethod
-    def process_results(cls, column_names, rows):
+    def get_column_types(cls, description):
+        return [
+            COLUMN_TYPES.get(code) for code in cls._type_codes(description)
+        ]
+
+    @classmethod
+    def get_columnar_result_from_cursor(cls, cursor):
+        # newer connectors can fetch results as Arrow, when the results are
+        # sent in Arrow format
+        fetch_arrow_all = getattr(cursor, "fetch_arrow_all", None)
+        if fetch_arrow_all is not None and cursor.description is not None:
+            try:
+                arrow_table = fetch_arrow_all()
+            except snowflake.connector.errors.NotSupportedError:
+                pass
+            else:
+                max_rows = dbt.flags.MAX_FETCH_ROWS
+                num_rows = 0 if arrow_table is None else arrow_table.num_rows
+                if max_rows is not None and num_rows > max_rows:
+                    dbt.exceptions.raise_too_many_rows(max_rows)
+                column_names = [col[0] for col in cursor.description]
+                return dbt.clients.columnar.table_from_arrow(
+                    arrow_table, column_names
+                )
+        return super().get_columnar_result_from_cursor(cursor)
+
+    @classmethod
+    def convert_rows(cls, description, rows):
         # Override for Snowflake. The datetime objects returned by
         # snowflake-connector-python are not pickleable, so we need
         # to replace them with sane timezones
+        columns = [
+            idx
+            for idx, code in enumerate(cls._type_codes(description))
+            if code in _TIME_ZONE_TYPE_CODES
+        ]
+        if not columns:
+            return rows
+
         fixed = []
         for row in rows:
-            fixed_row = []
-            for col in row:
+            fixed_row = list(row)
+            for idx in columns:
+                col = fixed_row[idx]
                 if isinstance(col, datetime.datetime) and col.tzinfo:
                     offset = col.utcoffset()
                     offset_seconds = offset.total_seconds()
                     new_timezone = pytz.FixedOffset(offset_seconds // 60)
-                    col = col.astimezone(tz=new_timezone)
-                fixed_row.append(col)
-
+                    fixed_row[idx] = col.astimezone(tz=new_timezone)
             fixed.append(fixed_row)
 
-        return super().process_results(column_names, fixed)
+        return fixed
+
+    def _batch_statements(self) -> bool:
+        return (
+            MULTI_STATEMENT_SUPPORTED and
+            self.profile.credentials.batch_statements
+        )
+
+    @staticmethod
+    def _failed_statement(error, statements: List[str]) -> Optional[int]:
+        """Find the index of the statement in a batch that caused the error,
+        from the line number Snowflake reports for compilation errors.
+        """
+        match = _ERROR_LINE.search(error.raw_msg or "")
+        if match is None:
+            return None
+        line = int(match.group(1))
+        start = 1
+        for index, statement in enumerate(statements):
+            start += statement.count("\n") + 1
+            if line < start:
+                return index
+        return None
+
+    @contextmanager
+    def _batch_error_handler(self, statements: List[str]):
+        """Point errors in a batch at the statement that caused them."""
+        try:
+            yield
+        except snowflake.connector.errors.ProgrammingError as e:
+            index = self._failed_statement(e, statements)
+            if index is None:
+                e.msg = "{}\n\nin a batch of {} statements".format(
+                    e.msg, len(statements)
+                )
+            else:
+                e.msg = "{}\n\nin statement {} of {}:\n{}".format(
+                    e.msg, index + 1, len(statements),
+                    statements[index].strip()
+                )
+            raise
+
+    def _add_batch(
+        self, statements: List[str], auto_begin: bool, abridge_sql_log: bool
+    ):
+        """Run the statements in one request, and log each one's status.
+        Return the cursor on the last statement's results, like add_query.
+        """
+        connection = self.get_thread_connection()
+        if auto_begin and connection.transaction_open is False:
+            self.begin()
+
+        logger.debug(
+            'Using {} connection "{}".'.format(self.TYPE, connection.name)
+        )
+
+        # line numbers in errors count from the start of the batch, so
+        # _failed_statement needs exactly what was sent
+        statements = [
+            statement.rstrip().rstrip(";") + ";" for statement in statements
+        ]
+        sql = "\n".join(statements)
+        batch_handler = self._batch_error_handler(statements)
+        with self.exception_handler(sql), batch_handler:
+            if abridge_sql_log:
+                log_sql = "{}...".format(sql[:512])
+            else:
+                log_sql = sql
+
+            logger.debug(
+                "On {connection_name}: {sql}",
+                connection_name=connection.name,
+                sql=log_sql,
+            )
+            pre = time.time()
+
+            cursor = connection.handle.cursor()
+            cursor.execute(sql, num_statements=len(statements))
+            elapsed = time.time() - pre
+            self.record_query(elapsed)
+
+            for index in range(len(statements)):
+                if index > 0 and cursor.nextset() is None:
+                    raise dbt.exceptions.InternalException(
+                        "Expected {} results from a batch of statements, "
+                        "got {}".format(len(statements), index)
+                    )
+                logger.debug(
+                    "SQL status (statement {index} of {count}): {status}",
+                    index=index + 1,
+                    count=len(statements),
+                    status=self.get_status(cursor),
+                )
+            logger.debug(
+                "Ran {} statements in {:0.2f} seconds"
+                .format(len(statements), elapsed)
+            )
+
+            return connection, cursor
 
     def add_query(self, sql, auto_begin=True, bindings=None, abridge_sql_log=False):
 
@@ -210,6 +505,9 @@ class SnowflakeConnectionManager(SQLConnectionManager):
 
         queries = self._split_queries(sql)
 
+        self._switch_warehouse(self.get_thread_connection())
+
+        statements = []
         for individual_query in queries:
             # hack -- after the last ';', remove comments and don't run
             # empty queries. this avoids using exceptions as flow control,
@@ -218,12 +516,24 @@ class SnowflakeConnectionManager(SQLConnectionManager):
                 re.compile("^.*(--.*)$", re.MULTILINE), "", individual_query
             ).strip()
 
-            if without_comments == "":
-                continue
+            if without_comments != "":
+                statements.append((individual_query, without_comments))
 
-            connection, cursor = super().add_query(
-                individual_query, auto_begin, bindings=bindings, abridge_sql_log=abridge_sql_log
+        if len(statements) > 1 and not bindings and self._batch_statements():
+            connection, cursor = self._add_batch(
+                [query for query, _ in statements], auto_begin, abridge_sql_log
             )
+            for _, without_comments in statements:
+                self._track_use_warehouse(connection, without_comments)
+        else:
+            for individual_query, without_comments in statements:
+                connection, cursor = super().add_query(
+                    individual_query,
+                    auto_begin,
+                    bindings=bindings,
+                    abridge_sql_log=abridge_sql_log,
+                )
+                self._track_use_warehouse(connection, without_comments)
 
         if cursor is None:
             conn = self.get_thread_connection()
@@ -3,8 +3,8 @@ from typing import Mapping, Any, Optional
 from dbt.adapters.sql import SQLAdapter
 from dbt.adapters.snowflake import SnowflakeConnectionManager
 from dbt.adapters.snowflake import SnowflakeRelation
+from dbt.contracts.graph.compiled import CompileResultNode
 from dbt.utils import filter_null_values
-from dbt.exceptions import RuntimeException
 
 
 class SnowflakeAdapter(SQLAdapter):
@@ -45,20 +45,22 @@ class SnowflakeAdapter(SQLAdapter):
         )
 
     def _get_warehouse(self) -> str:
-        _, table = self.execute(
-            'select current_warehouse() as warehouse',
-            fetch=True
-        )
-        if len(table) == 0 or len(table[0]) == 0:
-            # can this happen?
-            raise RuntimeException(
-                'Could not get current warehouse: no results'
-            )
-        return str(table[0][0])
+        return self.connections.get_warehouse()
 
     def _use_warehouse(self, warehouse: str):
-        """Use the given warehouse. Quotes are never applied."""
-        self.execute('use warehouse {}'.format(warehouse))
+        """Use the given warehouse, from the next query on. Quotes are never
+        applied.
+        """
+        self.connections.use_warehouse(warehouse)
+
+    def connection_affinity(self, node: CompileResultNode) -> Optional[str]:
+        """Prefer connections that are already using the node's warehouse.
+        """
+        default_warehouse = self.config.credentials.warehouse
+        warehouse = node.config.get('snowflake_warehouse', default_warehouse)
+        if warehouse is None:
+            return None
+        return self.connections.warehouse_key(warehouse)
 
     def pre_model_hook(self, config: Mapping[str, Any]) -> Optional[str]:
         default_warehouse = self.config.credentials.warehouse
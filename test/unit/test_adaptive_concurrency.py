@@ -0,0 +1,103 @@
+import asyncio
+import threading
+import unittest
+
+from dbt.concurrency import AdaptiveConcurrency, AsyncSlots, WINDOW_SIZE
+
+
+class AdaptiveConcurrencyTest(unittest.TestCase):
+    def _window(self, controller, elapsed, queued=None):
+        for _ in range(WINDOW_SIZE):
+            controller.record(elapsed, queued)
+
+    def test_starts_at_half(self):
+        self.assertEqual(AdaptiveConcurrency(8).current_limit, 4)
+        self.assertEqual(AdaptiveConcurrency(1).current_limit, 1)
+        self.assertEqual(AdaptiveConcurrency(0).current_limit, 1)
+
+    def test_increases_up_to_max(self):
+        controller = AdaptiveConcurrency(6, initial=2)
+        controller.record(1.0)
+        # nothing changes until a window is full
+        self.assertEqual(controller.current_limit, 2)
+        for _ in range(WINDOW_SIZE - 1):
+            controller.record(1.0)
+        self.assertEqual(controller.current_limit, 3)
+        for _ in range(5):
+            self._window(controller, 1.0)
+        self.assertEqual(controller.current_limit, 6)
+
+    def test_decreases_on_queued_time(self):
+        controller = AdaptiveConcurrency(16, initial=10)
+        self._window(controller, 1.0, 0.5)
+        self.assertEqual(controller.current_limit, 7)
+        # a little queueing is fine
+        self._window(controller, 1.0, 0.1)
+        self.assertEqual(controller.current_limit, 8)
+
+    def test_decreases_on_latency(self):
+        controller = AdaptiveConcurrency(16, initial=10)
+        self._window(controller, 1.0)
+        self.assertEqual(controller.current_limit, 11)
+        self._window(controller, 5.0)
+        self.assertEqual(controller.current_limit, 7)
+        # the slow queries only let the baseline drift up a little
+        self.assertAlmostEqual(controller.baseline, 1.1)
+
+    def test_never_below_one(self):
+        controller = AdaptiveConcurrency(4, initial=1)
+        self._window(controller, 1.0, 0.9)
+        self.assertEqual(controller.current_limit, 1)
+
+    def test_acquire_waits_for_release(self):
+        controller = AdaptiveConcurrency(2, initial=1)
+        self.assertTrue(controller.try_acquire())
+        self.assertFalse(controller.try_acquire())
+        acquired = threading.Event()
+
+        def acquire():
+            controller.acquire()
+            acquired.set()
+
+        thread = threading.Thread(target=acquire)
+        thread.start()
+        self.assertFalse(acquired.wait(0.1))
+        controller.release()
+        thread.join()
+        self.assertTrue(acquired.is_set())
+        self.assertEqual(controller.in_flight, 1)
+
+    def test_acquire_wakes_when_limit_rises(self):
+        controller = AdaptiveConcurrency(2, initial=1)
+        controller.acquire()
+        thread = threading.Thread(target=controller.acquire)
+        thread.start()
+        self._window(controller, 1.0)
+        thread.join()
+        self.assertEqual(controller.in_flight, 2)
+
+    def test_async_slots(self):
+        controller = AdaptiveConcurrency(4, initial=2)
+        state = {'active': 0, 'max_active': 0}
+
+        async def work(slots):
+            await slots.acquire()
+            try:
+                state['active'] += 1
+                state['max_active'] = max(state['max_active'], state['active'])
+                await asyncio.sleep(0.01)
+                state['active'] -= 1
+            finally:
+                slots.release()
+
+        async def main():
+            slots = AsyncSlots(controller)
+            await asyncio.gather(*(work(slots) for _ in range(10)))
+
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(main())
+        finally:
+            loop.close()
+        self.assertEqual(state['max_active'], 2)
+        self.assertEqual(controller.in_flight, 0)
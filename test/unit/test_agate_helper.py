@@ -1,5 +1,7 @@
 import unittest
 
+import agate
+
 from datetime import datetime
 from decimal import Decimal
 from isodate import tzinfo
@@ -63,3 +65,26 @@ class TestAgateHelper(unittest.TestCase):
         self.assertEqual(len(tbl), len(EXPECTED))
         for idx, row in enumerate(tbl):
             self.assertEqual(list(row), EXPECTED[idx])
+
+    def test_from_rows(self):
+        column_names = ['a', 'b', 'c']
+        rows = [
+            (1, '0012', 'True'),
+            (Decimal('2.5'), '13', 'False'),
+        ]
+        column_types = [agate_helper.NUMBER, agate_helper.TEXT, None]
+        tbl = agate_helper.table_from_rows(rows, column_names, column_types)
+        self.assertEqual(tbl.column_names, ('a', 'b', 'c'))
+        # text columns stay text, even if the values look like numbers
+        self.assertIsInstance(tbl.column_types[1], agate.data_types.Text)
+        # columns without a type are inferred
+        self.assertIsInstance(tbl.column_types[2], agate.data_types.Boolean)
+        self.assertEqual(
+            [list(row) for row in tbl],
+            [[1, '0012', True], [Decimal('2.5'), '13', False]],
+        )
+
+    def test_from_rows_empty(self):
+        tbl = agate_helper.table_from_rows([], ['a', 'b'])
+        self.assertEqual(tbl.column_names, ('a', 'b'))
+        self.assertEqual(len(tbl), 0)
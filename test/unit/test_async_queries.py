@@ -0,0 +1,302 @@
+import asyncio
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from unittest import mock
+
+import agate
+
+from dbt import linker
+from dbt.adapters.base import BaseConnectionManager
+from dbt.contracts.connection import ConnectionState
+from dbt.contracts.results import RunModelResult
+from dbt.graph.dag import DAG
+from dbt.node_runners import TestRunner
+from dbt.task.runnable import GraphRunnableTask
+
+
+LATENCY = 0.2
+# how long each call to the warehouse's API blocks for
+API_LATENCY = 0.05
+
+
+class StubJob:
+    def __init__(self, sql, connection):
+        self.sql = sql
+        self.connection = connection
+        self.thread = threading.get_ident()
+        self.done_at = time.time() + LATENCY
+
+
+class StubConnectionManager(BaseConnectionManager):
+    """Pretends every query takes LATENCY seconds on the warehouse."""
+    TYPE = 'stub'
+
+    def __init__(self, profile):
+        super().__init__(profile)
+        self.jobs = []
+
+    @contextmanager
+    def exception_handler(self, sql):
+        yield
+
+    def cancel_open(self):
+        return []
+
+    @classmethod
+    def open(cls, connection):
+        connection.handle = object()
+        connection.state = ConnectionState.OPEN
+        return connection
+
+    def begin(self):
+        pass
+
+    def commit(self):
+        pass
+
+    def execute(self, sql, auto_begin=False, fetch=False):
+        time.sleep(LATENCY)
+        return 'OK', agate.Table([[0]], ['failures'])
+
+    @classmethod
+    def supports_async_jobs(cls):
+        return True
+
+    def submit_job(self, connection, sql):
+        time.sleep(API_LATENCY)
+        job = StubJob(sql, connection)
+        self.jobs.append(job)
+        return job
+
+    def job_done(self, job):
+        time.sleep(API_LATENCY)
+        return time.time() >= job.done_at
+
+    def job_result(self, connection, job, fetch=False):
+        time.sleep(API_LATENCY)
+        return 'OK', agate.Table([[0]], ['failures'])
+
+
+class ExecuteAsyncTest(unittest.TestCase):
+    def setUp(self):
+        profile = mock.MagicMock(threads=20, query_comment=None)
+        self.connections = StubConnectionManager(profile)
+
+    def tearDown(self):
+        self.connections.cleanup_all()
+
+    def test_queries_share_one_loop(self):
+        async def query(idx):
+            self.connections.set_connection_name('node_{}'.format(idx))
+            try:
+                return await self.connections.execute_async(
+                    'select {}'.format(idx), fetch=True
+                )
+            finally:
+                self.connections.release()
+
+        async def main():
+            return await asyncio.gather(*(query(idx) for idx in range(20)))
+
+        loop = asyncio.new_event_loop()
+        loop.set_default_executor(ThreadPoolExecutor(20))
+        started = time.time()
+        try:
+            results = loop.run_until_complete(main())
+        finally:
+            loop.close()
+        elapsed = time.time() - started
+
+        self.assertEqual(len(results), 20)
+        self.assertEqual(results[0][1][0][0], 0)
+        # they ran at the same time, not one after another. Blocking API
+        # calls on the loop would take at least 20 * 3 * API_LATENCY.
+        self.assertLess(elapsed, LATENCY * 5)
+        jobs = self.connections.jobs
+        self.assertNotIn(threading.get_ident(), {job.thread for job in jobs})
+        # each task had its own connection
+        self.assertEqual(len({id(job.connection) for job in jobs}), 20)
+
+
+class FakeRunner:
+    def __init__(self, node, use_async, tracker):
+        self.node = node
+        self.node_index = 1
+        self.use_async = use_async
+        self.tracker = tracker
+        self.skip = False
+
+    def supports_async(self):
+        return self.use_async
+
+    def do_skip(self, cause=None):
+        self.skip = True
+
+    def get_result_status(self, result):
+        return {'node_status': 'passed'}
+
+    def _result(self):
+        return RunModelResult(
+            node=self.node, status='OK',
+            thread_id=threading.current_thread().name,
+        )
+
+    def run_with_hooks(self, manifest):
+        with self.tracker.running(self.node.unique_id):
+            time.sleep(LATENCY / 4)
+        return self._result()
+
+    async def run_with_hooks_async(self, manifest):
+        with self.tracker.running(self.node.unique_id):
+            await asyncio.sleep(LATENCY / 4)
+        return self._result()
+
+
+class Tracker:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.active = 0
+        self.max_active = 0
+        self.started = []
+        self.finished = []
+
+    @contextmanager
+    def running(self, uid):
+        with self.lock:
+            self.started.append(uid)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            yield
+        finally:
+            with self.lock:
+                self.active -= 1
+                self.finished.append(uid)
+
+
+class RunQueueAsyncTest(unittest.TestCase):
+    def setUp(self):
+        self.patcher = mock.patch.object(linker, 'is_blocking_dependency')
+        self.patcher.start().return_value = True
+        # two parents, each with five children
+        edges = [
+            ('p{}'.format(p), 'c{}{}'.format(p, c))
+            for p in range(2) for c in range(5)
+        ]
+        self.graph = DAG(edges=edges)
+        manifest = mock.MagicMock()
+        manifest.expect.side_effect = lambda n: mock.MagicMock(
+            unique_id=n, is_ephemeral_model=False
+        )
+
+        with mock.patch('dbt.task.base.register_adapter'):
+            self.task = GraphRunnableTask(mock.MagicMock(), mock.MagicMock())
+        self.task.manifest = manifest
+        self.task.linker = mock.MagicMock()
+        self.task.linker.get_dependent_nodes.return_value = []
+        self.task.job_queue = linker.GraphQueue(self.graph, manifest)
+        self.tracker = Tracker()
+
+    def tearDown(self):
+        self.patcher.stop()
+
+    def _run(self, use_async, limit):
+        self.task.get_runner = lambda node: FakeRunner(
+            node, use_async(node.unique_id), self.tracker
+        )
+        executor = ThreadPoolExecutor(max_workers=limit)
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(
+                self.task.run_queue_async(executor, limit)
+            )
+        finally:
+            loop.close()
+            executor.shutdown()
+
+    def test_parents_before_children(self):
+        self._run(lambda uid: True, limit=4)
+        self.assertEqual(len(self.task.node_results), 12)
+        for uid in self.graph:
+            if uid.startswith('c'):
+                parent = 'p' + uid[1]
+                self.assertLess(self.tracker.finished.index(parent),
+                                self.tracker.started.index(uid))
+        self.assertEqual(self.tracker.max_active, 4)
+        threads = {r.thread_id for r in self.task.node_results}
+        self.assertEqual(threads, {threading.current_thread().name})
+
+    def test_mixed_runners(self):
+        # children of p0 need a thread, everything else runs on the loop
+        self._run(lambda uid: not uid.startswith('c0'), limit=3)
+        self.assertEqual(len(self.task.node_results), 12)
+        self.assertLessEqual(self.tracker.max_active, 3)
+        by_uid = {
+            r.node.unique_id: r.thread_id for r in self.task.node_results
+        }
+        main_thread = threading.current_thread().name
+        self.assertEqual(by_uid['p0'], main_thread)
+        self.assertNotEqual(by_uid['c00'], main_thread)
+
+    def test_blocking_calls_use_the_task_threads(self):
+        seen = {}
+
+        async def run_queue_async(executor, limit):
+            loop = asyncio.get_event_loop()
+            seen['thread'] = await loop.run_in_executor(
+                None, lambda: threading.current_thread().name
+            )
+            seen['executor'] = executor
+
+        self.task.run_queue_async = run_queue_async
+        self.task.execute_nodes_async(3)
+        # the loop's default executor is the --threads pool
+        self.assertTrue(seen['thread'].startswith('Thread_'))
+        # and it's shut down with the loop
+        with self.assertRaises(RuntimeError):
+            seen['executor'].submit(print)
+
+    def test_runner_exception_raised(self):
+        def get_runner(node):
+            runner = FakeRunner(node, True, self.tracker)
+            if node.unique_id == 'p1':
+                async def boom(manifest):
+                    raise ValueError('boom')
+                runner.run_with_hooks_async = boom
+            return runner
+
+        self.task.get_runner = get_runner
+        loop = asyncio.new_event_loop()
+        try:
+            with self.assertRaises(ValueError):
+                loop.run_until_complete(
+                    self.task.run_queue_async(None, 4)
+                )
+        finally:
+            loop.close()
+
+
+class TestRunnerAsyncTest(unittest.TestCase):
+    def test_execute_async(self):
+        adapter = mock.MagicMock()
+
+        async def execute_async(sql, fetch=False):
+            return 'OK', agate.Table([[3]], ['failures'])
+
+        adapter.execute_async = execute_async
+        adapter.supports_async_queries.return_value = True
+        test = mock.MagicMock(wrapped_sql='select 3')
+        test.config.severity = 'error'
+        runner = TestRunner(mock.MagicMock(), adapter, test, 1, 1)
+        self.assertTrue(runner.supports_async())
+
+        loop = asyncio.new_event_loop()
+        try:
+            result = loop.run_until_complete(runner.execute_async(test, None))
+        finally:
+            loop.close()
+        self.assertEqual(result.status, 3)
+        self.assertTrue(result.fail)
@@ -1,5 +1,6 @@
 import unittest
 from contextlib import contextmanager
+from datetime import datetime, timedelta
 from unittest.mock import patch, MagicMock, Mock
 
 import hologram
@@ -302,7 +303,7 @@ class TestBigQueryConnectionManager(unittest.TestCase):
 
     def setUp(self):
         credentials = Mock(BigQueryCredentials)
-        profile = Mock(query_comment=None, credentials=credentials)
+        profile = Mock(query_comment=None, credentials=credentials, threads=1)
         self.connections = BigQueryConnectionManager(profile=profile)
         self.mock_client = Mock(
           dbt.adapters.bigquery.impl.google.cloud.bigquery.Client)
@@ -362,6 +363,12 @@ class TestBigQueryConnectionManager(unittest.TestCase):
     @patch('dbt.adapters.bigquery.impl.google.cloud.bigquery')
     def test_query_and_results(self, mock_bq):
         self.connections.get_timeout = lambda x: 100.0
+        created = datetime(2020, 1, 1)
+        job = self.mock_client.query.return_value
+        job.created = created
+        job.started = created + timedelta(seconds=2)
+        job.ended = created + timedelta(seconds=5)
+        self.connections.query_listener = Mock()
 
         self.connections._query_and_results(
           self.mock_client, 'sql', self.mock_connection,
@@ -370,3 +377,4 @@ class TestBigQueryConnectionManager(unittest.TestCase):
         mock_bq.QueryJobConfig.assert_called_once()
         self.mock_client.query.assert_called_once_with(
           'sql', job_config=mock_bq.QueryJobConfig())
+        self.connections.query_listener.assert_called_once_with(5.0, 2.0)
@@ -1,5 +1,5 @@
 from unittest import TestCase
-from dbt.adapters.cache import RelationsCache
+from dbt.adapters.cache import IntrospectionCache, RelationsCache
 from dbt.adapters.base.relation import BaseRelation
 from multiprocessing.dummy import Pool as ThreadPool
 import dbt.exceptions
@@ -489,3 +489,69 @@ class TestComplexCache(TestCase):
         self.assertEqual(len(self.cache.get_relations('dbt', 'bar')), 1)
         self.assertEqual(len(self.cache.get_relations('dbt_2', 'foo')), 1)
         self.assertEqual(len(self.cache.relations), 2)
+
+
+class TestIntrospectionCache(TestCase):
+    def setUp(self):
+        self.cache = IntrospectionCache()
+        self.calls = 0
+
+    def fetch(self):
+        self.calls += 1
+        return self.calls
+
+    def get(self, identifier, key='columns', schema='schema'):
+        relation = make_relation('dbt', schema, identifier)
+        return self.cache.get(relation, key, self.fetch)
+
+    def test_hits_and_misses(self):
+        self.assertEqual(self.get('foo'), 1)
+        self.assertEqual(self.get('FOO'), 1)
+        self.assertEqual(self.get('foo', key='other'), 2)
+        self.assertEqual(self.get('bar'), 3)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 3))
+
+        self.cache.clear()
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 0))
+        self.assertEqual(self.get('foo'), 4)
+
+    def test_invalidate(self):
+        self.get('foo')
+        self.get('foo', key='other')
+        self.get('bar')
+        self.cache.invalidate(make_relation('dbt', 'schema', 'Foo'))
+        self.assertEqual(self.get('foo'), 4)
+        self.assertEqual(self.get('foo', key='other'), 5)
+        self.assertEqual(self.get('bar'), 3)
+
+    def test_invalidate_schema(self):
+        self.get('foo')
+        self.get('foo', schema='other')
+        self.cache.invalidate_schema('dbt', 'SCHEMA')
+        self.assertEqual(self.get('foo'), 3)
+        self.assertEqual(self.get('foo', schema='other'), 2)
+
+    def test_invalidate_for_sql(self):
+        self.get('foo')
+        self.get('bar')
+        self.cache.invalidate_for_sql('select * from "dbt"."schema"."foo"')
+        self.cache.invalidate_for_sql('/* drop table foo */ select 1 as foo')
+        self.cache.invalidate_for_sql('insert into foo -- alter table foo\n')
+        self.assertEqual(self.get('foo'), 1)
+
+        self.cache.invalidate_for_sql(
+            'begin;\n  CREATE OR REPLACE TABLE "dbt"."schema"."FOO" as (\n'
+            '    select * from baz\n  );'
+        )
+        self.assertEqual(self.get('foo'), 3)
+        self.assertEqual(self.get('bar'), 2)
+
+    def test_invalidated_while_fetching(self):
+        relation = make_relation('dbt', 'schema', 'foo')
+
+        def fetch():
+            self.cache.invalidate(relation)
+            return 'stale'
+
+        self.assertEqual(self.cache.get(relation, 'columns', fetch), 'stale')
+        self.assertEqual(self.get('foo'), 1)
@@ -0,0 +1,100 @@
+import unittest
+from decimal import Decimal
+from unittest import mock
+
+import agate
+
+from dbt.adapters.sql import SQLConnectionManager
+from dbt.clients import columnar
+from dbt.context.common import _store_result
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+
+def _cursor(column_names, batches):
+    cursor = mock.MagicMock()
+    cursor.description = [(name, None) for name in column_names]
+    cursor.fetchmany.side_effect = list(batches) + [[]]
+    return cursor
+
+
+@unittest.skipIf(pyarrow is None, 'requires pyarrow')
+class TestColumnarTable(unittest.TestCase):
+    def setUp(self):
+        cursor = _cursor(['id', 'amount', 'name'], [
+            [(1, None, 'a'), (2, None, None)],
+            [(3, Decimal('1.5'), 'c'), (4, Decimal('10.25'), 'd')],
+        ])
+        self.table = columnar.table_from_batches(
+            ['id', 'amount', 'name'],
+            SQLConnectionManager.fetch_batches(cursor, batch_size=2),
+        )
+        cursor.fetchmany.assert_called_with(2)
+
+    def test_types_unified_across_batches(self):
+        self.assertEqual(len(self.table.arrow.column('amount').chunks), 2)
+        self.assertEqual(
+            self.table.columns['amount'].values(),
+            [None, None, Decimal('1.5'), Decimal('10.25')],
+        )
+
+    def test_agate_interface(self):
+        table = self.table
+        self.assertEqual(table.column_names, ('id', 'amount', 'name'))
+        self.assertEqual(len(table), 4)
+        self.assertEqual(len(table.rows), 4)
+        self.assertEqual(table.columns[0].values(), [1, 2, 3, 4])
+        self.assertEqual(table.columns['name'].values_without_nulls(),
+                         ['a', 'c', 'd'])
+        self.assertEqual(table.columns.keys(), ['id', 'amount', 'name'])
+
+        row = table.rows[2]
+        self.assertEqual(row[0], 3)
+        self.assertEqual(row['name'], 'c')
+        self.assertEqual(row.dict(),
+                         {'id': 3, 'amount': Decimal('1.5'), 'name': 'c'})
+        self.assertEqual(table.rows[-1]['id'], 4)
+        self.assertEqual([r['id'] for r in table], [1, 2, 3, 4])
+        with self.assertRaises(IndexError):
+            table.rows[4]
+
+    def test_to_agate(self):
+        converted = self.table.to_agate()
+        self.assertIsInstance(converted, agate.Table)
+        self.assertEqual(converted.column_names, self.table.column_names)
+        self.assertEqual([list(row) for row in converted],
+                         [list(row) for row in self.table])
+
+    def test_from_agate(self):
+        table = agate.Table([(1, 'a'), (2, 'b')], ['x', 'y'])
+        converted = columnar.table_from_agate(table)
+        self.assertEqual(converted.columns['y'].values(), ['a', 'b'])
+
+    def test_empty_results(self):
+        table = columnar.table_from_batches(['a', 'b'], [])
+        self.assertEqual(table.column_names, ('a', 'b'))
+        self.assertEqual(len(table), 0)
+        self.assertEqual(list(table), [])
+
+        table = columnar.table_from_arrow(None, ['a'])
+        self.assertEqual(table.column_names, ('a',))
+        self.assertEqual(len(table), 0)
+
+    def test_store_result(self):
+        sql_results = {}
+        _store_result(sql_results)('name', status='OK',
+                                   agate_table=self.table)
+        result = sql_results['name']
+        self.assertIs(result['table'], self.table)
+        self.assertEqual(result['data'][1][0], 2)
+        self.assertEqual(len(result['data']), 4)
+
+
+class TestWithoutPyarrow(unittest.TestCase):
+    def test_import_error(self):
+        with mock.patch.dict('sys.modules', {'pyarrow': None}):
+            with self.assertRaises(columnar.dbt.exceptions.RuntimeException):
+                columnar.table_from_batches(['a'], [])
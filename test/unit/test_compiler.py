@@ -394,3 +394,95 @@ class CompilerTest(unittest.TestCase):
 
         self.assertTrue(output_graph.nodes['model.root.ephemeral'].extra_ctes_injected)
         self.assertTrue(output_graph.nodes['model.root.ephemeral_level_two'].extra_ctes_injected)
+
+    def _make_model(self, name, config, compiled_sql, refs=()):
+        return CompiledModelNode(
+            name=name,
+            database='dbt',
+            schema='analytics',
+            alias=name,
+            resource_type=NodeType.Model,
+            unique_id='model.root.{}'.format(name),
+            fqn=['root_project', name],
+            package_name='root',
+            root_path='/usr/src/app',
+            refs=[],
+            sources=[],
+            depends_on=DependsOn(
+                nodes=['model.root.{}'.format(r) for r in refs]
+            ),
+            config=config,
+            tags=[],
+            path='{}.sql'.format(name),
+            original_file_path='{}.sql'.format(name),
+            raw_sql=compiled_sql,
+            compiled=True,
+            extra_ctes_injected=False,
+            extra_ctes=[
+                InjectedCTE(id='model.root.{}'.format(r), sql=None)
+                for r in refs
+            ],
+            injected_sql='',
+            compiled_sql=compiled_sql,
+        )
+
+    def test__prepend_ctes__deep_chain_fan_out(self):
+        # a 200-deep chain of ephemeral models, fanning out into 1000 models
+        # that each ref the end of the chain and some model in its middle.
+        depth = 200
+        fan_out = 1000
+        ephemeral_config = self.model_config.replace(materialized='ephemeral')
+
+        nodes = {}
+        for idx in range(depth):
+            name = 'ephemeral_{}'.format(idx)
+            if idx == 0:
+                refs = []
+                sql = 'select * from source_table'
+            else:
+                refs = ['ephemeral_{}'.format(idx - 1)]
+                sql = 'select * from __dbt__CTE__ephemeral_{}'.format(idx - 1)
+            node = self._make_model(name, ephemeral_config, sql, refs)
+            nodes[node.unique_id] = node
+
+        for idx in range(fan_out):
+            name = 'view_{}'.format(idx)
+            middle = 'ephemeral_{}'.format(idx % depth)
+            tail = 'ephemeral_{}'.format(depth - 1)
+            sql = (
+                'select * from __dbt__CTE__{} join __dbt__CTE__{} using (id)'
+                .format(tail, middle)
+            )
+            node = self._make_model(
+                name, self.model_config, sql, [tail, middle]
+            )
+            nodes[node.unique_id] = node
+
+        manifest = Manifest(
+            macros={},
+            nodes=nodes,
+            docs={},
+            generated_at='2018-02-14T09:15:13Z',
+            disabled=[],
+            files={},
+        )
+
+        expected_ids = [
+            'model.root.ephemeral_{}'.format(idx) for idx in range(depth)
+        ]
+        for idx in range(fan_out):
+            unique_id = 'model.root.view_{}'.format(idx)
+            result, manifest = dbt.compilation.prepend_ctes(
+                manifest.nodes[unique_id], manifest
+            )
+            self.assertTrue(result.extra_ctes_injected)
+            self.assertEqual([c.id for c in result.extra_ctes], expected_ids)
+
+        last = manifest.nodes['model.root.view_{}'.format(fan_out - 1)]
+        self.assertTrue(last.injected_sql.startswith(
+            'with __dbt__CTE__ephemeral_0 as (\nselect * from source_table\n)'
+        ))
+        for idx in range(depth):
+            node = manifest.nodes['model.root.ephemeral_{}'.format(idx)]
+            self.assertTrue(node.extra_ctes_injected)
+            self.assertEqual(len(node.extra_ctes), idx)
@@ -720,6 +720,25 @@ class TestProject(BaseConfigTest):
             ['{{ logging.log_run_end_event() }}']
         )
 
+    def test_concurrency_limits(self):
+        self.default_project_data['concurrency-limits'] = {
+            'tag:heavy': 2, 'transforming_xs': 1,
+        }
+        project = dbt.config.Project.from_project_config(
+            self.default_project_data
+        )
+        self.assertEqual(project.concurrency_limits,
+                         {'tag:heavy': 2, 'transforming_xs': 1})
+        self.assertEqual(
+            project.to_project_config()['concurrency-limits'],
+            {'tag:heavy': 2, 'transforming_xs': 1},
+        )
+
+        self.default_project_data['concurrency-limits'] = {'tag:heavy': 0}
+        with self.assertRaises(dbt.exceptions.DbtProjectError) as exc:
+            dbt.config.Project.from_project_config(self.default_project_data)
+        self.assertIn('tag:heavy', str(exc.exception))
+
     def test_invalid_project_name(self):
         self.default_project_data['name'] = 'invalid-project-name'
         with self.assertRaises(dbt.exceptions.DbtProjectError) as exc:
@@ -0,0 +1,221 @@
+import threading
+import unittest
+from contextlib import contextmanager
+from unittest import mock
+
+import dbt.adapters.base.connections
+from dbt.adapters.base import BaseConnectionManager
+from dbt.contracts.connection import ConnectionState
+
+
+class FakeHandle:
+    def __init__(self, number):
+        self.number = number
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class FakeConnectionManager(BaseConnectionManager):
+    TYPE = 'fake'
+    opened = 0
+    opened_lock = threading.Lock()
+    healthy = True
+
+    @contextmanager
+    def exception_handler(self, sql):
+        yield
+
+    def cancel_open(self):
+        return []
+
+    @classmethod
+    def open(cls, connection):
+        if connection.state == ConnectionState.OPEN:
+            return connection
+        with cls.opened_lock:
+            cls.opened += 1
+            connection.handle = FakeHandle(cls.opened)
+        connection.state = ConnectionState.OPEN
+        return connection
+
+    @classmethod
+    def is_healthy(cls, connection):
+        return cls.healthy
+
+    def begin(self):
+        pass
+
+    def commit(self):
+        pass
+
+    def execute(self, sql, auto_begin=False, fetch=False):
+        return 'OK', None
+
+
+class ConnectionPoolTest(unittest.TestCase):
+    def setUp(self):
+        FakeConnectionManager.opened = 0
+        FakeConnectionManager.healthy = True
+        profile = mock.MagicMock(threads=2, query_comment=None)
+        self.connections = FakeConnectionManager(profile)
+
+    def tearDown(self):
+        self.connections.cleanup_all()
+
+    def _in_thread(self, func):
+        result = []
+        thread = threading.Thread(target=lambda: result.append(func()))
+        thread.start()
+        thread.join()
+        return result[0]
+
+    def _use_connection(self, name):
+        conn = self.connections.set_connection_name(name)
+        handle = conn.handle
+        self.connections.release()
+        return conn, handle
+
+    def test_released_connection_reused_by_other_thread(self):
+        conn, handle = self._use_connection('first')
+        other, other_handle = self._in_thread(
+            lambda: self._use_connection('second')
+        )
+        self.assertIs(other, conn)
+        self.assertIs(other_handle, handle)
+        self.assertEqual(other.name, 'second')
+        self.assertEqual(FakeConnectionManager.opened, 1)
+        self.assertEqual(self.connections.pool_stats.opened, 1)
+        self.assertEqual(self.connections.pool_stats.reused, 1)
+        # the connection moved to the other thread
+        self.assertIsNone(self.connections.get_if_exists())
+
+    def test_connection_in_use_not_shared(self):
+        conn = self.connections.set_connection_name('first')
+        conn.handle
+        other, _ = self._in_thread(lambda: self._use_connection('second'))
+        self.assertIsNot(other, conn)
+        self.assertIs(self.connections.get_thread_connection(), conn)
+        self.assertEqual(FakeConnectionManager.opened, 2)
+
+    def test_thread_reclaims_its_own_connection(self):
+        conn, _ = self._use_connection('first')
+        again, _ = self._use_connection('first')
+        self.assertIs(again, conn)
+        self.assertEqual(FakeConnectionManager.opened, 1)
+
+    def test_full_pool_waits_for_release(self):
+        self.connections.pool_size = 1
+        conn = self.connections.set_connection_name('first')
+        conn.handle
+        got = []
+        thread = threading.Thread(
+            target=lambda: got.append(self._use_connection('second')[0])
+        )
+        thread.start()
+        thread.join(0.1)
+        self.assertEqual(got, [])
+        self.connections.release()
+        thread.join()
+        self.assertEqual(got, [conn])
+        self.assertEqual(self.connections.pool_stats.waits, 1)
+        self.assertEqual(FakeConnectionManager.opened, 1)
+
+    @mock.patch.object(dbt.adapters.base.connections, 'POOL_WAIT_TIMEOUT', 0)
+    def test_full_pool_overflows_after_timeout(self):
+        self.connections.pool_size = 1
+        conn = self.connections.set_connection_name('first')
+        conn.handle
+        other, _ = self._in_thread(lambda: self._use_connection('second'))
+        self.assertIsNot(other, conn)
+        self.assertEqual(FakeConnectionManager.opened, 2)
+
+    @mock.patch.object(
+        dbt.adapters.base.connections, 'POOL_HEALTH_CHECK_AGE', -1
+    )
+    def test_unhealthy_connection_reopened(self):
+        conn, handle = self._use_connection('first')
+        FakeConnectionManager.healthy = False
+        other, other_handle = self._in_thread(
+            lambda: self._use_connection('second')
+        )
+        self.assertIs(other, conn)
+        self.assertIsNot(other_handle, handle)
+        self.assertTrue(handle.closed)
+        self.assertEqual(self.connections.pool_stats.discarded, 1)
+        self.assertEqual(FakeConnectionManager.opened, 2)
+
+    def test_prewarm(self):
+        self.connections.prewarm(10)
+        # the pool holds one connection per thread, and one more for the main
+        # thread
+        self.assertEqual(FakeConnectionManager.opened, 3)
+        self.assertEqual(self.connections.pool_stats.opened, 3)
+
+        # both threads hold their connection at once, so neither can pick up
+        # a connection bound to the other's (possibly reused) thread id
+        both_acquired = threading.Barrier(2)
+        conns = {}
+
+        def acquire(name):
+            conns[name] = self.connections.set_connection_name(name)
+            both_acquired.wait(timeout=5)
+            self.connections.release()
+
+        threads = [
+            threading.Thread(target=acquire, args=(name,))
+            for name in ('first', 'second')
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(FakeConnectionManager.opened, 3)
+        self.assertEqual(self.connections.pool_stats.reused, 2)
+        self.assertIsNot(conns['first'], conns['second'])
+
+        # already warm
+        self.connections.prewarm(10)
+        self.assertEqual(FakeConnectionManager.opened, 3)
+
+    def test_cleanup_closes_idle_connections(self):
+        self.connections.prewarm(1)
+        conn, handle = self._use_connection('first')
+        self.connections.cleanup_all()
+        self.assertTrue(handle.closed)
+        self.assertEqual(conn.state, ConnectionState.CLOSED)
+        self.assertEqual(self.connections.thread_connections, {})
+
+    def test_affinity_prefers_matching_idle_connection(self):
+        self.connections.prewarm(2)
+        older, newer = [
+            conn for _, conn, _ in self.connections._idle.values()
+        ]
+        self.connections.set_affinity(older, 'warehouse_a')
+
+        def use(affinity):
+            conn = self.connections.set_connection_name('node', affinity)
+            self.connections.release()
+            return conn
+
+        # without an affinity, the most recently released one
+        self.assertIs(self._in_thread(lambda: use(None)), newer)
+        self.assertIs(self._in_thread(lambda: use('warehouse_b')), newer)
+        self.assertIs(self._in_thread(lambda: use('warehouse_a')), older)
+        self.assertEqual(FakeConnectionManager.opened, 2)
+
+    def test_affinity_trades_own_idle_connection(self):
+        first = self.connections.set_connection_name('first')
+        first.handle
+        other = self._in_thread(lambda: self._use_connection('other')[0])
+        self.assertIsNot(other, first)
+        self.connections.release()
+        self.connections.set_affinity(other, 'warehouse_a')
+
+        conn = self.connections.set_connection_name('again', 'warehouse_a')
+        self.assertIs(conn, other)
+        # this thread's old connection is still in the pool for anyone
+        self.assertTrue(self.connections.is_idle(first))
+        reused = self._in_thread(lambda: self._use_connection('next')[0])
+        self.assertIs(reused, first)
@@ -3,6 +3,7 @@ from unittest import mock
 
 from dbt.contracts.graph.parsed import ParsedModelNode, NodeConfig, DependsOn
 from dbt.context import parser, runtime
+from dbt.context.base import MacroLayout
 from dbt.node_types import NodeType
 import dbt.exceptions
 from .mock_adapter import adapter_factory
@@ -124,3 +125,41 @@ class TestRuntimeWrapper(unittest.TestCase):
         self.responder.list_relations_without_caching.assert_called_once_with(
             mock.ANY, 'schema'
         )
+
+
+class TestMacroLayout(unittest.TestCase):
+    def _macro(self, package_name, name):
+        return mock.MagicMock(
+            resource_type=NodeType.Macro,
+            package_name=package_name,
+            unique_id='macro.{}.{}'.format(package_name, name),
+        )
+
+    def test_layout(self):
+        macros = {}
+        for package_name, name in [
+            ('root', 'my_macro'),
+            ('dbt', 'my_macro'),
+            ('dbt_postgres', 'postgres__my_macro'),
+            ('other', 'my_macro'),
+        ]:
+            macro = self._macro(package_name, name)
+            macro.name = name
+            macros[macro.unique_id] = macro
+
+        layout = MacroLayout.build(macros, 'root')
+        self.assertEqual(
+            [(key, m.unique_id) for key, m in layout.namespaced],
+            [
+                ('root', 'macro.root.my_macro'),
+                ('dbt', 'macro.dbt.my_macro'),
+                ('dbt', 'macro.dbt_postgres.postgres__my_macro'),
+                ('other', 'macro.other.my_macro'),
+            ]
+        )
+        # the local macro wins over the global one, other packages are only
+        # available in their namespace.
+        self.assertEqual(layout.top_level, {
+            'my_macro': 'macro.root.my_macro',
+            'postgres__my_macro': 'macro.dbt_postgres.postgres__my_macro',
+        })
@@ -109,12 +109,12 @@ class GraphTest(unittest.TestCase):
                 return []
             return [model.path for model in self.mock_models]
 
-        def create_filesystem_searcher(cls, project, relative_dirs, extension):
+        def create_filesystem_searcher(cls, project, relative_dirs, extension, file_index=None):
             result = MagicMock(project=project, relative_dirs=relative_dirs, extension=extension)
             result.__iter__.side_effect = lambda: iter(filesystem_iter(result))
             return result
 
-        def create_hook_patcher(cls, results, project, relative_dirs, extension):
+        def create_hook_patcher(cls, results, project, relative_dirs, extension, file_index=None):
             result = MagicMock(results=results, project=project, relative_dirs=relative_dirs, extension=extension)
             result.__iter__.side_effect = lambda: iter([])
             return result
@@ -0,0 +1,95 @@
+import random
+import unittest
+
+import networkx as nx
+
+import dbt.exceptions
+from dbt.graph.dag import DAG
+
+
+def _random_dag(size, seed):
+    rand = random.Random(seed)
+    graph = nx.DiGraph()
+    nodes = ['model.pkg.n{}'.format(idx) for idx in range(size)]
+    rand.shuffle(nodes)
+    graph.add_nodes_from(nodes)
+    for idx in range(1, size):
+        for parent in rand.sample(range(idx), min(idx, rand.randint(0, 3))):
+            graph.add_edge(nodes[parent], nodes[idx])
+    return graph
+
+
+class DAGTest(unittest.TestCase):
+    def setUp(self):
+        self.nx_graph = _random_dag(200, seed=10)
+        self.graph = DAG.from_networkx(self.nx_graph)
+
+    def test_nodes_and_edges(self):
+        self.assertEqual(self.graph.nodes(), list(self.nx_graph.nodes()))
+        self.assertEqual(self.graph.edges(), list(self.nx_graph.edges()))
+        self.assertEqual(len(self.graph), len(self.nx_graph))
+        for node in self.nx_graph:
+            self.assertIn(node, self.graph)
+            self.assertEqual(self.graph.successors(node),
+                             list(self.nx_graph.successors(node)))
+            self.assertEqual(sorted(self.graph.predecessors(node)),
+                             sorted(self.nx_graph.predecessors(node)))
+        self.assertNotIn('model.pkg.missing', self.graph)
+
+    def test_edges_add_nodes(self):
+        graph = DAG(['a'], [('b', 'c'), ('a', 'b'), ('b', 'c')])
+        self.assertEqual(graph.nodes(), ['a', 'b', 'c'])
+        self.assertEqual(graph.edges(), [('a', 'b'), ('b', 'c')])
+
+    def test_descendants_and_ancestors(self):
+        for node in list(self.nx_graph)[::7]:
+            self.assertEqual(self.graph.descendants([node]),
+                             nx.descendants(self.nx_graph, node))
+            self.assertEqual(self.graph.ancestors([node]),
+                             nx.ancestors(self.nx_graph, node))
+
+        selected = list(self.nx_graph)[::13]
+        expected = set()
+        for node in selected:
+            expected.update(nx.descendants(self.nx_graph, node))
+        self.assertEqual(self.graph.descendants(selected), expected)
+
+    def test_in_degrees(self):
+        in_degrees = self.graph.in_degrees()
+        for node, degree in self.nx_graph.in_degree():
+            self.assertEqual(in_degrees[self.graph.index(node)], degree)
+
+    def test_subgraph(self):
+        selected = set(list(self.nx_graph)[::3])
+        subgraph = self.graph.subgraph(selected | {'model.pkg.missing'})
+        expected = self.nx_graph.subgraph(selected)
+        self.assertEqual(set(subgraph.nodes()), set(expected.nodes()))
+        self.assertEqual(set(subgraph.edges()), set(expected.edges()))
+
+    def test_transitive_subgraph(self):
+        selected = set(list(self.nx_graph)[::3])
+        subgraph = self.graph.transitive_subgraph(selected)
+        closure = nx.transitive_closure(self.nx_graph)
+        expected = closure.subgraph(selected)
+        self.assertEqual(set(subgraph.nodes()), selected)
+        # the edges may differ, but what's reachable from where may not
+        for node in selected:
+            self.assertEqual(subgraph.descendants([node]),
+                             set(expected.successors(node)))
+
+    def test_topological_order(self):
+        order = self.graph.topological_order()
+        self.assertEqual(set(order), set(self.nx_graph))
+        position = {node: idx for idx, node in enumerate(order)}
+        for src, dst in self.nx_graph.edges():
+            self.assertLess(position[src], position[dst])
+
+    def test_find_cycle(self):
+        self.assertIsNone(self.graph.find_cycle())
+        graph = DAG(edges=[('a', 'b'), ('b', 'c'), ('c', 'd'), ('d', 'b')])
+        cycle = graph.find_cycle()
+        self.assertEqual(set(cycle), {'b', 'c', 'd'})
+        for src, dst in zip(cycle, cycle[1:] + cycle[:1]):
+            self.assertIn(dst, graph.successors(src))
+        with self.assertRaises(dbt.exceptions.InternalException):
+            graph.topological_order()
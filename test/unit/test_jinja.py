@@ -1,6 +1,10 @@
 import unittest
+from unittest import mock
 
-from dbt.clients.jinja import get_template
+import jinja2
+
+from dbt.clients.jinja import get_template, get_rendered, is_template_free
+from dbt.clients.jinja import MacroGenerator, template_cache
 from dbt.clients.jinja import extract_toplevel_blocks
 from dbt.exceptions import CompilationException
 
@@ -13,6 +17,24 @@ class TestJinja(unittest.TestCase):
         mod = template.make_module()
         self.assertEqual(mod.my_dict, {'a': 1})
 
+    def test_template_free(self):
+        self.assertTrue(is_template_free('select 1 from "{" where x = \'}\''))
+        self.assertFalse(is_template_free('select {{ 1 }}'))
+        self.assertFalse(is_template_free('{% if x %}{% endif %}'))
+        self.assertFalse(is_template_free('{# comment #}'))
+        self.assertFalse(is_template_free('select 1\r\n'))
+        self.assertFalse(is_template_free(None))
+
+    def test_template_free_render_matches_jinja(self):
+        strings = [
+            '', 'x', 'select 1\n', 'select 1\n\n', 'a } b { c',
+            'select "%}" from "#}"\n',
+        ]
+        for s in strings:
+            self.assertTrue(is_template_free(s))
+            rendered = get_template(s, {}).render({})
+            self.assertEqual(get_rendered(s, {}), rendered)
+
 
 class TestBlockLexer(unittest.TestCase):
     def test_basic(self):
@@ -374,3 +396,76 @@ if_you_do_this_you_are_awful = '''
 hi
 {% endmaterialization %}
 '''
+
+
+class TestMacroGenerator(unittest.TestCase):
+    def _make_macro(self, name, body, args=''):
+        raw_sql = '{{% macro {}({}) %}}{}{{% endmacro %}}'.format(
+            name, args, body
+        )
+        return mock.MagicMock(
+            name=name,
+            package_name='root',
+            original_file_path='macros/{}.sql'.format(name),
+            raw_sql=raw_sql,
+        )
+
+    def setUp(self):
+        template_cache.clear()
+        nodes = [
+            self._make_macro(
+                'materialization_table_default',
+                '{% for i in range(50) %}{{ statement(i) }}{% endfor %}',
+            ),
+            self._make_macro(
+                'statement',
+                '{{ adapter_macro(value) }};',
+                args='value',
+            ),
+            self._make_macro(
+                'adapter_macro',
+                '{{ quote(value) }}',
+                args='value',
+            ),
+            self._make_macro('quote', '"{{ value }}"', args='value'),
+        ]
+        self.nodes = {}
+        self.context = {}
+        for node in nodes:
+            # MagicMock's name kwarg sets the repr, not the attribute
+            node.name = node._mock_name
+            self.nodes[node.name] = node
+            self.context[node.name] = MacroGenerator(node)(self.context)
+
+    def tearDown(self):
+        template_cache.clear()
+
+    def test_nested_materialization(self):
+        """Run a materialization with nested macro calls, and make sure each
+        macro module is only made once for the context.
+        """
+        materialization = self.context['materialization_table_default']
+        with mock.patch.object(
+            jinja2.Template, 'make_module', autospec=True,
+            side_effect=jinja2.Template.make_module,
+        ) as make_module:
+            result = materialization()
+            # 50 * (statement + adapter_macro + quote) + 1 calls without the
+            # cache, one per macro with it.
+            self.assertEqual(make_module.call_count, 4)
+            self.assertEqual(
+                result, ''.join('"{}";'.format(i) for i in range(50))
+            )
+
+            # running it again with the same context hits the cache
+            materialization()
+            self.assertEqual(make_module.call_count, 4)
+
+    def test_new_context_invalidates(self):
+        generator = MacroGenerator(self.nodes['quote'])
+        generator({'x': 1})
+        first = generator.get_macro()
+        self.assertIs(generator.get_macro(), first)
+        # an equal, but different, context
+        generator({'x': 1})
+        self.assertIsNot(generator.get_macro(), first)
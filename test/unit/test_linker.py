@@ -188,3 +188,180 @@ class LinkerTest(unittest.TestCase):
             self.linker.dependency(l, r)
 
         self.assertIsNone(self.linker.find_cycles())
+
+    def test__find_cycles__path(self):
+        actual_deps = [('A', 'B'), ('B', 'C'), ('C', 'D'), ('D', 'B'),
+                       ('E', 'A')]
+
+        for (l, r) in actual_deps:
+            self.linker.dependency(l, r)
+
+        cycle = self.linker.find_cycles().split(' --> ')
+        self.assertEqual(cycle[0], cycle[-1])
+        self.assertEqual(set(cycle), {'B', 'C', 'D'})
+        self.assertEqual(len(cycle), 4)
+
+    def test__find_cycles__self_reference(self):
+        self.linker.dependency('A', 'A')
+        self.assertEqual(self.linker.find_cycles(), 'A --> A')
+
+    def test__find_cycles__large_graph(self):
+        # a wide, deep DAG with lots of shared ancestors: each node depends on
+        # the two nodes before it and one 100 nodes back. A search that
+        # revisits nodes or recurses would fall over here.
+        size = 50000
+        for idx in range(1, size):
+            node = 'model.{}'.format(idx)
+            self.linker.dependency(node, 'model.{}'.format(idx - 1))
+            if idx >= 2:
+                self.linker.dependency(node, 'model.{}'.format(idx - 2))
+            if idx >= 100:
+                self.linker.dependency(node, 'model.{}'.format(idx - 100))
+
+        self.assertIsNone(self.linker.find_cycles())
+
+        self.linker.dependency('model.0', 'model.{}'.format(size - 1))
+        cycle = self.linker.find_cycles().split(' --> ')
+        self.assertEqual(cycle[0], cycle[-1])
+        self.assertIn('model.0', cycle)
+        self.assertIn('model.{}'.format(size - 1), cycle)
+
+    def test__graph_queue_scores(self):
+        # scores count blocking descendants, the same as walking the graph
+        # from every node would.
+        actual_deps = [('B', 'A'), ('C', 'A'), ('D', 'B'), ('D', 'C'),
+                       ('E', 'D'), ('F', 'A'), ('G', 'F')]
+        for (l, r) in actual_deps:
+            self.linker.dependency(l, r)
+        self.linker.add_node('H')
+
+        queue = self.linker.as_graph_queue(_mock_manifest('ABCDEFGH'))
+        scores = {
+            queue.graph.node_id(idx): score
+            for idx, score in queue._scores.items()
+        }
+        self.assertEqual(scores, {
+            'A': -6, 'B': -2, 'C': -2, 'D': -1, 'E': 0, 'F': -1, 'G': 0,
+            'H': 0,
+        })
+
+    def test__graph_queue_limit_to_keeps_order(self):
+        # B is not selected, but C must still wait for A
+        actual_deps = [('B', 'A'), ('C', 'B')]
+        for (l, r) in actual_deps:
+            self.linker.dependency(l, r)
+
+        queue = self.linker.as_graph_queue(_mock_manifest('ABC'), ['A', 'C'])
+        self.assertEqual(len(queue), 2)
+        got = queue.get(block=False)
+        self.assertEqual(got.unique_id, 'A')
+        with self.assertRaises(Empty):
+            queue.get(block=False)
+        queue.mark_done('A')
+        got = queue.get(block=False)
+        self.assertEqual(got.unique_id, 'C')
+        queue.mark_done('C')
+        self.assert_would_join(queue)
+        self.assertTrue(queue.empty())
+
+    def test__graph_queue_concurrency_limits(self):
+        for node in 'ABCDE':
+            self.linker.add_node(node)
+        nodes = {
+            'A': mock.MagicMock(unique_id='A', config={}, tags=['heavy']),
+            'B': mock.MagicMock(unique_id='B', config={}, tags=['heavy']),
+            'C': mock.MagicMock(unique_id='C', config={}, tags=[]),
+            'D': mock.MagicMock(unique_id='D', tags=[],
+                                config={'concurrency_group': 'small_wh'}),
+            'E': mock.MagicMock(unique_id='E', tags=['heavy'],
+                                config={'concurrency_group': ['small_wh']}),
+        }
+        for node in nodes.values():
+            node.schema = 'analytics'
+        manifest = mock.MagicMock()
+        manifest.expect.side_effect = nodes.__getitem__
+        queue = self.linker.as_graph_queue(
+            manifest, concurrency_limits={'tag:heavy': 1, 'small_wh': 1}
+        )
+
+        got = set()
+        while True:
+            try:
+                got.add(queue.get(block=False).unique_id)
+            except Empty:
+                break
+        # one heavy node and one small_wh node at a time. E is in both.
+        self.assertEqual(len(got), 3)
+        self.assertIn('C', got)
+        self.assertEqual(len(got & {'A', 'B', 'E'}), 1)
+        self.assertEqual(len(got & {'D', 'E'}), 1)
+        self.assertFalse(queue.empty())
+
+        done = set()
+        while len(done) < 5:
+            running = got - done
+            self.assertLessEqual(len(running & {'A', 'B', 'E'}), 1)
+            self.assertLessEqual(len(running & {'D', 'E'}), 1)
+            node_id = sorted(running)[0]
+            queue.mark_done(node_id)
+            done.add(node_id)
+            while True:
+                try:
+                    got.add(queue.get(block=False).unique_id)
+                except Empty:
+                    break
+        self.assertEqual(got, set('ABCDE'))
+        self.assert_would_join(queue)
+        self.assertTrue(queue.empty())
+        self.assertGreater(queue.group_waits['tag:heavy'].holds, 0)
+
+    def test__graph_queue_overlapping_concurrency_limits(self):
+        for node in 'ABCD':
+            self.linker.add_node(node)
+        groups = {'A': 'x', 'B': 'y', 'C': ['x', 'y'], 'D': 'x'}
+        nodes = {
+            node_id: mock.MagicMock(unique_id=node_id, tags=[],
+                                    config={'concurrency_group': group})
+            for node_id, group in groups.items()
+        }
+        for node in nodes.values():
+            node.schema = 'analytics'
+        manifest = mock.MagicMock()
+        manifest.expect.side_effect = nodes.__getitem__
+        queue = self.linker.as_graph_queue(
+            manifest, concurrency_limits={'x': 1, 'y': 1}
+        )
+
+        def get_all():
+            got = []
+            while True:
+                try:
+                    got.append(queue.get(block=False).unique_id)
+                except Empty:
+                    return got
+
+        # C and D wait for a slot in x
+        self.assertEqual(get_all(), ['A', 'B'])
+        # C is still blocked by B in y, so D takes the slot A freed
+        queue.mark_done('A')
+        self.assertEqual(get_all(), ['D'])
+        queue.mark_done('B')
+        self.assertEqual(get_all(), [])
+        queue.mark_done('D')
+        self.assertEqual(get_all(), ['C'])
+        queue.mark_done('C')
+        self.assert_would_join(queue)
+        self.assertTrue(queue.empty())
+
+    def test_concurrency_groups(self):
+        node = mock.MagicMock(
+            schema='analytics', tags=['nightly', 'big'],
+            config={'concurrency_group': 'wh_small'},
+        )
+        self.assertEqual(linker.concurrency_groups(node), [
+            'wh_small', 'schema:analytics', 'tag:nightly', 'tag:big',
+        ])
+        node.config = {}
+        node.tags = []
+        self.assertEqual(linker.concurrency_groups(node),
+                         ['schema:analytics'])
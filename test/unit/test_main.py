@@ -106,3 +106,13 @@ class TestInitializeConfig(unittest.TestCase):
         initialize_tracking.assert_called_once_with(self.base_dir)
         do_not_track.assert_not_called()
         use_colors.assert_called_once_with()
+
+
+class TestParseArgs(unittest.TestCase):
+    def test__max_fetch_rows(self):
+        parsed = main.parse_args(['--max-fetch-rows', '0', 'run'])
+        self.assertEqual(parsed.max_fetch_rows, 0)
+        for value in ('-1', 'ten'):
+            with self.assertRaises(SystemExit), \
+                    mock.patch('sys.stderr'):
+                main.parse_args(['--max-fetch-rows', value, 'run'])
@@ -2,18 +2,31 @@ import unittest
 from unittest import mock
 
 import copy
+import gzip
+import json
+import os
+import shutil
+import tempfile
 from datetime import datetime
 
+import dbt.clients.json_stream
 import dbt.flags
+from dbt.clients.json_stream import COMPRESSION_SUFFIXES
 from dbt import tracking
 from dbt.contracts.graph.manifest import Manifest, ManifestMetadata
 from dbt.contracts.graph.parsed import (
-    ParsedModelNode, DependsOn, NodeConfig, ParsedSeedNode
+    ParsedModelNode, DependsOn, NodeConfig, ParsedSeedNode, ParsedMacro
 )
 from dbt.contracts.graph.compiled import CompiledModelNode
+from dbt.linker import Linker
 from dbt.node_types import NodeType
 import freezegun
 
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
 
 REQUIRED_PARSED_NODE_KEYS = frozenset({
     'alias', 'tags', 'config', 'unique_id', 'refs', 'sources',
@@ -358,6 +371,7 @@ class MixedManifestTest(unittest.TestCase):
         dbt.flags.STRICT_MODE = True
 
         self.maxDiff = None
+        self.tmpdir = tempfile.mkdtemp()
 
         self.model_config = NodeConfig.from_dict({
             'enabled': True,
@@ -498,6 +512,9 @@ class MixedManifestTest(unittest.TestCase):
             ),
         }
 
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
     @freezegun.freeze_time('2018-02-14T09:15:13Z')
     def test__no_nodes(self):
         manifest = Manifest(nodes={}, macros={}, docs={},
@@ -601,3 +618,138 @@ class MixedManifestTest(unittest.TestCase):
             else:
                 self.assertEqual(frozenset(node), REQUIRED_PARSED_NODE_KEYS)
         self.assertEqual(compiled_count, 2)
+
+    def _write_and_read(self, manifest, compression=None, linker=None):
+        suffix = COMPRESSION_SUFFIXES.get(compression, '')
+        path = os.path.join(self.tmpdir, 'manifest.json' + suffix)
+        manifest.write(path, linker=linker, compression=compression)
+        if compression == 'gzip':
+            with gzip.open(path, 'rt', encoding='utf-8') as fp:
+                return json.load(fp)
+        elif compression == 'zstd':
+            with open(path, 'rb') as fp:
+                data = zstandard.ZstdDecompressor().stream_reader(fp).read()
+            return json.loads(data.decode('utf-8'))
+        else:
+            with open(path, encoding='utf-8') as fp:
+                return json.load(fp)
+
+    def _nested_manifest(self):
+        return Manifest(nodes=copy.copy(self.nested_nodes), macros={},
+                        docs={}, generated_at=datetime.utcnow(),
+                        disabled=[], files={})
+
+    def _write_unstreamed(self, manifest):
+        # what the whole-document writer produces
+        path = os.path.join(self.tmpdir, 'unstreamed', 'manifest.json')
+        manifest.writable_manifest().write(path)
+        with open(path, encoding='utf-8') as fp:
+            return json.load(fp)
+
+    def test__write_streamed(self):
+        manifest = self._nested_manifest()
+        expected = self._write_unstreamed(manifest)
+        # keys with null values are kept
+        self.assertIsNone(expected['metadata']['user_id'])
+        self.assertIn('build_path', expected['nodes']['model.root.sibling'])
+        self.assertEqual(self._write_and_read(manifest), expected)
+        self.assertEqual(
+            sorted(os.listdir(self.tmpdir)), ['manifest.json', 'unstreamed']
+        )
+
+        with mock.patch.object(dbt.clients.json_stream, '_orjson_dumps', None):
+            self.assertEqual(self._write_and_read(manifest), expected)
+
+        self.assertEqual(self._write_and_read(manifest, 'gzip'), expected)
+        if zstandard is not None:
+            self.assertEqual(self._write_and_read(manifest, 'zstd'), expected)
+
+    def test__old_orjson_ignored(self):
+        old_orjson = mock.Mock(spec=['dumps'])
+        with mock.patch.dict('sys.modules', {'orjson': old_orjson}):
+            self.assertIsNone(dbt.clients.json_stream._load_orjson())
+        with mock.patch.dict('sys.modules', {'orjson': None}):
+            self.assertIsNone(dbt.clients.json_stream._load_orjson())
+
+    def test__write_edges_from_linker(self):
+        manifest = self._nested_manifest()
+        linker = Linker()
+        for node in manifest.nodes.values():
+            linker.add_node(node.unique_id)
+            for dependency in node.depends_on_nodes:
+                linker.dependency(node.unique_id, dependency)
+        with mock.patch(
+            'dbt.contracts.graph.manifest.build_edges'
+        ) as build_edges:
+            serialized = self._write_and_read(manifest, linker=linker)
+        self.assertFalse(build_edges.called)
+        expected = self._write_unstreamed(manifest)
+        self.assertEqual(serialized['child_map'], expected['child_map'])
+        self.assertEqual(serialized['parent_map'], expected['parent_map'])
+
+
+def _materialization_macro(package_name, adapter_type='default'):
+    name = 'materialization_table_{}'.format(adapter_type)
+    return ParsedMacro(
+        name=name,
+        resource_type=NodeType.Macro,
+        unique_id='macro.{}.{}'.format(package_name, name),
+        package_name=package_name,
+        original_file_path='macros/table.sql',
+        root_path='/usr/src/app',
+        path='macros/table.sql',
+        raw_sql='{% materialization table, default %}{% endmaterialization %}',
+    )
+
+
+class MaterializationMacroTest(unittest.TestCase):
+    def setUp(self):
+        macros = [
+            _materialization_macro('dbt'),
+            _materialization_macro('dbt_postgres', 'postgres'),
+            _materialization_macro('root'),
+        ]
+        self.manifest = Manifest.from_macros(
+            macros={m.unique_id: m for m in macros}
+        )
+
+    def _find(self, adapter_type='postgres'):
+        return self.manifest.get_materialization_macro(
+            'root', 'table', adapter_type
+        )
+
+    def test_resolution(self):
+        self.assertEqual(
+            self._find().unique_id,
+            'macro.dbt_postgres.materialization_table_postgres'
+        )
+        self.assertEqual(
+            self._find('snowflake').unique_id,
+            'macro.root.materialization_table_default'
+        )
+        self.assertIsNone(
+            self.manifest.get_materialization_macro('root', 'view', 'postgres')
+        )
+
+    def test_cached(self):
+        expected = self._find()
+        with mock.patch.object(
+            self.manifest, '_find_materialization_macro'
+        ) as find:
+            self.assertIs(self._find(), expected)
+            find.assert_not_called()
+
+    def test_invalidated_when_macros_change(self):
+        self.assertEqual(
+            self._find().unique_id,
+            'macro.dbt_postgres.materialization_table_postgres'
+        )
+        # new macros are picked up even when added directly
+        override = _materialization_macro('root', 'postgres')
+        self.manifest.macros[override.unique_id] = override
+        self.assertIs(self._find(), override)
+
+        # replacing macros with update_macros also invalidates the cache
+        replacement = _materialization_macro('root', 'postgres')
+        self.manifest.update_macros({replacement.unique_id: replacement})
+        self.assertIs(self._find(), replacement)
@@ -1,10 +1,15 @@
+import os
+import shutil
+import tempfile
 import unittest
 from unittest import mock
 
 from .utils import config_from_parts_or_dicts, normalize
 
+import dbt.flags
 from dbt.contracts.graph.manifest import FileHash, FilePath, SourceFile
 from dbt.parser import ParseResult
+from dbt.parser.macros import MacroParser
 from dbt.parser.search import FileBlock
 from dbt.parser import manifest
 
@@ -142,3 +147,106 @@ class TestLoader(unittest.TestCase):
         # the filename wasn't in the cache, so parse_file should get called
         # with a  FileBlock that has the given source file in it.
         self.parser.parse_file.assert_called_once_with(FileBlock(file=source_file))
+
+
+class TestInternalManifestCache(unittest.TestCase):
+    def setUp(self):
+        profile_data = {
+            'target': 'test',
+            'quoting': {},
+            'outputs': {
+                'test': {
+                    'type': 'postgres',
+                    'host': 'localhost',
+                    'schema': 'analytics',
+                    'user': 'test',
+                    'pass': 'test',
+                    'dbname': 'test',
+                    'port': 1,
+                }
+            }
+        }
+        root_project = {
+            'name': 'root',
+            'version': '0.1',
+            'profile': 'test',
+            'project-root': normalize('/usr/src/app'),
+        }
+        self.config = config_from_parts_or_dicts(
+            project=root_project,
+            profile=profile_data,
+        )
+        self.cache_dir = tempfile.mkdtemp()
+        self.patched_cache_dir = mock.patch.object(
+            manifest, 'CACHE_DIR', self.cache_dir
+        )
+        self.patched_cache_dir.start()
+        self.patched_result_builder = mock.patch(
+            'dbt.parser.manifest.make_parse_result',
+            side_effect=lambda *a: ParseResult(
+                MatchingHash(), MatchingHash(), {}
+            ),
+        )
+        self.patched_result_builder.start()
+        self.patched_partial_parse = mock.patch.object(
+            dbt.flags, 'PARTIAL_PARSE', True
+        )
+        self.patched_partial_parse.start()
+
+    def tearDown(self):
+        self.patched_partial_parse.stop()
+        self.patched_result_builder.stop()
+        self.patched_cache_dir.stop()
+        shutil.rmtree(self.cache_dir)
+
+    def _cache_files(self):
+        found = []
+        for dirpath, _, filenames in os.walk(self.cache_dir):
+            found.extend(os.path.join(dirpath, f) for f in filenames)
+        return found
+
+    def test_cache_hit(self):
+        parsed = manifest.load_internal_manifest(self.config)
+        self.assertIn('macro.dbt.statement', parsed.macros)
+        self.assertEqual(len(self._cache_files()), 1)
+
+        with mock.patch.object(MacroParser, 'parse_file') as parse_file:
+            cached = manifest.load_internal_manifest(self.config)
+        parse_file.assert_not_called()
+        self.assertEqual(cached.macros, parsed.macros)
+        self.assertEqual(cached.files, parsed.files)
+
+    def test_cache_key_changes_with_files(self):
+        projects = manifest.load_internal_projects(self.config)
+        path = manifest.internal_manifest_cache_path(projects)
+        self.assertTrue(path.startswith(self.cache_dir))
+        self.assertEqual(
+            path, manifest.internal_manifest_cache_path(projects)
+        )
+
+        stats = list(manifest._project_file_stats(
+            projects['dbt'].project_root
+        ))
+        changed = stats[:-1] + [stats[-1] + '1']
+        with mock.patch.object(manifest, '_project_file_stats',
+                               return_value=iter(changed)):
+            self.assertNotEqual(
+                path, manifest.internal_manifest_cache_path(projects)
+            )
+
+    def test_partial_parse_disabled(self):
+        with mock.patch.object(dbt.flags, 'PARTIAL_PARSE', False):
+            parsed = manifest.load_internal_manifest(self.config)
+        self.assertIn('macro.dbt.statement', parsed.macros)
+        self.assertEqual(self._cache_files(), [])
+
+    def test_corrupt_cache(self):
+        projects = manifest.load_internal_projects(self.config)
+        path = manifest.internal_manifest_cache_path(projects)
+        os.makedirs(os.path.dirname(path))
+        with open(path, 'wb') as fp:
+            fp.write(b'not a pickle')
+        parsed = manifest.load_internal_manifest(self.config)
+        self.assertIn('macro.dbt.statement', parsed.macros)
+        # and it got replaced with a good one
+        self.assertIsNotNone(manifest.read_internal_manifest(path))
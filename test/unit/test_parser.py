@@ -2,6 +2,8 @@ import unittest
 from unittest import mock
 
 import os
+import shutil
+import tempfile
 import yaml
 
 import dbt.flags
@@ -11,7 +13,8 @@ from dbt.parser import (
     ModelParser, MacroParser, DataTestParser, SchemaParser, ParserUtils,
     ParseResult, SnapshotParser, AnalysisParser
 )
-from dbt.parser.search import FileBlock
+from dbt.clients.system import find_matching
+from dbt.parser.search import FileBlock, ScandirFileIndex
 from dbt.parser.schema_test_builders import YamlBlock
 
 from dbt.node_types import NodeType
@@ -271,6 +274,141 @@ class SchemaParserSourceTest(SchemaParserTest):
                          ['source.snowplow.my_source.my_table'])
 
 
+class SchemaParserYamlCacheTest(SchemaParserTest):
+    def test__yaml_from_file_cached_by_checksum(self):
+        first = self.file_block_for(SINGLE_TABLE_SOURCE, 'test_one.yml').file
+        second = self.file_block_for(SINGLE_TABLE_SOURCE, 'test_two.yml').file
+        load_yaml_text = dbt.parser.schemas.load_yaml_text
+        with mock.patch(
+            'dbt.parser.schemas.load_yaml_text', wraps=load_yaml_text
+        ) as loader:
+            data = self.parser._yaml_from_file(first)
+            self.assertEqual(data, yaml.safe_load(SINGLE_TABLE_SOURCE))
+            self.assertIs(self.parser._yaml_from_file(second), data)
+        self.assertEqual(loader.call_count, 1)
+
+    def test__parse_leaves_cached_yaml_alone(self):
+        block = self.file_block_for(SINGLE_TABLE_MODEL_TESTS, 'test_one.yml')
+        self.parser.parse_file(block)
+        self.assertEqual(
+            self.parser.results.load_yaml(block.file, yaml.safe_load),
+            yaml.safe_load(SINGLE_TABLE_MODEL_TESTS)
+        )
+
+    def test__prune_yaml_documents(self):
+        results = self.parser.results
+        block = self.file_block_for(SINGLE_TABLE_SOURCE, 'test_one.yml')
+        results.get_file(block.file)
+        results.load_yaml(block.file, yaml.safe_load)
+        results.yaml_documents['stale'] = {}
+        results.prune_yaml_documents()
+        self.assertEqual(
+            set(results.yaml_documents), {block.file.checksum.checksum}
+        )
+
+    def test__yaml_error(self):
+        block = self.file_block_for('a: [1\nb: 2', 'test_one.yml')
+        with self.assertRaises(CompilationException) as exc:
+            self.parser._yaml_from_file(block.file)
+        self.assertIn('Syntax error near line 2', str(exc.exception))
+        self.assertIn('1  | a: [1', str(exc.exception))
+
+
+STATIC_BUILTIN_TESTS = '''
+version: 2
+models:
+    - name: my_model
+      tests:
+        - unique:
+            column_name: "id || '-' || color"
+      columns:
+        - name: color
+          tests:
+            - not_null
+            - unique:
+                severity: warn
+            - accepted_values:
+                values: ['red', 'blue', 1, true, null]
+                quote: false
+            - relationships:
+                to: ref('other_model')
+                field: id
+            - relationships:
+                to: "ref('other_package', 'other_model')"
+                field: id
+            - relationships:
+                to: ref(var('other_model'))
+                field: id
+            - accepted_values:
+                values: "{{ var('colors') }}"
+            - foreign_package.not_null
+sources:
+    - name: my_source
+      tables:
+        - name: my_table
+          columns:
+            - name: id
+              tests:
+                - unique
+                - relationships:
+                    to: source('my_source', 'other_table')
+                    field: id
+'''
+
+
+class SchemaParserBuiltinTestsTest(SchemaParserTest):
+    def parse_tests(self):
+        self.parser.results = ParseResult.rpc()
+        block = self.file_block_for(STATIC_BUILTIN_TESTS, 'test_one.yml')
+        with mock.patch.object(
+            self.parser, 'render_update', wraps=self.parser.render_update
+        ) as render_update:
+            self.parser.parse_file(block)
+        return self.parser.results.nodes, render_update.call_count
+
+    def test__static_tests_match_rendered(self):
+        nodes, renders = self.parse_tests()
+        self.assertEqual(len(nodes), 11)
+        # the ref(var()) call and the namespaced test still get rendered
+        self.assertEqual(renders, 2)
+        refs = sorted(
+            (n.name, n.refs, n.sources) for n in nodes.values()
+            if n.test_metadata.name == 'relationships'
+        )
+        self.assertEqual([r[1:] for r in refs], [
+            ([['my_model'], ['other_model']], []),
+            ([['my_model'], ['other_package', 'other_model']], []),
+            ([['my_model'], [None]], []),
+            ([], [['my_source', 'my_table'], ['my_source', 'other_table']]),
+        ])
+
+        with mock.patch(
+            'dbt.parser.schema_test_builders.TestBuilder.static_dependencies',
+            return_value=None,
+        ):
+            rendered, renders = self.parse_tests()
+        self.assertEqual(renders, 11)
+        self.assertEqual(nodes, rendered)
+
+    def test__overridden_builtin_test_is_rendered(self):
+        macro = ParsedMacro(
+            name='test_not_null',
+            resource_type=NodeType.Macro,
+            unique_id='macro.root.test_not_null',
+            package_name='root',
+            original_file_path=normalize('macros/macro.sql'),
+            root_path=get_abs_os_path('./dbt_modules/root'),
+            path=normalize('macros/macro.sql'),
+            raw_sql='{% macro test_not_null(model) %}{% endmacro %}',
+        )
+        self.macro_manifest = Manifest.from_macros(
+            macros={macro.unique_id: macro}
+        )
+        self.parser.macro_manifest = self.macro_manifest
+        _, renders = self.parse_tests()
+        self.assertEqual(renders, 3)
+
+
 class SchemaParserModelsTest(SchemaParserTest):
     def test__read_basic_model_tests(self):
         block = self.yaml_block_for(SINGLE_TABLE_MODEL_TESTS, 'test_one.yml')
@@ -410,6 +548,58 @@ class ModelParserTest(BaseParserTest):
             self.parser.parse_file(block)
         self.assert_has_results_length(self.parser.results, files=0)
 
+    def _count_validations(self, count):
+        with mock.patch.object(
+            ParsedModelNode, 'validate', wraps=ParsedModelNode.validate
+        ) as node_validate, mock.patch.object(
+            NodeConfig, 'validate', wraps=NodeConfig.validate
+        ) as config_validate:
+            for idx in range(count):
+                block = self.file_block_for(
+                    'select 1 as id', 'model_{}.sql'.format(idx)
+                )
+                self.parser.parse_file(block)
+        return node_validate.call_count, config_validate.call_count
+
+    def test_trusted_validation(self):
+        # in strict mode, every node is validated in full
+        node_validations, _ = self._count_validations(10)
+        self.assertEqual(node_validations, 10)
+
+        # otherwise, only the user-supplied configs are
+        dbt.flags.STRICT_MODE = False
+        self.parser.results = ParseResult.rpc()
+        node_validations, config_validations = self._count_validations(10)
+        self.assertEqual(node_validations, 0)
+        self.assertGreaterEqual(config_validations, 10)
+        nodes = sorted(self.parser.results.nodes.values(),
+                       key=lambda n: n.unique_id)
+        self.assertEqual(len(nodes), 10)
+        self.assertEqual(nodes[0].config, NodeConfig())
+
+    def test_trusted_validation_bad_config(self):
+        dbt.flags.STRICT_MODE = False
+        self.root_project_config.models = {'enabled': 'yes'}
+        block = self.file_block_for('select 1 as id', 'nested/model_1.sql')
+        with self.assertRaises(CompilationException) as exc:
+            self.parser.parse_file(block)
+        self.assertIn("'yes' is not of type 'boolean'", str(exc.exception))
+
+    def test_trusted_validation_badly_typed_config(self):
+        # hooks that are valid json decode to something that isn't a hook.
+        # That has to be caught by validation, before the config is decoded.
+        dbt.flags.STRICT_MODE = False
+        bad_configs = [{'post-hook': '123'}, {'pre-hook': ['[1]']}]
+        for idx, models in enumerate(bad_configs):
+            self.root_project_config.models = models
+            block = self.file_block_for(
+                'select 1 as id', 'model_{}.sql'.format(idx)
+            )
+            with self.assertRaises(CompilationException) as exc:
+                self.parser.parse_file(block)
+            self.assertIn('is not of type', str(exc.exception))
+            self.assertIn('model_{}.sql'.format(idx), str(exc.exception))
+
 
 class SnapshotParserTest(BaseParserTest):
     def setUp(self):
@@ -715,3 +905,75 @@ class ParserUtilsTest(unittest.TestCase):
         result = ParserUtils.process_refs(self.manifest, 'project')
         self.assertIs(result, self.manifest)
         self.y_node.depends_on.nodes.append.assert_called_once_with('model.project.x')
+
+
+class ScandirFileIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.project_root = tempfile.mkdtemp()
+        paths = [
+            'models/a.sql', 'models/schema.yml', 'models/.hidden.sql',
+            'models/#lock.sql', 'models/~backup.sql', 'models/.sql',
+            'models/sub/b.sql', 'models/tests/t.sql', 'data/seed.csv',
+        ]
+        for path in paths:
+            full_path = os.path.join(self.project_root, path)
+            os.makedirs(os.path.dirname(full_path), exist_ok=True)
+            with open(full_path, 'w') as fp:
+                fp.write('select 1')
+
+    def tearDown(self):
+        shutil.rmtree(self.project_root)
+
+    def _find_matching(self, relative_dirs, extension):
+        return sorted(
+            (r['searched_path'], r['relative_path'])
+            for r in find_matching(
+                self.project_root, relative_dirs, '[!.#~]*' + extension
+            )
+        )
+
+    def _find(self, index, relative_dirs, extension):
+        return sorted(
+            (p.searched_path, p.relative_path)
+            for p in index.find(relative_dirs, extension)
+        )
+
+    def test_matches_find_matching(self):
+        index = ScandirFileIndex(self.project_root)
+        queries = [
+            (['models'], '.sql'),
+            (['models'], '.yml'),
+            (['models/tests'], '.sql'),
+            (['./models/', 'data'], '.csv'),
+            (['missing'], '.sql'),
+        ]
+        for relative_dirs, extension in queries:
+            self.assertEqual(
+                self._find(index, relative_dirs, extension),
+                self._find_matching(relative_dirs, extension),
+            )
+
+    def test_scans_once(self):
+        index = ScandirFileIndex(self.project_root)
+        with mock.patch.object(
+            index, '_scan', side_effect=index._scan
+        ) as scan:
+            self._find(index, ['models'], '.sql')
+            self._find(index, ['models'], '.yml')
+            # a subdirectory of a scanned directory
+            self._find(index, ['models/tests'], '.sql')
+            self.assertEqual(scan.call_count, 1)
+
+            index.invalidate(os.path.join(self.project_root, 'models/a.sql'))
+            self._find(index, ['models'], '.sql')
+            self.assertEqual(scan.call_count, 2)
+
+    def test_invalidate(self):
+        index = ScandirFileIndex(self.project_root)
+        self.assertEqual(len(self._find(index, ['models'], '.sql')), 3)
+        new_path = os.path.join(self.project_root, 'models', 'new.sql')
+        with open(new_path, 'w') as fp:
+            fp.write('select 2')
+        self.assertEqual(len(self._find(index, ['models'], '.sql')), 3)
+        index.invalidate(new_path)
+        self.assertEqual(len(self._find(index, ['models'], '.sql')), 4)
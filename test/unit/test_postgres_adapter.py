@@ -1,10 +1,13 @@
 import unittest
 from unittest import mock
 
+import dbt.deprecations
 import dbt.flags as flags
 from dbt.task.debug import DebugTask
 
+from dbt.adapters.base import Column
 from dbt.adapters.postgres import PostgresAdapter
+from dbt.adapters.postgres import PostgresConnectionManager
 from dbt.exceptions import ValidationException, DbtConfigError
 from dbt.logger import GLOBAL_LOGGER as logger  # noqa
 from dbt.parser.results import ParseResult
@@ -203,6 +206,51 @@ class TestPostgresAdapter(unittest.TestCase):
         )
 
 
+    @mock.patch.object(PostgresAdapter, 'execute_macro')
+    def test_get_columns_in_relation_cached(self, mock_execute_macro):
+        mock_execute_macro.side_effect = lambda name, kwargs: [
+            Column('id', 'integer'),
+            Column(kwargs['relation'].identifier, 'text'),
+        ]
+        table_a = self.adapter.Relation.create(
+            database='dbt', schema='foo', identifier='table_a'
+        )
+        table_b = self.adapter.Relation.create(
+            database='dbt', schema='foo', identifier='table_b'
+        )
+        self.adapter.get_columns_in_relation(table_a)
+        missing = self.adapter.get_missing_columns(table_a, table_b)
+        self.assertEqual([c.name for c in missing], ['table_a'])
+        self.assertEqual(mock_execute_macro.call_count, 2)
+        cache = self.adapter.introspection_cache
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+
+        with mock.patch.object(self.adapter.connections, 'execute') as execute:
+            execute.return_value = ('OK', None)
+            # not DDL, and DDL about another relation
+            self.adapter.execute('select * from dbt.foo.table_a')
+            self.adapter.execute('create table dbt.foo.table_c as (select 1)')
+            self.adapter.get_columns_in_relation(table_a)
+            self.assertEqual(mock_execute_macro.call_count, 2)
+
+            self.adapter.execute('alter table dbt.foo.table_a add column x int')
+            self.adapter.get_columns_in_relation(table_a)
+            self.assertEqual(mock_execute_macro.call_count, 3)
+
+        self.adapter.cache_dropped(table_b)
+        self.adapter.get_columns_in_relation(table_b)
+        self.assertEqual(mock_execute_macro.call_count, 4)
+
+        self.adapter.cache_renamed(table_a, table_b)
+        self.adapter.get_columns_in_relation(table_a)
+        self.adapter.get_columns_in_relation(table_b)
+        self.assertEqual(mock_execute_macro.call_count, 6)
+
+        with mock.patch.object(flags, 'USE_CACHE', False):
+            self.adapter.get_columns_in_relation(table_a)
+        self.assertEqual(mock_execute_macro.call_count, 7)
+
+
 class TestConnectingPostgresAdapter(unittest.TestCase):
     def setUp(self):
         flags.STRICT_MODE = False
@@ -360,3 +408,33 @@ class TestConnectingPostgresAdapter(unittest.TestCase):
         self.adapter.cleanup_connections()
         self._adapter = PostgresAdapter(self.config)
         self.adapter.verify_database('postgres')
+
+
+class TestProcessResultsDeprecation(unittest.TestCase):
+    def setUp(self):
+        flags.reset()
+        dbt.deprecations.reset_deprecations()
+
+    def tearDown(self):
+        dbt.deprecations.reset_deprecations()
+
+    def test_process_results_override(self):
+        class LegacyConnectionManager(PostgresConnectionManager):
+            @classmethod
+            def process_results(cls, column_names, rows):
+                return [{'id': row[0] * 10} for row in rows]
+
+        cursor = mock.MagicMock(description=[('id', 23)])
+        cursor.fetchmany.side_effect = [[(1,), (2,)], []]
+        table = LegacyConnectionManager.get_result_from_cursor(cursor)
+        self.assertEqual([row['id'] for row in table], [10, 20])
+        self.assertIn(
+            'adapter-process-results', dbt.deprecations.active_deprecations
+        )
+
+    def test_no_override(self):
+        cursor = mock.MagicMock(description=[('id', 23)])
+        cursor.fetchmany.side_effect = [[(1,), (2,)], []]
+        table = PostgresConnectionManager.get_result_from_cursor(cursor)
+        self.assertEqual([row['id'] for row in table], [1, 2])
+        self.assertEqual(dbt.deprecations.active_deprecations, set())
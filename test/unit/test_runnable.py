@@ -0,0 +1,148 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import datetime
+from unittest import mock
+
+import agate
+
+import dbt.flags
+from dbt.contracts.graph.compiled import CompiledModelNode
+from dbt.contracts.graph.parsed import DependsOn, NodeConfig
+from dbt.contracts.results import (
+    ExecutionResult, PartialResult, RunModelResult, TimingInfo
+)
+from dbt.node_types import NodeType
+from dbt.task.runnable import GraphRunnableTask, RESULT_STREAM_FILE_NAME
+
+
+def _make_node(name, materialized='view'):
+    return CompiledModelNode(
+        name=name,
+        database='dbt',
+        schema='analytics',
+        alias=name,
+        resource_type=NodeType.Model,
+        unique_id='model.root.{}'.format(name),
+        fqn=['root', name],
+        package_name='root',
+        refs=[],
+        sources=[],
+        depends_on=DependsOn(),
+        config=NodeConfig(materialized=materialized),
+        tags=[],
+        path='{}.sql'.format(name),
+        original_file_path='{}.sql'.format(name),
+        root_path='',
+        raw_sql='select 1 as id',
+        compiled=True,
+        compiled_sql='select 1 as id',
+        extra_ctes_injected=True,
+        extra_ctes=[],
+        injected_sql='select 1 as id',
+    )
+
+
+class ResultStreamTest(unittest.TestCase):
+    def setUp(self):
+        self.target_path = tempfile.mkdtemp()
+        self.old_write_json = dbt.flags.WRITE_JSON
+        dbt.flags.WRITE_JSON = True
+        self.patcher = mock.patch('dbt.task.base.register_adapter')
+        self.patcher.start()
+        config = mock.MagicMock(target_path=self.target_path)
+        self.task = GraphRunnableTask(mock.MagicMock(), config)
+        self.task.manifest = mock.MagicMock()
+        self.task.linker = mock.MagicMock()
+        self.task.linker.get_dependent_nodes.return_value = []
+
+    def tearDown(self):
+        self.patcher.stop()
+        dbt.flags.WRITE_JSON = self.old_write_json
+        shutil.rmtree(self.target_path)
+
+    def _results(self):
+        now = datetime.utcnow()
+        return [
+            RunModelResult(
+                node=_make_node('first'),
+                status='CREATE VIEW',
+                execution_time=1.5,
+                thread_id='Thread-1',
+                timing=[
+                    TimingInfo(name='compile', started_at=now,
+                               completed_at=now),
+                ],
+                agate_table=agate.Table([[1]], ['id']),
+            ),
+            PartialResult(node=_make_node('second'), error='boom'),
+            RunModelResult(
+                node=_make_node('eph', materialized='ephemeral'),
+                status='OK',
+            ),
+        ]
+
+    def test_stream_written_as_nodes_finish(self):
+        first, second, ephemeral = self._results()
+        self.task.open_result_stream()
+        stream_path = os.path.join(self.target_path, RESULT_STREAM_FILE_NAME)
+
+        self.task._handle_result(first)
+        with open(stream_path) as fp:
+            lines = fp.read().splitlines()
+        self.assertEqual(len(lines), 1)
+        self.assertEqual(json.loads(lines[0])['node']['unique_id'],
+                         'model.root.first')
+        # results don't hold on to their tables once they're recorded
+        self.assertIsNone(first.agate_table)
+
+        self.task._handle_result(ephemeral)
+        self.task._handle_result(second)
+        self.task.close_result_stream()
+        with open(stream_path) as fp:
+            lines = fp.read().splitlines()
+        self.assertEqual(
+            [json.loads(line)['node']['unique_id'] for line in lines],
+            ['model.root.first', 'model.root.second'],
+        )
+        self.assertEqual(self.task.node_results, [first, second])
+
+    def test_keep_result_tables(self):
+        first = self._results()[0]
+        table = first.agate_table
+        self.task.keep_result_tables = lambda: True
+        self.task._handle_result(first)
+        self.assertIs(first.agate_table, table)
+
+    def test_summary_from_stream(self):
+        results = self._results()
+        self.task.open_result_stream()
+        for result in results:
+            self.task._handle_result(result)
+        self.task.close_result_stream()
+        execution_result = ExecutionResult(
+            results=self.task.node_results,
+            generated_at=datetime.utcnow(),
+            elapsed_time=3.2,
+        )
+        self.task.write_result(execution_result)
+
+        expected_path = os.path.join(self.target_path, 'expected.json')
+        execution_result.write(expected_path)
+        with open(expected_path) as fp:
+            expected = json.load(fp)
+        with open(self.task.result_path()) as fp:
+            written = json.load(fp)
+        self.assertEqual(written, expected)
+        self.assertEqual(list(written), list(expected))
+
+    def test_no_stream_without_write_json(self):
+        dbt.flags.WRITE_JSON = False
+        self.task.open_result_stream()
+        self.task._handle_result(self._results()[0])
+        self.task.close_result_stream()
+        self.assertFalse(os.path.exists(
+            os.path.join(self.target_path, RESULT_STREAM_FILE_NAME)
+        ))
@@ -1,10 +1,16 @@
+import datetime
 import unittest
 from contextlib import contextmanager
 from unittest import mock
 
+import agate
+import pytz
+
+import dbt.exceptions
 import dbt.flags as flags
 
 import dbt.parser.manifest
+import dbt.adapters.snowflake.connections
 from dbt.adapters.snowflake import SnowflakeAdapter
 from dbt.logger import GLOBAL_LOGGER as logger  # noqa
 from dbt.parser.results import ParseResult
@@ -12,6 +18,11 @@ from snowflake import connector as snowflake_connector
 
 from .utils import config_from_parts_or_dicts, inject_adapter, mock_connection
 
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
 
 class TestSnowflakeAdapter(unittest.TestCase):
     def setUp(self):
@@ -146,23 +157,23 @@ class TestSnowflakeAdapter(unittest.TestCase):
     @contextmanager
     def current_warehouse(self, response):
         # there is probably some elegant way built into mock.patch to do this
-        fetchall_return = self.cursor.fetchall.return_value
+        fetchmany_side_effect = self.cursor.fetchmany.side_effect
         execute_side_effect = self.mock_execute.side_effect
 
         def execute_effect(sql, *args, **kwargs):
             if sql == '/* dbt */\nselect current_warehouse() as warehouse':
                 self.cursor.description = [['name']]
-                self.cursor.fetchall.return_value = [[response]]
+                self.cursor.fetchmany.side_effect = [[[response]], []]
             else:
                 self.cursor.description = None
-                self.cursor.fetchall.return_value = fetchall_return
+                self.cursor.fetchmany.side_effect = fetchmany_side_effect
             return self.mock_execute.return_value
 
         self.mock_execute.side_effect = execute_effect
         try:
             yield
         finally:
-            self.cursor.fetchall.return_value = fetchall_return
+            self.cursor.fetchmany.side_effect = fetchmany_side_effect
             self.mock_execute.side_effect = execute_side_effect
 
     def _strip_transactions(self):
@@ -183,15 +194,69 @@ class TestSnowflakeAdapter(unittest.TestCase):
         with self.current_warehouse('warehouse'):
             config = {'snowflake_warehouse': 'other_warehouse'}
             result = self.adapter.pre_model_hook(config)
-            self.assertIsNotNone(result)
+            # the session started on the profile's warehouse
+            self.assertEqual(result, 'test_warehouse')
+            # the switch waits for the next query
+            self.mock_execute.assert_not_called()
+            self.adapter.execute('select 1')
             calls = [
-                mock.call('/* dbt */\nselect current_warehouse() as warehouse', None),
-                mock.call('/* dbt */\nuse warehouse other_warehouse', None)
+                mock.call('/* dbt */\nuse warehouse other_warehouse', None),
+                mock.call('/* dbt */\nselect 1', None),
             ]
-            self.mock_execute.assert_has_calls(calls)
+            self.assertEqual(self._strip_transactions(), calls)
+            self.adapter.post_model_hook(config, result)
+            self.adapter.execute('select 2')
+            calls.extend([
+                mock.call('/* dbt */\nuse warehouse test_warehouse', None),
+                mock.call('/* dbt */\nselect 2', None),
+            ])
+            self.assertEqual(self._strip_transactions(), calls)
+
+    def test_pre_post_hooks_same_warehouse_twice(self):
+        config = {'snowflake_warehouse': 'other_warehouse'}
+        for sql in ('select 1', 'select 2'):
+            result = self.adapter.pre_model_hook(config)
+            self.adapter.execute(sql)
             self.adapter.post_model_hook(config, result)
-            calls.append(mock.call('/* dbt */\nuse warehouse warehouse', None))
-            self.mock_execute.assert_has_calls(calls)
+        # switching back and then over again is skipped
+        self.assertEqual(self._strip_transactions(), [
+            mock.call('/* dbt */\nuse warehouse other_warehouse', None),
+            mock.call('/* dbt */\nselect 1', None),
+            mock.call('/* dbt */\nselect 2', None),
+        ])
+
+    def test_pre_model_hook_unknown_warehouse(self):
+        self.adapter.cleanup_connections()
+        self.config.credentials.warehouse = None
+        self.adapter.acquire_connection()
+        with self.current_warehouse('warehouse'):
+            config = {'snowflake_warehouse': 'other_warehouse'}
+            for _ in range(2):
+                result = self.adapter.pre_model_hook(config)
+                self.assertEqual(result, 'warehouse')
+                self.adapter.post_model_hook(config, result)
+        # the warehouse is only looked up once per session
+        self.assertEqual(self._strip_transactions(), [
+            mock.call('/* dbt */\nselect current_warehouse() as warehouse', None),
+        ])
+
+    def test_cleanup_clears_warehouses(self):
+        self.adapter.execute('use warehouse other_warehouse')
+        connections = self.adapter.connections
+        self.assertEqual(len(connections._warehouses), 1)
+        self.adapter.cleanup_connections()
+        self.assertEqual(connections._warehouses, {})
+
+    def test_use_warehouse_in_sql_tracked(self):
+        self.adapter.execute('use warehouse other_warehouse')
+        config = {'snowflake_warehouse': 'OTHER_WAREHOUSE'}
+        result = self.adapter.pre_model_hook(config)
+        self.assertEqual(result, 'other_warehouse')
+        self.adapter.execute('select 1')
+        self.assertEqual(self._strip_transactions(), [
+            mock.call('/* dbt */\nuse warehouse other_warehouse', None),
+            mock.call('/* dbt */\nselect 1', None),
+        ])
 
     def test_pre_post_hooks_no_warehouse(self):
         with self.current_warehouse('warehouse'):
@@ -202,6 +267,92 @@ class TestSnowflakeAdapter(unittest.TestCase):
             self.adapter.post_model_hook(config, result)
             self.mock_execute.assert_not_called()
 
+    BATCH_SQL = (
+        'create table a as (\n  select 1 as id\n);\n'
+        'alter table a rename to b;\n'
+        'drop table c'
+    )
+
+    @mock.patch.object(
+        dbt.adapters.snowflake.connections, 'MULTI_STATEMENT_SUPPORTED', True
+    )
+    def test_batch_statements(self):
+        self.config.credentials.batch_statements = True
+        self.adapter.execute(self.BATCH_SQL)
+        self.mock_execute.assert_called_once_with(
+            '/* dbt */\ncreate table a as (\n  select 1 as id\n);\n'
+            'alter table a rename to b;\n'
+            'drop table c;',
+            num_statements=3,
+        )
+        # one result per statement
+        self.assertEqual(self.cursor.nextset.call_count, 2)
+
+    @mock.patch.object(
+        dbt.adapters.snowflake.connections, 'MULTI_STATEMENT_SUPPORTED', True
+    )
+    def test_batch_statements_off_by_default(self):
+        self.adapter.execute(self.BATCH_SQL)
+        self.assertEqual(self.mock_execute.call_count, 3)
+
+    @mock.patch.object(
+        dbt.adapters.snowflake.connections, 'MULTI_STATEMENT_SUPPORTED', True
+    )
+    def test_batch_statements_error_names_statement(self):
+        self.config.credentials.batch_statements = True
+        self.mock_execute.side_effect = snowflake_connector.errors.ProgrammingError(
+            msg="SQL compilation error:\nsyntax error line 5 at position 6 "
+                "unexpected 'rename'.",
+            errno=1003,
+            sqlstate='42000',
+        )
+        with self.assertRaises(dbt.exceptions.DatabaseException) as exc:
+            self.adapter.execute(self.BATCH_SQL)
+        self.assertIn('in statement 2 of 3:', str(exc.exception))
+        self.assertIn('alter table a rename to b;', str(exc.exception))
+
+    def test_execute_fetch_types(self):
+        tz = datetime.timezone(datetime.timedelta(hours=-7))
+        when = datetime.datetime(2020, 1, 1, 12, tzinfo=tz)
+        # name, type_code, ...: FIXED, TEXT, TIMESTAMP_TZ, TIME
+        self.cursor.description = [
+            ('id', 0), ('code', 2), ('updated_at', 7), ('at', 12)
+        ]
+        self.cursor.fetchmany.side_effect = [
+            [(1, '007', when, datetime.time(1, 2))], [],
+        ]
+        _, table = self.adapter.execute('select 1', fetch=True)
+        self.assertEqual(table.column_names, ('id', 'code', 'updated_at', 'at'))
+        self.assertIsInstance(table.column_types[1], agate.data_types.Text)
+        row = table.rows[0]
+        self.assertEqual(row['code'], '007')
+        self.assertEqual(row['updated_at'], when)
+        # replaced with a pickleable time zone
+        self.assertIsInstance(row['updated_at'].tzinfo, pytz._FixedOffset)
+
+    @unittest.skipIf(pyarrow is None, 'requires pyarrow')
+    def test_execute_columnar(self):
+        self.cursor.description = [('id', 0), ('name', 2)]
+        arrow = pyarrow.table({'id': [1, 2], 'name': ['a', 'b']})
+        self.cursor.fetch_arrow_all = mock.MagicMock(return_value=arrow)
+        _, table = self.adapter.execute('select 1', fetch=True, columnar=True)
+        self.assertIs(table.arrow, arrow)
+        self.assertEqual(table.rows[1]['name'], 'b')
+        self.cursor.fetchmany.assert_not_called()
+
+    def test_execute_max_fetch_rows(self):
+        self.cursor.description = [('id', 0)]
+        self.cursor.fetchmany.side_effect = [[(1,), (2,), (3,)], [(4,)], []]
+        flags.MAX_FETCH_ROWS = 3
+        try:
+            with self.assertRaises(dbt.exceptions.DatabaseException) as exc:
+                self.adapter.execute('select 1', fetch=True)
+        finally:
+            flags.MAX_FETCH_ROWS = None
+        self.assertIn('more than 3 rows', str(exc.exception))
+        # never asks for more than one row past the limit
+        self.cursor.fetchmany.assert_has_calls([mock.call(4), mock.call(1)])
+
     def test_cancel_open_connections_empty(self):
         self.assertEqual(len(list(self.adapter.cancel_open_connections())), 0)
 
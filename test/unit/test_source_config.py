@@ -137,3 +137,72 @@ class SourceConfigTest(TestCase):
             cfg.get_project_config(self.root_project_config)
 
         self.assertIn('must be a dict', str(exc.exception))
+
+    def test__project_config_trie(self):
+        self.root_project_config.models = {
+            'pre-hook': 'top hook',
+            'materialized': 'table',
+            'root': {
+                'tags': 'root tag',
+                'staging': {
+                    'materialized': 'view',
+                    'tags': ['staging tag', 'root tag'],
+                },
+            },
+        }
+        configs = [
+            SourceConfig(self.root_project_config, self.root_project_config,
+                         fqn, NodeType.Model)
+            for fqn in (
+                ['root', 'x'],
+                ['root', 'staging', 'y'],
+                ['root', 'staging', 'z'],
+                ['other', 'x'],
+            )
+        ]
+        results = [c.get_project_config(self.root_project_config)
+                   for c in configs]
+        self.assertEqual(results[0]['materialized'], 'table')
+        self.assertEqual(results[0]['tags'], ['root tag'])
+        self.assertEqual(results[1]['materialized'], 'view')
+        self.assertEqual(results[1]['tags'], ['root tag', 'staging tag'])
+        self.assertEqual(results[1]['pre-hook'], ['top hook'])
+        self.assertEqual(results[1], results[2])
+        self.assertEqual(results[3]['tags'], [])
+
+        # every config shares the same precompiled trie
+        trie = configs[0].get_config_trie(self.root_project_config)
+        for cfg in configs[1:]:
+            self.assertIs(cfg.get_config_trie(self.root_project_config), trie)
+        self.assertEqual(set(trie.children), {'root', 'other'})
+        self.assertIsNone(trie.children['other'])
+
+        # callers can't modify the precompiled configs
+        results[1]['tags'].append('modified')
+        self.assertEqual(
+            configs[2].get_project_config(self.root_project_config)['tags'],
+            ['root tag', 'staging tag']
+        )
+
+        # replacing the project config rebuilds the trie
+        self.root_project_config.models = {'materialized': 'ephemeral'}
+        self.assertIsNot(
+            configs[0].get_config_trie(self.root_project_config), trie
+        )
+        self.assertEqual(configs[0].config['materialized'], 'ephemeral')
+
+    def test__source_config_cached(self):
+        cfg = SourceConfig(self.root_project_config, self.root_project_config,
+                           ['root', 'x'], NodeType.Model)
+        with mock.patch.object(
+            cfg, 'get_project_config', wraps=cfg.get_project_config
+        ) as get_project_config:
+            first = cfg.config
+            first['tags'].append('modified')
+            self.assertEqual(cfg.config['tags'], [])
+            self.assertEqual(get_project_config.call_count, 1)
+
+            cfg.update_in_model_config({'tags': 'in model'})
+            self.assertEqual(cfg.config['tags'], ['in model'])
+            self.assertEqual(cfg.config['tags'], ['in model'])
+            self.assertEqual(get_project_config.call_count, 2)
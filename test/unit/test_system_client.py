@@ -133,3 +133,36 @@ class TestRunCmd(unittest.TestCase):
         out, err = dbt.clients.system.run_cmd(self.run_dir, self.exists_cmd)
         self.assertEqual(out.strip(), b'hello')
         self.assertEqual(err.strip(), b'')
+
+
+class TestScanFiles(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = mkdtemp()
+        for path in ['a.sql', 'sub/b.sql', 'sub/deeper/c.yml', '.hidden']:
+            full_path = os.path.join(self.tmp_dir, path)
+            os.makedirs(os.path.dirname(full_path), exist_ok=True)
+            with open(full_path, 'w') as fp:
+                fp.write(path)
+        os.symlink(
+            os.path.join(self.tmp_dir, 'sub'),
+            os.path.join(self.tmp_dir, 'linked')
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_scan_files(self):
+        results = dict(dbt.clients.system.scan_files(self.tmp_dir))
+        expected = {
+            os.path.join(self.tmp_dir, p)
+            for p in ['a.sql', 'sub/b.sql', 'sub/deeper/c.yml', '.hidden']
+        }
+        # symlinked directories are not followed, like os.walk
+        self.assertEqual(set(results), expected)
+        self.assertEqual(
+            results[os.path.join(self.tmp_dir, 'a.sql')].st_size, 5
+        )
+
+    def test_scan_files_missing(self):
+        missing = os.path.join(self.tmp_dir, 'missing')
+        self.assertEqual(list(dbt.clients.system.scan_files(missing)), [])
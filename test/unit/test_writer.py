@@ -0,0 +1,92 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+import dbt.flags
+import dbt.writer
+
+
+class TestWriteNode(unittest.TestCase):
+    def setUp(self):
+        self.target_path = tempfile.mkdtemp()
+        self.node = mock.MagicMock(package_name='root', path='a/model.sql')
+        self.expected_path = os.path.join(
+            self.target_path, 'compiled', 'root', 'a', 'model.sql'
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.target_path)
+        dbt.flags.reset()
+
+    def _read(self, path):
+        with open(path) as fp:
+            return fp.read()
+
+    def test_write_node_sync(self):
+        path = dbt.writer.write_node(
+            self.node, self.target_path, 'compiled', 'select 1'
+        )
+        self.assertEqual(path, self.expected_path)
+        self.assertEqual(self._read(path), 'select 1')
+
+    def test_write_node_background(self):
+        with dbt.writer.background_writer() as writer:
+            for idx in range(10):
+                path = dbt.writer.write_node(
+                    self.node, self.target_path, 'compiled',
+                    'select {}'.format(idx)
+                )
+            self.assertEqual(path, self.expected_path)
+            writer.flush()
+            self.assertEqual(self._read(path), 'select 9')
+            # unchanged contents are not rewritten
+            before = writer.written
+            dbt.writer.write_node(
+                self.node, self.target_path, 'compiled', 'select 9'
+            )
+            writer.flush()
+            self.assertEqual(writer.written, before)
+            self.assertEqual(writer.skipped, 1)
+
+        self.assertIsNone(dbt.writer._active_writer)
+
+    def test_write_node_background_error(self):
+        # make the target directory a file so the write fails
+        blocker = os.path.join(self.target_path, 'compiled')
+        with open(blocker, 'w') as fp:
+            fp.write('')
+
+        with self.assertRaises(dbt.exceptions.RuntimeException):
+            with dbt.writer.background_writer():
+                dbt.writer.write_node(
+                    self.node, self.target_path, 'compiled', 'select 1'
+                )
+        self.assertIsNone(dbt.writer._active_writer)
+
+    def test_write_error_does_not_mask_block_error(self):
+        blocker = os.path.join(self.target_path, 'compiled')
+        with open(blocker, 'w') as fp:
+            fp.write('')
+
+        with self.assertRaises(ValueError):
+            with dbt.writer.background_writer():
+                dbt.writer.write_node(
+                    self.node, self.target_path, 'compiled', 'select 1'
+                )
+                raise ValueError('the real error')
+        self.assertIsNone(dbt.writer._active_writer)
+
+    def test_skip_artifacts(self):
+        dbt.flags.SKIP_ARTIFACTS = frozenset(['compiled'])
+        path = dbt.writer.write_node(
+            self.node, self.target_path, 'compiled', 'select 1'
+        )
+        self.assertIsNone(path)
+        self.assertFalse(os.path.exists(self.expected_path))
+
+        run_path = dbt.writer.write_node(
+            self.node, self.target_path, 'run', 'select 1'
+        )
+        self.assertEqual(self._read(run_path), 'select 1')